@@ -0,0 +1,212 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cint, flt, getdate, now
+
+from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
+	get_accounting_dimensions,
+)
+
+KEY_FIELDS = (
+	"company",
+	"account",
+	"cost_center",
+	"finance_book",
+	"posting_date",
+	"fiscal_year",
+	"is_opening",
+	"is_period_closing_voucher_entry",
+)
+AMOUNT_FIELDS = ("debit", "credit", "debit_in_account_currency", "credit_in_account_currency")
+
+
+class DailyAccountBalance(Document):
+	pass
+
+
+def get_key(entry):
+	return (
+		entry.get("company"),
+		entry.get("account"),
+		entry.get("cost_center") or "",
+		entry.get("finance_book") or "",
+		getdate(entry.get("posting_date")),
+		entry.get("fiscal_year") or "",
+		entry.get("is_opening") or "No",
+		cint(
+			entry.get("is_period_closing_voucher_entry")
+			or entry.get("voucher_type") == "Period Closing Voucher"
+		),
+	)
+
+
+def update_account_balances(gl_entries, cancel=False):
+	"""Add the amounts of posted GL Entries to their daily balances (subtract them on `cancel`)"""
+	balances = {}
+	for entry in gl_entries:
+		balance = balances.setdefault(
+			get_key(entry), frappe._dict(account_currency=entry.get("account_currency"))
+		)
+		for field in AMOUNT_FIELDS:
+			balance[field] = flt(balance.get(field)) + (-1 if cancel else 1) * flt(entry.get(field))
+
+	if not balances:
+		return
+
+	existing = get_existing_balances(balances)
+	if len(existing) < len(balances):
+		# lock the accounts and read again, so that concurrent postings on a new date
+		# do not insert the same balance twice
+		frappe.get_all(
+			"Account",
+			filters={"name": ("in", list({key[1] for key in balances}))},
+			order_by="name",
+			for_update=True,
+		)
+		existing = get_existing_balances(balances, for_update=True)
+
+	timestamp = now()
+	new_rows = []
+	for key, balance in balances.items():
+		if key in existing:
+			frappe.db.sql(
+				"""update `tabDaily Account Balance`
+				set debit = debit + %(debit)s, credit = credit + %(credit)s,
+					debit_in_account_currency = debit_in_account_currency + %(debit_in_account_currency)s,
+					credit_in_account_currency = credit_in_account_currency + %(credit_in_account_currency)s,
+					modified = %(modified)s
+				where name = %(name)s""",
+				dict(balance, name=existing[key], modified=timestamp),
+			)
+		else:
+			new_rows.append(
+				key
+				+ tuple(balance[field] for field in AMOUNT_FIELDS)
+				+ (balance.account_currency, timestamp, timestamp, frappe.session.user, frappe.session.user)
+			)
+
+	if new_rows:
+		frappe.db.bulk_insert(
+			"Daily Account Balance",
+			KEY_FIELDS
+			+ AMOUNT_FIELDS
+			+ ("account_currency", "creation", "modified", "owner", "modified_by"),
+			new_rows,
+		)
+
+
+def get_existing_balances(balances, for_update=False):
+	existing = {}
+	for row in frappe.get_all(
+		"Daily Account Balance",
+		filters={
+			"account": ("in", list({key[1] for key in balances})),
+			"posting_date": ("in", list({key[4] for key in balances})),
+		},
+		fields=["name", *KEY_FIELDS],
+		for_update=for_update,
+	):
+		existing.setdefault(get_key(row), row.name)
+
+	return existing
+
+
+def remove_account_balances(voucher_type, voucher_no):
+	"""Subtract the GL Entries of a voucher from the daily balances before they are deleted"""
+	gl_entries = frappe.get_all(
+		"GL Entry",
+		filters={"voucher_type": voucher_type, "voucher_no": voucher_no, "is_cancelled": 0},
+		fields=["voucher_type", "account_currency", *KEY_FIELDS[:-1], *AMOUNT_FIELDS],
+	)
+	update_account_balances(gl_entries, cancel=True)
+
+
+def can_use_account_balances(filters=None):
+	"""Daily balances are not kept per project or accounting dimension"""
+	filters = filters or {}
+	if filters.get("project"):
+		return False
+
+	return not any(
+		filters.get(dimension.fieldname) for dimension in get_accounting_dimensions(as_list=False)
+	)
+
+
+def get_balance_query(company=None):
+	"""Daily balances computed from GL Entry, in the column order of the Daily Account Balance"""
+	return """
+		select
+			company, account, ifnull(cost_center, '') as cost_center,
+			ifnull(finance_book, '') as finance_book, posting_date, ifnull(fiscal_year, '') as fiscal_year,
+			ifnull(is_opening, 'No') as is_opening,
+			case when voucher_type = 'Period Closing Voucher' then 1 else 0 end
+				as is_period_closing_voucher_entry,
+			sum(debit) as debit, sum(credit) as credit,
+			sum(debit_in_account_currency) as debit_in_account_currency,
+			sum(credit_in_account_currency) as credit_in_account_currency,
+			max(account_currency) as account_currency
+		from `tabGL Entry`
+		where is_cancelled = 0 {0}
+		group by company, account, ifnull(cost_center, ''), ifnull(finance_book, ''), posting_date,
+			ifnull(fiscal_year, ''), ifnull(is_opening, 'No'),
+			case when voucher_type = 'Period Closing Voucher' then 1 else 0 end""".format(
+		"and company = %(company)s" if company else ""
+	)
+
+
+def rebuild_account_balances(company=None):
+	"""
+	Rebuild the daily balances from GL Entry.
+
+	Usage: bench --site <site> execute erpnext.accounts.doctype.daily_account_balance.daily_account_balance.rebuild_account_balances
+	"""
+	frappe.db.delete("Daily Account Balance", {"company": company} if company else None)
+
+	fields = ", ".join(KEY_FIELDS + AMOUNT_FIELDS + ("account_currency",))
+	frappe.db.sql(
+		"""insert into `tabDaily Account Balance`
+			({fields}, creation, modified, owner, modified_by)
+		select {fields}, %(timestamp)s, %(timestamp)s, %(user)s, %(user)s
+		from ({query}) gl_balance""".format(fields=fields, query=get_balance_query(company)),
+		{"company": company, "timestamp": now(), "user": frappe.session.user},
+	)
+
+
+def check_account_balances(company=None):
+	"""
+	List the daily balances which differ from the sum of their GL Entries.
+
+	Usage: bench --site <site> execute erpnext.accounts.doctype.daily_account_balance.daily_account_balance.check_account_balances
+	"""
+	expected = {
+		get_key(row): row
+		for row in frappe.db.sql(get_balance_query(company), {"company": company}, as_dict=True)
+	}
+
+	actual = {}
+	for row in frappe.get_all(
+		"Daily Account Balance",
+		filters={"company": company} if company else None,
+		fields=[*KEY_FIELDS, *AMOUNT_FIELDS],
+	):
+		balance = actual.setdefault(get_key(row), frappe._dict())
+		for field in AMOUNT_FIELDS:
+			balance[field] = flt(balance.get(field)) + flt(row.get(field))
+
+	mismatches = []
+	for key in set(expected) | set(actual):
+		difference = {
+			field: flt(flt(expected.get(key, {}).get(field)) - flt(actual.get(key, {}).get(field)), 6)
+			for field in AMOUNT_FIELDS
+		}
+		if any(difference.values()):
+			mismatches.append(frappe._dict(zip(KEY_FIELDS, key), **difference))
+
+	return mismatches
+
+
+def on_doctype_update():
+	frappe.db.add_index("Daily Account Balance", ["account", "posting_date"])
+	frappe.db.add_index("Daily Account Balance", ["company", "posting_date"])
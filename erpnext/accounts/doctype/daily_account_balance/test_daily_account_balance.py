@@ -0,0 +1,64 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.accounts.doctype.daily_account_balance.daily_account_balance import (
+	check_account_balances,
+	rebuild_account_balances,
+)
+from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
+from erpnext.accounts.general_ledger import make_reverse_gl_entries
+from erpnext.accounts.utils import get_balance_on
+
+
+class TestDailyAccountBalance(FrappeTestCase):
+	def test_balances_follow_gl_entries(self):
+		account = "_Test Bank - _TC"
+
+		def get_gl_balance():
+			return frappe.db.sql(
+				"""select sum(debit) - sum(credit) from `tabGL Entry`
+				where account = %s and is_cancelled = 0""",
+				account,
+			)[0][0]
+
+		def get_mismatches():
+			return [row for row in check_account_balances("_Test Company") if row.account == account]
+
+		rebuild_account_balances("_Test Company")
+		self.assertFalse(get_mismatches())
+
+		jv1 = make_journal_entry("_Test Cash - _TC", account, 100, submit=True)
+		jv2 = make_journal_entry("_Test Cash - _TC", account, 250, submit=True)
+		self.assertFalse(get_mismatches())
+		self.assertEqual(get_balance_on(account, company="_Test Company"), get_gl_balance())
+
+		jv1.cancel()
+		self.assertFalse(get_mismatches())
+		self.assertEqual(get_balance_on(account, company="_Test Company"), get_gl_balance())
+
+		# drift is reported and fixed by a rebuild
+		frappe.db.sql(
+			"delete from `tabGL Entry` where voucher_type = 'Journal Entry' and voucher_no = %s",
+			jv2.name,
+		)
+		self.assertTrue(get_mismatches())
+
+		rebuild_account_balances("_Test Company")
+		self.assertFalse(get_mismatches())
+
+	def test_cancel_subtracts_posted_entries(self):
+		rebuild_account_balances("_Test Company")
+		jv = make_journal_entry("_Test Cash - _TC", "_Test Bank - _TC", 100, submit=True)
+
+		# the gl_map passed on cancellation need not match what was posted
+		gl_map = frappe.get_all(
+			"GL Entry",
+			filters={"voucher_type": "Journal Entry", "voucher_no": jv.name, "is_cancelled": 0},
+			fields=["*"],
+			limit=1,
+		)
+		make_reverse_gl_entries(gl_map)
+		self.assertFalse(check_account_balances("_Test Company"))
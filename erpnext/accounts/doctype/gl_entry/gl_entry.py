@@ -7,7 +7,7 @@ from frappe import _
 from frappe.model.document import Document
 from frappe.model.meta import get_field_precision
 from frappe.model.naming import set_name_from_naming_options
-from frappe.utils import flt, fmt_money
+from frappe.utils import flt, fmt_money, get_datetime, getdate, now
 
 import erpnext
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
@@ -31,6 +31,9 @@ from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 from erpnext.accounts.doctype.accounting_dimension_filter.accounting_dimension_filter import (
 	get_dimension_filter_map,
 )
+from erpnext.accounts.doctype.daily_account_balance.daily_account_balance import (
+	update_account_balances,
+)
 from erpnext.accounts.party import validate_party_frozen_disabled, validate_party_gle_currency
 from erpnext.accounts.utils import get_account_currency, get_fiscal_year
 from erpnext.exceptions import (
@@ -55,6 +58,7 @@ class GLEntry(Document):
 	def validate(self):
 		self.flags.ignore_submit_comment = True
 		self.validate_and_set_fiscal_year()
+		self.set_posting_datetime()
 		self.pl_must_have_cost_center()
 
 		if not self.flags.from_repost and self.voucher_type != "Period Closing Voucher":
@@ -64,6 +68,17 @@ class GLEntry(Document):
 			self.validate_party()
 			self.validate_currency()
 
+	def set_posting_datetime(self):
+		"""Keep the voucher's posting time (set via `get_gl_dict`) if it is on the posting date"""
+		from erpnext.stock.utils import get_combine_datetime
+
+		if self.posting_datetime and getdate(self.posting_datetime) == getdate(self.posting_date):
+			self.posting_datetime = get_combine_datetime(
+				self.posting_date, get_datetime(self.posting_datetime).time()
+			)
+		else:
+			self.posting_datetime = get_combine_datetime(self.posting_date, "00:00:00")
+
 	def on_update(self):
 		adv_adj = self.flags.adv_adj
 		if not self.flags.from_repost and self.voucher_type != "Period Closing Voucher":
@@ -88,6 +103,9 @@ class GLEntry(Document):
 						self.account, self.party_type, self.party, self.against_voucher_type, self.against_voucher
 					)
 
+		if not self.is_cancelled:
+			update_account_balances([self])
+
 	def check_mandatory(self):
 		mandatory = ["account", "voucher_type", "voucher_no", "company"]
 		for k in mandatory:
@@ -142,8 +160,8 @@ class GLEntry(Document):
 
 			frappe.throw(msg, title=_("Missing Cost Center"))
 
-	def validate_dimensions_for_pl_and_bs(self):
-		account_type = frappe.db.get_value("Account", self.account, "report_type")
+	def validate_dimensions_for_pl_and_bs(self, report_type=None):
+		account_type = report_type or frappe.db.get_value("Account", self.account, "report_type")
 
 		for dimension in get_checks_for_pl_and_bs_accounts():
 			if (
@@ -220,15 +238,18 @@ class GLEntry(Document):
 				)
 			)
 
-	def validate_account_details(self, adv_adj):
+	def validate_account_details(self, adv_adj, account_details=None):
 		"""Account must be ledger, active and not freezed"""
 
-		ret = frappe.db.sql(
-			"""select is_group, docstatus, company
+		ret = (
+			account_details
+			or frappe.db.sql(
+				"""select is_group, docstatus, company
 			from tabAccount where name=%s""",
-			self.account,
-			as_dict=1,
-		)[0]
+				self.account,
+				as_dict=1,
+			)[0]
+		)
 
 		if ret.is_group == 1:
 			frappe.throw(
@@ -302,6 +323,127 @@ class GLEntry(Document):
 		frappe.throw(msg)
 
 
+def make_gl_entries_in_bulk(gl_map, adv_adj=False, update_outstanding="Yes", from_repost=False):
+	"""Validate the GL Entries of a `gl_map` together and insert them with multi-row inserts.
+
+	Runs the same checks as submitting each GL Entry, but account details and links are
+	fetched once per map, balances are validated once per account and outstanding amounts
+	are updated once per against voucher. Document events of GL Entry are not run.
+	"""
+	gl_entries = []
+	for args in gl_map:
+		gle = frappe.new_doc("GL Entry")
+		gle.update(args)
+		gle.flags.from_repost = from_repost
+		gle.set_new_name()
+		gle.validate()
+		gl_entries.append(gle)
+
+	validate_mandatory_and_links(gl_entries)
+
+	account_details = get_account_details({gle.account for gle in gl_entries})
+	validate_entries = [
+		gle
+		for gle in gl_entries
+		if not from_repost and gle.voucher_type != "Period Closing Voucher"
+	]
+
+	for gle in validate_entries:
+		account = account_details[gle.account]
+		gle.validate_account_details(adv_adj, account)
+		gle.validate_dimensions_for_pl_and_bs(account.report_type)
+		gle.validate_allowed_dimensions()
+
+	for account in {gle.account for gle in validate_entries}:
+		validate_frozen_account(account, adv_adj)
+
+	bulk_insert_ledger_entries(gl_entries)
+	update_account_balances([gle for gle in gl_entries if not gle.is_cancelled])
+
+	for account in {gle.account for gle in validate_entries}:
+		validate_balance_type(account, adv_adj)
+
+	if update_outstanding != "Yes" or frappe.flags.is_reverse_depr_entry:
+		return
+
+	against_vouchers = {
+		(gle.account, gle.party_type, gle.party, gle.against_voucher_type, gle.against_voucher)
+		for gle in validate_entries
+		if account_details[gle.account].account_type not in ["Receivable", "Payable"]
+		and gle.against_voucher_type in ["Journal Entry", "Sales Invoice", "Purchase Invoice", "Fees"]
+		and gle.against_voucher
+	}
+	for args in against_vouchers:
+		update_outstanding_amt(*args)
+
+
+def get_account_details(accounts):
+	return {
+		account.name: account
+		for account in frappe.get_all(
+			"Account",
+			filters={"name": ("in", list(accounts))},
+			fields=["name", "is_group", "docstatus", "company", "report_type", "account_type"],
+		)
+	}
+
+
+def validate_mandatory_and_links(docs):
+	"""Check mandatory fields and that linked documents exist, once for a list of ledger entries"""
+	from frappe.exceptions import LinkValidationError, MandatoryError
+
+	meta = docs[0].meta
+	for df in meta.get("fields", {"reqd": 1}):
+		for doc in docs:
+			if doc.get(df.fieldname) in (None, ""):
+				frappe.throw(
+					_("{0} is required").format(_(df.label)),
+					MandatoryError,
+				)
+
+	links = {}
+	for df in meta.get_link_fields() + meta.get_dynamic_link_fields():
+		for doc in docs:
+			value = doc.get(df.fieldname)
+			if not value:
+				continue
+
+			link_doctype = doc.get(df.options) if df.fieldtype == "Dynamic Link" else df.options
+			if link_doctype:
+				links.setdefault(link_doctype, {}).setdefault(value, df.label)
+
+	for link_doctype, values in links.items():
+		existing = set(
+			frappe.get_all(link_doctype, filters={"name": ("in", list(values))}, pluck="name")
+		)
+		for value, label in values.items():
+			if value not in existing:
+				frappe.throw(
+					_("Could not find {0}: {1}").format(_(label), frappe.bold(value)),
+					LinkValidationError,
+				)
+
+
+def bulk_insert_ledger_entries(docs):
+	"""Insert named and validated ledger entry documents with multi-row inserts"""
+	timestamp = now()
+	user = frappe.session.user
+
+	rows = []
+	for doc in docs:
+		doc.docstatus = 1
+		doc.modified = timestamp
+		doc.modified_by = user
+		doc.creation = doc.creation or timestamp
+		doc.owner = doc.owner or user
+		rows.append(doc.get_valid_dict(convert_dates_to_str=True))
+
+	fields = list(rows[0])
+	frappe.db.bulk_insert(
+		docs[0].doctype, fields, [tuple(row.get(field) for field in fields) for row in rows]
+	)
+
+
 def validate_balance_type(account, adv_adj=False):
 	if not adv_adj and account:
 		balance_must_be = frappe.db.get_value("Account", account, "balance_must_be")
@@ -441,6 +583,7 @@ def update_against_account(voucher_type, voucher_no):
 def on_doctype_update():
 	frappe.db.add_index("GL Entry", ["against_voucher_type", "against_voucher"])
 	frappe.db.add_index("GL Entry", ["voucher_type", "voucher_no"])
+	frappe.db.add_index("GL Entry", ["account", "posting_datetime"])
 
 
 def rename_gle_sle_docs():
@@ -460,3 +603,10 @@ def rename_temporarily_named_docs(doctype):
 			(newname, oldname),
 			auto_commit=True,
 		)
+
+		if doctype == "Stock Ledger Entry":
+			from erpnext.stock.doctype.serial_no_ledger_entry.serial_no_ledger_entry import (
+				rename_stock_ledger_entry,
+			)
+
+			rename_stock_ledger_entry(oldname, newname)
@@ -3,12 +3,15 @@
 
 
 import unittest
+from unittest.mock import patch
 
 import frappe
 from frappe.model.naming import parse_naming_series
 
 from erpnext.accounts.doctype.gl_entry.gl_entry import rename_gle_sle_docs
 from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+from erpnext.accounts.utils import use_bulk_ledger_posting
 
 
 class TestGLEntry(unittest.TestCase):
@@ -79,3 +82,55 @@ class TestGLEntry(unittest.TestCase):
 			"SELECT current from tabSeries where name = %s", naming_series
 		)[0][0]
 		self.assertEqual(old_naming_series_current_value + 2, new_naming_series_current_value)
+
+	def test_bulk_ledger_posting(self):
+		def get_ledger_entries(si):
+			gl_entries = frappe.get_all(
+				"GL Entry",
+				fields=["account", "debit", "credit", "against_voucher", "is_cancelled"],
+				filters={"voucher_type": "Sales Invoice", "voucher_no": si.name},
+				order_by="account, is_cancelled, debit",
+			)
+			pl_entries = frappe.get_all(
+				"Payment Ledger Entry",
+				fields=["account", "party", "amount", "against_voucher_no", "delinked"],
+				filters={"voucher_type": "Sales Invoice", "voucher_no": si.name},
+				order_by="amount",
+			)
+			for entry in gl_entries:
+				entry.against_voucher = entry.against_voucher == si.name
+			for entry in pl_entries:
+				entry.against_voucher_no = entry.against_voucher_no == si.name
+			return gl_entries, pl_entries
+
+		def post_and_cancel(row_by_row):
+			frappe.db.set_single_value("Accounts Settings", "post_ledger_entries_row_by_row", row_by_row)
+			si = create_sales_invoice(qty=3, rate=100)
+			outstanding = frappe.db.get_value("Sales Invoice", si.name, "outstanding_amount")
+			submitted = get_ledger_entries(si)
+			si.cancel()
+			return outstanding, submitted, get_ledger_entries(si)
+
+		try:
+			row_by_row = post_and_cancel(1)
+			bulk = post_and_cancel(0)
+		finally:
+			frappe.db.set_single_value("Accounts Settings", "post_ledger_entries_row_by_row", 0)
+
+		self.assertEqual(bulk[0], 300)
+		self.assertEqual(bulk, row_by_row)
+
+	def test_bulk_ledger_posting_with_hooks_for_all_doctypes(self):
+		frappe.db.set_single_value("Accounts Settings", "post_ledger_entries_row_by_row", 0)
+		installed_apps = ["frappe", "erpnext", "audit_app"]
+
+		def get_hooks(hook=None, default=None, app_name=None):
+			if app_name == "audit_app":
+				return {"*": {"on_submit": "audit_app.log_document"}}
+			return {}
+
+		with patch("frappe.get_installed_apps", return_value=installed_apps), patch(
+			"frappe.get_hooks", side_effect=get_hooks
+		), patch("frappe.get_doc_hooks", return_value={}):
+			# an app logging every submitted document gets every ledger entry row by row
+			self.assertFalse(use_bulk_ledger_posting())
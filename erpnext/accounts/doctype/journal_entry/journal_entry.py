@@ -13,6 +13,10 @@ from erpnext.accounts.deferred_revenue import get_deferred_booking_accounts
 from erpnext.accounts.doctype.invoice_discounting.invoice_discounting import (
 	get_party_account_based_on_invoice_discounting,
 )
+from erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update import (
+	defer_outstanding_updates,
+	get_pending_outstanding,
+)
 from erpnext.accounts.doctype.tax_withholding_category.tax_withholding_category import (
 	get_party_tax_withholding_details,
 )
@@ -621,6 +625,7 @@ class JournalEntry(AccountsController):
 
 	def validate_invoices(self):
 		"""Validate totals and docstatus for invoices"""
+		defer_updates = defer_outstanding_updates()
 		for reference_name, total in self.reference_totals.items():
 			reference_type = self.reference_types[reference_name]
 
@@ -635,6 +640,12 @@ class JournalEntry(AccountsController):
 				if invoice.docstatus != 1:
 					frappe.throw(_("{0} {1} is not submitted").format(reference_type, reference_name))
 
+				if defer_updates:
+					# outstanding amount of the invoice is stale until its background update runs
+					pending_outstanding = get_pending_outstanding(reference_type, reference_name)
+					if pending_outstanding is not None:
+						invoice.outstanding_amount = pending_outstanding
+
 				if total and flt(invoice.outstanding_amount) < total:
 					frappe.throw(
 						_("Payment against {0} {1} cannot be greater than Outstanding Amount {2}").format(
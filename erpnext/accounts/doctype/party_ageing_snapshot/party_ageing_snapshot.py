@@ -0,0 +1,248 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe import _, qb, scrub
+from frappe.model.document import Document
+from frappe.query_builder import Criterion
+from frappe.utils import flt, getdate, now, nowdate
+
+from erpnext.accounts.report.accounts_receivable.accounts_receivable import (
+	REPORT_ARGS,
+	ReceivablePayableReport,
+)
+
+PARTY_REPORTS = {"Customer": "Accounts Receivable", "Supplier": "Accounts Payable"}
+KEY_FIELDS = ("party", "account", "account_currency", "posting_date", "due_date")
+AMOUNT_FIELDS = (
+	"invoiced",
+	"paid",
+	"credit_note",
+	"outstanding",
+	"outstanding_in_account_currency",
+)
+
+# report filters which only narrow down the parties and accounts of the snapshot
+SNAPSHOT_FILTER_FIELDS = {"company", "party_type", "party", "account"}
+UNSUPPORTED_FILTERS = (
+	"finance_book",
+	"cost_center",
+	"sales_person",
+	"show_sales_person",
+	"based_on_payment_terms",
+	"show_future_payments",
+)
+
+
+class PartyAgeingSnapshot(Document):
+	pass
+
+
+def make_ageing_snapshots(company=None, party_type=None, snapshot_date=None, chunk_size=500):
+	"""
+	Save the outstanding of Accounts Receivable / Payable as on `snapshot_date` (default: today),
+	per party, account and ageing date.
+
+	Accounts Receivable / Payable Summary start from the snapshot and only rebuild the parties
+	whose Payment Ledger Entries changed after it.
+
+	Usage: bench --site <site> execute erpnext.accounts.doctype.party_ageing_snapshot.party_ageing_snapshot.make_ageing_snapshots
+	"""
+	snapshot_date = getdate(snapshot_date or nowdate())
+	companies = [company] if company else frappe.get_all("Company", pluck="name")
+	party_types = [party_type] if party_type else list(PARTY_REPORTS)
+
+	fields = (
+		("company", "party_type", "snapshot_date")
+		+ KEY_FIELDS
+		+ AMOUNT_FIELDS
+		+ ("creation", "modified", "owner", "modified_by")
+	)
+
+	for company in companies:
+		for party_type in party_types:
+			# ledger entries changed after this timestamp are applied on top of the snapshot
+			timestamp = now()
+			report = ReceivablePayableReport({"company": company, "report_date": snapshot_date})
+			chunks = report.run_in_chunks(REPORT_ARGS[PARTY_REPORTS[party_type]], chunk_size)
+
+			frappe.db.delete("Party Ageing Snapshot", {"company": company, "party_type": party_type})
+
+			for rows in chunks:
+				balances = {}
+				for row in rows:
+					key = (
+						row.party,
+						row.party_account,
+						row.account_currency,
+						getdate(row.posting_date),
+						getdate(row.due_date) if row.due_date else None,
+					)
+					balance = balances.setdefault(key, dict.fromkeys(AMOUNT_FIELDS, 0.0))
+					for field in AMOUNT_FIELDS:
+						balance[field] += flt(row.get(field))
+
+				frappe.db.bulk_insert(
+					"Party Ageing Snapshot",
+					fields,
+					[
+						(company, party_type, snapshot_date)
+						+ key
+						+ tuple(balance[field] for field in AMOUNT_FIELDS)
+						+ (timestamp, timestamp, frappe.session.user, frappe.session.user)
+						for key, balance in balances.items()
+					],
+				)
+
+			if not frappe.flags.in_test:
+				frappe.db.commit()  # nosemgrep
+
+
+@frappe.whitelist()
+def enqueue_ageing_snapshot(company, party_type):
+	frappe.only_for(("Accounts Manager", "System Manager"))
+
+	frappe.enqueue(
+		"erpnext.accounts.doctype.party_ageing_snapshot.party_ageing_snapshot.make_ageing_snapshots",
+		queue="long",
+		timeout=7200,
+		company=company,
+		party_type=party_type,
+	)
+	frappe.msgprint(_("The ageing snapshot will be refreshed in the background."), alert=True)
+
+
+def get_ageing_snapshot(company, party_type):
+	return frappe.db.get_value(
+		"Party Ageing Snapshot",
+		{"company": company, "party_type": party_type},
+		["snapshot_date", "creation"],
+		as_dict=True,
+	)
+
+
+def get_changed_parties(company, party_type, snapshot, report_date=None, parties=None):
+	"""
+	Parties with Payment Ledger Entries posted, cancelled or relinked after the snapshot, or
+	posted after the snapshot date (up to `report_date`)
+	"""
+	ple = qb.DocType("Payment Ledger Entry")
+	changed = ple.modified > snapshot.creation
+	if not report_date:
+		changed |= ple.posting_date > snapshot.snapshot_date
+	elif getdate(report_date) > snapshot.snapshot_date:
+		changed |= (ple.posting_date > snapshot.snapshot_date) & (ple.posting_date <= report_date)
+
+	query = (
+		qb.from_(ple)
+		.select(ple.party)
+		.distinct()
+		.where((ple.company == company) & (ple.party_type == party_type) & changed)
+	)
+	if parties:
+		query = query.where(ple.party.isin(parties))
+
+	return query.run(pluck=True)
+
+
+def can_use_ageing_snapshot(report, snapshot):
+	filters = report.filters
+	if not snapshot or getdate(filters.report_date) < snapshot.snapshot_date:
+		return False
+
+	if filters.ageing_based_on == "Supplier Invoice Date":
+		return False
+
+	# amounts are in party currency when filtered on a party
+	if filters.get(scrub(report.party_type)) or any(filters.get(f) for f in UNSUPPORTED_FILTERS):
+		return False
+
+	report.prepare_conditions()
+	return {
+		field.name for criterion in report.qb_selection_filter for field in criterion.fields_()
+	} <= SNAPSHOT_FILTER_FIELDS
+
+
+def get_receivables_from_snapshot(filters, args):
+	"""
+	Rows of Accounts Receivable / Payable for the summary: parties unchanged since the ageing
+	snapshot are read from it, the other parties are computed from the Payment Ledger.
+	Returns None if no snapshot can be used for the filters.
+	"""
+	report = ReceivablePayableReport(filters)
+	report.filters.update(args)
+	report.set_defaults()
+
+	snapshot = get_ageing_snapshot(report.filters.company, report.party_type)
+	if not can_use_ageing_snapshot(report, snapshot):
+		return
+
+	changed_parties = get_changed_parties(
+		report.filters.company, report.party_type, snapshot, report.filters.report_date
+	)
+
+	receivables = []
+	if changed_parties:
+		for rows in ReceivablePayableReport(filters).run_in_chunks(args, parties=changed_parties):
+			receivables.extend(rows)
+
+	pas = qb.DocType("Party Ageing Snapshot")
+	query = (
+		qb.from_(pas)
+		.select(*KEY_FIELDS, *AMOUNT_FIELDS)
+		.where(
+			Criterion.all(
+				[criterion.replace_table(report.ple, pas) for criterion in report.qb_selection_filter]
+			)
+		)
+	)
+	if changed_parties:
+		query = query.where(pas.party.notin(changed_parties))
+
+	rows = query.run(as_dict=True)
+	set_party_details(report, {row.party for row in rows})
+	for row in rows:
+		row.party_account = row.account
+		report.set_ageing(row)
+		report.set_party_details(row)
+
+	return receivables + rows
+
+
+def set_party_details(report, parties):
+	"Load the details of all parties at once instead of one query per party"
+	if not parties:
+		return
+
+	if report.party_type == "Customer":
+		fields = ["customer_name", "territory", "customer_group", "customer_primary_contact"]
+		if report.filters.get("sales_partner"):
+			fields.append("default_sales_partner")
+	else:
+		fields = ["supplier_name", "supplier_group"]
+
+	for details in frappe.get_all(
+		report.party_type, filters={"name": ("in", list(parties))}, fields=["name", *fields]
+	):
+		report.party_details[details.pop("name")] = details
+
+
+def get_snapshot_outstanding(company, party_type, party):
+	"""
+	Outstanding of a party in account currency from the ageing snapshot, or None if there is no
+	snapshot or the party changed after it
+	"""
+	snapshot = get_ageing_snapshot(company, party_type)
+	if not snapshot or get_changed_parties(company, party_type, snapshot, parties=[party]):
+		return
+
+	outstanding = frappe.get_all(
+		"Party Ageing Snapshot",
+		filters={"company": company, "party_type": party_type, "party": party},
+		fields=["sum(outstanding_in_account_currency) as outstanding"],
+	)
+	return flt(outstanding[0].outstanding) if outstanding else 0.0
+
+
+def on_doctype_update():
+	frappe.db.add_index("Party Ageing Snapshot", ["company", "party_type", "party"])
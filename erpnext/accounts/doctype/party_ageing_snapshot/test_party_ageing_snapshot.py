@@ -0,0 +1,55 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import today
+
+from erpnext.accounts.doctype.party_ageing_snapshot.party_ageing_snapshot import (
+	get_snapshot_outstanding,
+	make_ageing_snapshots,
+)
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+from erpnext.accounts.report.accounts_receivable_summary.accounts_receivable_summary import execute
+
+
+class TestPartyAgeingSnapshot(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_summary_from_ageing_snapshot(self):
+		filters = {
+			"company": "_Test Company",
+			"report_date": today(),
+			"ageing_based_on": "Due Date",
+			"range1": 30,
+			"range2": 60,
+			"range3": 90,
+			"range4": 120,
+		}
+
+		def get_summary(use_snapshot):
+			if not use_snapshot:
+				frappe.db.savepoint("ageing_snapshot")
+				frappe.db.delete("Party Ageing Snapshot")
+
+			data = sorted(execute(filters)[1], key=lambda row: row.party)
+
+			if not use_snapshot:
+				frappe.db.rollback(save_point="ageing_snapshot")
+			return data
+
+		create_sales_invoice(rate=100)
+		make_ageing_snapshots("_Test Company", "Customer")
+		self.assertEqual(get_summary(True), get_summary(False))
+
+		# invoices posted after the snapshot are added from the payment ledger
+		create_sales_invoice(rate=300)
+		self.assertEqual(get_summary(True), get_summary(False))
+
+		self.assertIsNone(get_snapshot_outstanding("_Test Company", "Customer", "_Test Customer"))
+		make_ageing_snapshots("_Test Company", "Customer")
+		self.assertEqual(
+			get_snapshot_outstanding("_Test Company", "Customer", "_Test Customer"),
+			[row for row in get_summary(False) if row.party == "_Test Customer"][0].outstanding,
+		)
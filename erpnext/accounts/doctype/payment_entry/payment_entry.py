@@ -18,6 +18,10 @@ from erpnext.accounts.doctype.invoice_discounting.invoice_discounting import (
 	get_party_account_based_on_invoice_discounting,
 )
 from erpnext.accounts.doctype.journal_entry.journal_entry import get_default_bank_cash_account
+from erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update import (
+	defer_outstanding_updates,
+	get_pending_outstanding,
+)
 from erpnext.accounts.doctype.tax_withholding_category.tax_withholding_category import (
 	get_party_tax_withholding_details,
 )
@@ -150,7 +154,14 @@ class PaymentEntry(AccountsController):
 			)
 
 	def validate_allocated_amount(self):
+		defer_updates = defer_outstanding_updates()
 		for d in self.get("references"):
+			if defer_updates and d.reference_doctype in ("Sales Invoice", "Purchase Invoice"):
+				# outstanding amount of the invoice is stale until its background update runs
+				pending_outstanding = get_pending_outstanding(d.reference_doctype, d.reference_name)
+				if pending_outstanding is not None:
+					d.outstanding_amount = pending_outstanding
+
 			if (flt(d.allocated_amount)) > 0:
 				if flt(d.allocated_amount) > flt(d.outstanding_amount):
 					frappe.throw(
@@ -1687,6 +1698,10 @@ def get_reference_details(reference_doctype, reference_name, party_account_curre
 
 		if reference_doctype in ("Sales Invoice", "Purchase Invoice"):
 			outstanding_amount = ref_doc.get("outstanding_amount")
+			if defer_outstanding_updates():
+				pending_outstanding = get_pending_outstanding(reference_doctype, reference_name)
+				if pending_outstanding is not None:
+					outstanding_amount = pending_outstanding
 		else:
 			outstanding_amount = flt(total_amount) - flt(ref_doc.get("advance_paid"))
 
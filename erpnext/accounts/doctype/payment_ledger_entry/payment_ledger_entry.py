@@ -13,33 +13,52 @@ from erpnext.accounts.doctype.accounting_dimension_filter.accounting_dimension_f
 	get_dimension_filter_map,
 )
 from erpnext.accounts.doctype.gl_entry.gl_entry import (
+	bulk_insert_ledger_entries,
+	get_account_details,
 	validate_balance_type,
 	validate_frozen_account,
+	validate_mandatory_and_links,
 )
-from erpnext.accounts.utils import update_voucher_outstanding
+from erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding import (
+	update_outstanding_summary,
+)
+from erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update import (
+	defer_outstanding_updates,
+	queue_outstanding_updates,
+)
+from erpnext.accounts.utils import delink_original_entry, update_voucher_outstanding
 from erpnext.exceptions import InvalidAccountDimensionError, MandatoryAccountDimensionError
 
 
 class PaymentLedgerEntry(Document):
-	def validate_account(self):
-		valid_account = frappe.db.get_list(
-			"Account",
-			"name",
-			filters={"name": self.account, "account_type": self.account_type, "company": self.company},
-			ignore_permissions=True,
-		)
+	def validate_account(self, account_details=None):
+		if account_details:
+			valid_account = (
+				account_details.account_type == self.account_type
+				and account_details.company == self.company
+			)
+		else:
+			valid_account = frappe.db.get_list(
+				"Account",
+				"name",
+				filters={"name": self.account, "account_type": self.account_type, "company": self.company},
+				ignore_permissions=True,
+			)
 		if not valid_account:
 			frappe.throw(_("{0} account is not of type {1}").format(self.account, self.account_type))
 
-	def validate_account_details(self):
+	def validate_account_details(self, account_details=None):
 		"""Account must be ledger, active and not freezed"""
 
-		ret = frappe.db.sql(
-			"""select is_group, docstatus, company
+		ret = (
+			account_details
+			or frappe.db.sql(
+				"""select is_group, docstatus, company
 			from tabAccount where name=%s""",
-			self.account,
-			as_dict=1,
-		)[0]
+				self.account,
+				as_dict=1,
+			)[0]
+		)
 
 		if ret.is_group == 1:
 			frappe.throw(
@@ -96,8 +115,8 @@ class PaymentLedgerEntry(Document):
 							InvalidAccountDimensionError,
 						)
 
-	def validate_dimensions_for_pl_and_bs(self):
-		account_type = frappe.db.get_value("Account", self.account, "report_type")
+	def validate_dimensions_for_pl_and_bs(self, report_type=None):
+		account_type = report_type or frappe.db.get_value("Account", self.account, "report_type")
 
 		for dimension in get_checks_for_pl_and_bs_accounts():
 			if (
@@ -138,6 +157,9 @@ class PaymentLedgerEntry(Document):
 			validate_balance_type(self.account, adv_adj)
 			validate_frozen_account(self.account, adv_adj)
 
+		if not self.delinked:
+			update_outstanding_summary([self])
+
 		# update outstanding amount
 		if (
 			self.against_voucher_type in ["Journal Entry", "Sales Invoice", "Purchase Invoice", "Fees"]
@@ -149,6 +171,59 @@ class PaymentLedgerEntry(Document):
 			)
 
 
+def make_payment_ledger_entries_in_bulk(
+	ple_map, cancel=0, adv_adj=0, update_outstanding="Yes", from_repost=0
+):
+	"""Validate the Payment Ledger Entries of a `ple_map` together and insert them with
+	multi-row inserts. Outstanding amounts are updated once per against voucher."""
+	payment_ledger_entries = []
+	for entry in ple_map:
+		ple = frappe.get_doc(entry)
+		ple.set_new_name()
+		payment_ledger_entries.append(ple)
+
+		if cancel:
+			delink_original_entry(ple)
+
+	account_details = get_account_details({ple.account for ple in payment_ledger_entries})
+	for ple in payment_ledger_entries:
+		ple.validate_account(account_details.get(ple.account))
+
+	validate_mandatory_and_links(payment_ledger_entries)
+
+	if not from_repost:
+		for ple in payment_ledger_entries:
+			account = account_details[ple.account]
+			ple.validate_account_details(account)
+			ple.validate_dimensions_for_pl_and_bs(account.report_type)
+			ple.validate_allowed_dimensions()
+
+		for account in account_details:
+			validate_frozen_account(account, adv_adj)
+
+	bulk_insert_ledger_entries(payment_ledger_entries)
+	update_outstanding_summary([ple for ple in payment_ledger_entries if not ple.delinked])
+
+	if not from_repost:
+		for account in account_details:
+			validate_balance_type(account, adv_adj)
+
+	if update_outstanding != "Yes" or frappe.flags.is_reverse_depr_entry:
+		return
+
+	against_vouchers = {
+		(ple.against_voucher_type, ple.against_voucher_no, ple.account, ple.party_type, ple.party)
+		for ple in payment_ledger_entries
+		if ple.against_voucher_type in ["Journal Entry", "Sales Invoice", "Purchase Invoice", "Fees"]
+	}
+	if defer_outstanding_updates():
+		queue_outstanding_updates(against_vouchers)
+		return
+
+	for args in against_vouchers:
+		update_voucher_outstanding(*args)
+
+
 def on_doctype_update():
 	frappe.db.add_index("Payment Ledger Entry", ["against_voucher_no", "against_voucher_type"])
 	frappe.db.add_index("Payment Ledger Entry", ["voucher_no", "voucher_type"])
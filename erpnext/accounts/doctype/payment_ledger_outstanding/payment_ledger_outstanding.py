@@ -0,0 +1,258 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cint, flt, now
+
+KEY_FIELDS = (
+	"company",
+	"account",
+	"account_type",
+	"party_type",
+	"party",
+	"voucher_type",
+	"voucher_no",
+)
+VOUCHER_FIELDS = ("posting_date", "due_date", "account_currency")
+AMOUNT_FIELDS = (
+	"invoice_amount",
+	"invoice_amount_in_account_currency",
+	"outstanding",
+	"outstanding_in_account_currency",
+	"voucher_entries",
+)
+LEDGER_FIELDS = (
+	*KEY_FIELDS,
+	*VOUCHER_FIELDS,
+	"against_voucher_type",
+	"against_voucher_no",
+	"amount",
+	"amount_in_account_currency",
+)
+
+
+class PaymentLedgerOutstanding(Document):
+	pass
+
+
+def get_key(entry, voucher_type=None, voucher_no=None):
+	return (
+		entry.get("company"),
+		entry.get("account"),
+		entry.get("account_type"),
+		entry.get("party_type") or "",
+		entry.get("party") or "",
+		voucher_type or entry.get("voucher_type"),
+		voucher_no or entry.get("voucher_no"),
+	)
+
+
+def update_outstanding_summary(pl_entries, cancel=False):
+	"""
+	Add active Payment Ledger Entries to the summary of their vouchers (subtract them on `cancel`).
+
+	An entry adds to the invoice amount of its own voucher and to the outstanding of its
+	against voucher, as grouped by `QueryPaymentLedger.query_for_outstanding`.
+	"""
+	sign = -1 if cancel else 1
+	summaries = {}
+	for entry in pl_entries:
+		summary = summaries.setdefault(get_key(entry), frappe._dict())
+		summary.update({field: entry.get(field) for field in VOUCHER_FIELDS})
+		summary.invoice_amount = flt(summary.invoice_amount) + sign * flt(entry.get("amount"))
+		summary.invoice_amount_in_account_currency = flt(
+			summary.invoice_amount_in_account_currency
+		) + sign * flt(entry.get("amount_in_account_currency"))
+		summary.voucher_entries = cint(summary.voucher_entries) + sign
+
+		summary = summaries.setdefault(
+			get_key(entry, entry.get("against_voucher_type"), entry.get("against_voucher_no")),
+			frappe._dict(),
+		)
+		summary.outstanding = flt(summary.outstanding) + sign * flt(entry.get("amount"))
+		summary.outstanding_in_account_currency = flt(
+			summary.outstanding_in_account_currency
+		) + sign * flt(entry.get("amount_in_account_currency"))
+
+	if not summaries:
+		return
+
+	existing = get_existing_summaries(summaries)
+	timestamp = now()
+	new_rows = []
+	for key, summary in summaries.items():
+		for field in AMOUNT_FIELDS:
+			summary[field] = summary.get(field) or 0
+
+		if key in existing:
+			frappe.db.sql(
+				"""update `tabPayment Ledger Outstanding`
+				set invoice_amount = invoice_amount + %(invoice_amount)s,
+					invoice_amount_in_account_currency
+						= invoice_amount_in_account_currency + %(invoice_amount_in_account_currency)s,
+					outstanding = outstanding + %(outstanding)s,
+					outstanding_in_account_currency
+						= outstanding_in_account_currency + %(outstanding_in_account_currency)s,
+					voucher_entries = voucher_entries + %(voucher_entries)s,
+					posting_date = ifnull(posting_date, %(posting_date)s),
+					due_date = ifnull(due_date, %(due_date)s),
+					account_currency = ifnull(account_currency, %(account_currency)s),
+					modified = %(modified)s
+				where name = %(name)s""",
+				dict(
+					{field: summary.get(field) for field in VOUCHER_FIELDS},
+					**summary,
+					name=existing[key],
+					modified=timestamp,
+				),
+			)
+		elif not cancel:
+			new_rows.append(
+				key
+				+ tuple(summary.get(field) for field in VOUCHER_FIELDS + AMOUNT_FIELDS)
+				+ (timestamp, timestamp, frappe.session.user, frappe.session.user)
+			)
+
+	if new_rows:
+		frappe.db.bulk_insert(
+			"Payment Ledger Outstanding",
+			KEY_FIELDS + VOUCHER_FIELDS + AMOUNT_FIELDS + ("creation", "modified", "owner", "modified_by"),
+			new_rows,
+		)
+
+	if cancel and existing:
+		# vouchers without active entries are not returned by the outstanding query
+		frappe.db.sql(
+			"""delete from `tabPayment Ledger Outstanding`
+			where name in %(names)s and voucher_entries = 0
+				and outstanding = 0 and outstanding_in_account_currency = 0""",
+			{"names": tuple(existing.values())},
+		)
+
+
+def get_existing_summaries(summaries):
+	existing = {}
+	for row in frappe.get_all(
+		"Payment Ledger Outstanding",
+		filters={
+			"voucher_type": ("in", list({key[5] for key in summaries})),
+			"voucher_no": ("in", list({key[6] for key in summaries})),
+		},
+		fields=["name", *KEY_FIELDS],
+	):
+		key = get_key(row)
+		if key in summaries:
+			existing.setdefault(key, row.name)
+
+	return existing
+
+
+def get_active_entries(criterion):
+	ple = frappe.qb.DocType("Payment Ledger Entry")
+	return (
+		frappe.qb.from_(ple)
+		.select(*LEDGER_FIELDS)
+		.where((ple.delinked == 0) & criterion)
+		.run(as_dict=True)
+	)
+
+
+def remove_outstanding_summary(voucher_type, voucher_no):
+	"""Subtract the Payment Ledger Entries of a voucher from the summary before they are deleted"""
+	ple = frappe.qb.DocType("Payment Ledger Entry")
+	update_outstanding_summary(
+		get_active_entries((ple.voucher_type == voucher_type) & (ple.voucher_no == voucher_no)),
+		cancel=True,
+	)
+
+
+def get_summary_query(company=None):
+	"""Voucher summaries computed from Payment Ledger Entry, in the column order of the table"""
+	return """
+		select
+			company, account, account_type, ifnull(party_type, '') as party_type,
+			ifnull(party, '') as party, voucher_type, voucher_no,
+			max(posting_date) as posting_date, max(due_date) as due_date,
+			max(account_currency) as account_currency,
+			sum(invoice_amount) as invoice_amount,
+			sum(invoice_amount_in_account_currency) as invoice_amount_in_account_currency,
+			sum(outstanding) as outstanding,
+			sum(outstanding_in_account_currency) as outstanding_in_account_currency,
+			sum(voucher_entries) as voucher_entries
+		from (
+			select
+				company, account, account_type, party_type, party, voucher_type, voucher_no,
+				posting_date, due_date, account_currency,
+				amount as invoice_amount, amount_in_account_currency as invoice_amount_in_account_currency,
+				0 as outstanding, 0 as outstanding_in_account_currency, 1 as voucher_entries
+			from `tabPayment Ledger Entry`
+			where delinked = 0 {0}
+			union all
+			select
+				company, account, account_type, party_type, party,
+				against_voucher_type, against_voucher_no, null, null, null,
+				0, 0, amount, amount_in_account_currency, 0
+			from `tabPayment Ledger Entry`
+			where delinked = 0 {0}
+		) ple
+		group by company, account, account_type, ifnull(party_type, ''), ifnull(party, ''),
+			voucher_type, voucher_no""".format(
+		"and company = %(company)s" if company else ""
+	)
+
+
+def rebuild_outstanding_summary(company=None):
+	"""
+	Rebuild the voucher outstanding summary from Payment Ledger Entry.
+
+	Usage: bench --site <site> execute erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding.rebuild_outstanding_summary
+	"""
+	frappe.db.delete("Payment Ledger Outstanding", {"company": company} if company else None)
+
+	fields = ", ".join(KEY_FIELDS + VOUCHER_FIELDS + AMOUNT_FIELDS)
+	frappe.db.sql(
+		"""insert into `tabPayment Ledger Outstanding`
+			({fields}, creation, modified, owner, modified_by)
+		select {fields}, %(timestamp)s, %(timestamp)s, %(user)s, %(user)s
+		from ({query}) ple_summary""".format(fields=fields, query=get_summary_query(company)),
+		{"company": company, "timestamp": now(), "user": frappe.session.user},
+	)
+
+
+def check_outstanding_summary(company=None):
+	"""
+	List the voucher summaries which differ from a full recomputation over Payment Ledger Entry.
+
+	Usage: bench --site <site> execute erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding.check_outstanding_summary
+	"""
+	expected = {
+		get_key(row): row
+		for row in frappe.db.sql(get_summary_query(company), {"company": company}, as_dict=True)
+	}
+
+	actual = {}
+	for row in frappe.get_all(
+		"Payment Ledger Outstanding",
+		filters={"company": company} if company else None,
+		fields=[*KEY_FIELDS, *AMOUNT_FIELDS],
+	):
+		summary = actual.setdefault(get_key(row), frappe._dict())
+		for field in AMOUNT_FIELDS:
+			summary[field] = flt(summary.get(field)) + flt(row.get(field))
+
+	mismatches = []
+	for key in set(expected) | set(actual):
+		difference = {
+			field: flt(flt(expected.get(key, {}).get(field)) - flt(actual.get(key, {}).get(field)), 6)
+			for field in AMOUNT_FIELDS
+		}
+		if any(difference.values()):
+			mismatches.append(frappe._dict(zip(KEY_FIELDS, key), **difference))
+
+	return mismatches
+
+
+def on_doctype_update():
+	frappe.db.add_index("Payment Ledger Outstanding", ["voucher_type", "voucher_no"])
+	frappe.db.add_index("Payment Ledger Outstanding", ["party_type", "party", "account"])
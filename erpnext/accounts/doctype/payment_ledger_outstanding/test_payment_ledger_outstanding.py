@@ -0,0 +1,65 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe import qb
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.accounts.doctype.payment_entry.payment_entry import get_payment_entry
+from erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding import (
+	check_outstanding_summary,
+	rebuild_outstanding_summary,
+)
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+from erpnext.accounts.utils import QueryPaymentLedger
+
+
+class TestPaymentLedgerOutstanding(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_summary_follows_payment_ledger(self):
+		company = "_Test Company"
+		ple = qb.DocType("Payment Ledger Entry")
+
+		def get_outstandings(use_outstanding_summary):
+			return sorted(
+				(row.voucher_no, row.invoice_amount, row.outstanding)
+				for row in QueryPaymentLedger(use_outstanding_summary).get_voucher_outstandings(
+					common_filter=[ple.company == company, ple.party == "_Test Customer"],
+					get_invoices=True,
+				)
+			)
+
+		def assert_summary_matches():
+			self.assertFalse(check_outstanding_summary(company))
+			self.assertEqual(get_outstandings(True), get_outstandings(False))
+
+		rebuild_outstanding_summary(company)
+		assert_summary_matches()
+
+		si1 = create_sales_invoice(rate=100)
+		si2 = create_sales_invoice(rate=200)
+		pe = get_payment_entry("Sales Invoice", si1.name, party_amount=40)
+		pe.reference_no = "1"
+		pe.reference_date = si1.posting_date
+		pe.submit()
+		assert_summary_matches()
+		self.assertIn((si1.name, 100, 60), get_outstandings(True))
+
+		pe.cancel()
+		assert_summary_matches()
+		self.assertIn((si1.name, 100, 100), get_outstandings(True))
+
+		si2.cancel()
+		assert_summary_matches()
+		self.assertNotIn(si2.name, [row[0] for row in get_outstandings(True)])
+
+		# drift is reported and fixed by a rebuild
+		frappe.db.delete(
+			"Payment Ledger Entry", {"voucher_type": "Sales Invoice", "voucher_no": si1.name}
+		)
+		self.assertTrue(check_outstanding_summary(company))
+
+		rebuild_outstanding_summary(company)
+		assert_summary_matches()
@@ -0,0 +1,140 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe import _
+from frappe.model.document import Document
+from frappe.utils import cint, flt, now
+
+from erpnext.accounts.utils import QueryPaymentLedger
+from erpnext.stock.stock_ledger import bulk_update_values
+
+OUTSTANDING_VOUCHER_TYPES = ("Sales Invoice", "Purchase Invoice", "Fees")
+KEY_FIELDS = ("voucher_type", "voucher_no", "account", "party_type", "party")
+
+
+class PendingOutstandingUpdate(Document):
+	pass
+
+
+def defer_outstanding_updates():
+	return cint(frappe.db.get_single_value("Accounts Settings", "defer_outstanding_updates"))
+
+
+def queue_outstanding_updates(vouchers):
+	"""Record (voucher_type, voucher_no, account, party_type, party) keys whose outstanding amount
+	is recalculated by `process_pending_outstanding_updates` after the transaction is committed."""
+	vouchers = {
+		tuple(key) for key in vouchers if key[0] in OUTSTANDING_VOUCHER_TYPES and key[3] and key[4]
+	}
+	if not vouchers:
+		return
+
+	timestamp = now()
+	frappe.db.bulk_insert(
+		"Pending Outstanding Update",
+		KEY_FIELDS + ("creation", "modified", "owner", "modified_by"),
+		[key + (timestamp, timestamp, frappe.session.user, frappe.session.user) for key in vouchers],
+	)
+
+	if not frappe.flags.outstanding_update_enqueued:
+		frappe.flags.outstanding_update_enqueued = True
+		frappe.enqueue(
+			"erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update.process_pending_outstanding_updates",
+			queue="short",
+			job_name="process_pending_outstanding_updates",
+			enqueue_after_commit=True,
+		)
+
+
+def process_pending_outstanding_updates(batch_size=1000):
+	"""Recalculate the outstanding amounts of queued vouchers, once per voucher in each batch.
+
+	Runs after the transactions which queued them and every 15 minutes via scheduler."""
+	while True:
+		pending = frappe.get_all(
+			"Pending Outstanding Update",
+			fields=["name", *KEY_FIELDS],
+			order_by="name",
+			limit=batch_size,
+		)
+		if not pending:
+			break
+
+		update_outstanding_amounts({tuple(row[field] for field in KEY_FIELDS) for row in pending})
+		frappe.db.delete("Pending Outstanding Update", {"name": ("in", [row.name for row in pending])})
+
+		if not frappe.flags.in_test:
+			frappe.db.commit()  # nosemgrep
+
+
+def update_outstanding_amounts(vouchers, chunk_size=500):
+	"""Set-based `update_voucher_outstanding` for many (voucher_type, voucher_no, account,
+	party_type, party) keys: one Payment Ledger query and one update per chunk of vouchers."""
+	vouchers = sorted(vouchers, key=lambda key: tuple(value or "" for value in key))
+	for start in range(0, len(vouchers), chunk_size):
+		chunk = vouchers[start : start + chunk_size]
+
+		outstandings = {}
+		for row in QueryPaymentLedger().get_voucher_outstandings(
+			[frappe._dict(voucher_type=key[0], voucher_no=key[1]) for key in chunk]
+		):
+			key = (row.voucher_type, row.voucher_no, row.party_type, row.party)
+			outstandings.setdefault(key, []).append(row)
+
+		updates = {}
+		for voucher_type, voucher_no, account, party_type, party in chunk:
+			for row in outstandings.get((voucher_type, voucher_no, party_type, party), []):
+				if not account or row.account == account:
+					updates.setdefault(voucher_type, {})[voucher_no] = {
+						"outstanding_amount": row.outstanding_in_account_currency or 0.0
+					}
+					break
+
+		for voucher_type, values in updates.items():
+			bulk_update_values(voucher_type, values, update_modified=True)
+
+			for voucher_no in values:
+				frappe.get_doc(voucher_type, voucher_no).set_status(update=True)
+
+
+def get_pending_outstanding(voucher_type, voucher_no):
+	"""Outstanding amount of an invoice from the Payment Ledger if its `outstanding_amount` is still
+	to be recalculated in background, else None."""
+	if not frappe.db.exists(
+		"Pending Outstanding Update", {"voucher_type": voucher_type, "voucher_no": voucher_no}
+	):
+		return
+
+	rows = QueryPaymentLedger().get_voucher_outstandings(
+		[frappe._dict(voucher_type=voucher_type, voucher_no=voucher_no)]
+	)
+	return sum(flt(row.outstanding_in_account_currency) for row in rows)
+
+
+def has_pending_outstanding_updates(voucher_type=None):
+	filters = {"voucher_type": voucher_type} if voucher_type else None
+	return bool(frappe.get_all("Pending Outstanding Update", filters=filters, limit=1))
+
+
+@frappe.whitelist()
+def get_outstanding_update_status(voucher_type=None):
+	"Number of vouchers whose outstanding amount is still to be recalculated in background."
+	filters = {"voucher_type": voucher_type} if voucher_type else None
+	return {"pending": frappe.db.count("Pending Outstanding Update", filters)}
+
+
+def notify_pending_outstanding_updates(voucher_type):
+	"Warn report users that some outstanding amounts are not updated yet."
+	if has_pending_outstanding_updates(voucher_type):
+		frappe.msgprint(
+			_("Some {0} outstanding amounts are still being updated in the background.").format(
+				_(voucher_type)
+			),
+			indicator="orange",
+			alert=True,
+		)
+
+
+def on_doctype_update():
+	frappe.db.add_index("Pending Outstanding Update", ["voucher_type", "voucher_no"])
@@ -0,0 +1,77 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase, change_settings
+
+from erpnext.accounts.doctype.journal_entry.journal_entry import get_payment_entry_against_invoice
+from erpnext.accounts.doctype.payment_entry.payment_entry import get_payment_entry
+from erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update import (
+	get_outstanding_update_status,
+	process_pending_outstanding_updates,
+)
+from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+
+
+class TestPendingOutstandingUpdate(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	@change_settings("Accounts Settings", {"defer_outstanding_updates": 1})
+	def test_deferred_outstanding_update(self):
+		process_pending_outstanding_updates()
+
+		invoices = [create_sales_invoice(rate=100) for i in range(2)]
+		for si in invoices:
+			# two part payments, the invoice is queued twice
+			for i in range(2):
+				pe = get_payment_entry("Sales Invoice", si.name, party_amount=50)
+				pe.reference_no = "1"
+				pe.reference_date = si.posting_date
+				pe.submit()
+
+		for si in invoices:
+			self.assertEqual(frappe.db.get_value("Sales Invoice", si.name, "outstanding_amount"), 100)
+		self.assertTrue(get_outstanding_update_status("Sales Invoice")["pending"])
+
+		process_pending_outstanding_updates()
+
+		self.assertEqual(get_outstanding_update_status()["pending"], 0)
+		for si in invoices:
+			outstanding_amount, status = frappe.db.get_value(
+				"Sales Invoice", si.name, ["outstanding_amount", "status"]
+			)
+			self.assertEqual(outstanding_amount, 0)
+			self.assertEqual(status, "Paid")
+
+	@change_settings("Accounts Settings", {"defer_outstanding_updates": 1})
+	def test_payment_against_pending_outstanding(self):
+		si = create_sales_invoice(rate=100)
+
+		def make_payment(reference_no):
+			pe = get_payment_entry("Sales Invoice", si.name)
+			pe.reference_no = reference_no
+			pe.reference_date = si.posting_date
+			return pe
+
+		make_payment("1").submit()
+
+		# the invoice is not updated yet, the allocation is checked against the Payment Ledger
+		self.assertEqual(frappe.db.get_value("Sales Invoice", si.name, "outstanding_amount"), 100)
+		self.assertRaises(frappe.ValidationError, make_payment("2").submit)
+
+	@change_settings("Accounts Settings", {"defer_outstanding_updates": 1})
+	def test_journal_entry_against_pending_outstanding(self):
+		si = create_sales_invoice(rate=100)
+
+		def make_journal_entry(cheque_no):
+			je = frappe.get_doc(get_payment_entry_against_invoice("Sales Invoice", si.name))
+			je.cheque_no = cheque_no
+			je.cheque_date = si.posting_date
+			return je
+
+		make_journal_entry("1").submit()
+
+		# the invoice is not updated yet, the allocation is checked against the Payment Ledger
+		self.assertEqual(frappe.db.get_value("Sales Invoice", si.name, "outstanding_amount"), 100)
+		self.assertRaises(frappe.ValidationError, make_journal_entry("2").submit)
@@ -4,7 +4,7 @@
 
 import frappe
 from frappe import _
-from frappe.utils import cint, flt, get_link_to_form, getdate, nowdate
+from frappe.utils import cint, flt, get_link_to_form, getdate, now, nowdate
 
 from erpnext.accounts.doctype.loyalty_program.loyalty_program import validate_loyalty_points
 from erpnext.accounts.doctype.payment_request.payment_request import make_payment_request
@@ -21,6 +21,7 @@ from erpnext.stock.doctype.serial_no.serial_no import (
 	get_pos_reserved_serial_nos,
 	get_serial_nos,
 )
+from erpnext.stock.utils import get_or_make_bin
 
 
 class POSInvoice(SalesInvoice):
@@ -75,6 +76,8 @@ class POSInvoice(SalesInvoice):
 
 			update_coupon_code_count(self.coupon_code, "used")
 
+		self.update_pos_reserved_qty()
+
 	def before_cancel(self):
 		if (
 			self.consolidated_invoice
@@ -110,6 +113,13 @@ class POSInvoice(SalesInvoice):
 
 			update_coupon_code_count(self.coupon_code, "cancelled")
 
+		if not self.consolidated_invoice:
+			self.update_pos_reserved_qty(cancel=True)
+
+	def update_pos_reserved_qty(self, cancel=False):
+		"""Reserve (or release) the stock qty of this invoice in its bins until consolidation"""
+		update_pos_reserved_qty(self.items, -1 if cancel else 1)
+
 	def check_phone_payments(self):
 		for pay in self.payments:
 			if pay.type == "Phone" and pay.amount >= 0:
@@ -625,19 +635,51 @@ class POSInvoice(SalesInvoice):
 
 @frappe.whitelist()
 def get_stock_availability(item_code, warehouse):
-	if frappe.db.get_value("Item", item_code, "is_stock_item"):
-		is_stock_item = True
-		bin_qty = get_bin_qty(item_code, warehouse)
-		pos_sales_qty = get_pos_reserved_qty(item_code, warehouse)
-		return bin_qty - pos_sales_qty, is_stock_item
-	else:
-		is_stock_item = True
-		if frappe.db.exists("Product Bundle", item_code):
-			return get_bundle_availability(item_code, warehouse), is_stock_item
+	return get_stock_availability_for_items([item_code], warehouse).get(item_code, (0, False))
+
+
+def get_stock_availability_for_items(item_codes, warehouse):
+	"""
+	Stock available for POS in `warehouse`, as {item_code: (available qty, is stock item)}.
+
+	Stock items are answered from their bins in one query; product bundles are
+	resolved from the availability of their components.
+	"""
+	if not item_codes:
+		return {}
+
+	items = frappe.get_all(
+		"Item", filters={"name": ("in", item_codes)}, fields=["name", "is_stock_item"]
+	)
+
+	stock_items = [d.name for d in items if d.is_stock_item]
+	available_qty = {}
+	if stock_items:
+		for d in frappe.get_all(
+			"Bin",
+			filters={"item_code": ("in", stock_items), "warehouse": warehouse},
+			fields=["item_code", "actual_qty", "pos_reserved_qty"],
+		):
+			available_qty[d.item_code] = flt(d.actual_qty) - flt(d.pos_reserved_qty)
+
+	non_stock_items = [d.name for d in items if not d.is_stock_item]
+	bundles = set()
+	if non_stock_items:
+		bundles = set(
+			frappe.get_all("Product Bundle", filters={"name": ("in", non_stock_items)}, pluck="name")
+		)
+
+	availability = {}
+	for d in items:
+		if d.is_stock_item:
+			availability[d.name] = (available_qty.get(d.name, 0), True)
+		elif d.name in bundles:
+			availability[d.name] = (get_bundle_availability(d.name, warehouse), True)
 		else:
-			is_stock_item = False
 			# Is a service item or non_stock item
-			return 0, is_stock_item
+			availability[d.name] = (0, False)
+
+	return availability
 
 
 def get_bundle_availability(bundle_item_code, warehouse):
@@ -672,6 +714,13 @@ def get_bin_qty(item_code, warehouse):
 
 
 def get_pos_reserved_qty(item_code, warehouse):
+	if frappe.get_cached_value("Item", item_code, "is_stock_item"):
+		return flt(
+			frappe.db.get_value(
+				"Bin", {"item_code": item_code, "warehouse": warehouse}, "pos_reserved_qty"
+			)
+		)
+
 	reserved_qty = frappe.db.sql(
 		"""select sum(p_item.stock_qty) as qty
 		from `tabPOS Invoice` p, `tabPOS Invoice Item` p_item
@@ -688,6 +737,56 @@ def get_pos_reserved_qty(item_code, warehouse):
 	return reserved_qty[0].qty or 0 if reserved_qty else 0
 
 
+def update_pos_reserved_qty(items, sign=1):
+	"""Add `sign` times the stock qty of POS Invoice Items to the POS reserved qty of their bins"""
+	reserved_qty = {}
+	for d in items:
+		if d.item_code and d.warehouse and frappe.get_cached_value("Item", d.item_code, "is_stock_item"):
+			key = (d.item_code, d.warehouse)
+			reserved_qty[key] = reserved_qty.get(key, 0) + flt(d.stock_qty)
+
+	bin = frappe.qb.DocType("Bin")
+	for (item_code, warehouse), qty in reserved_qty.items():
+		bin_name = get_or_make_bin(item_code, warehouse)
+		(
+			frappe.qb.update(bin)
+			.set(bin.pos_reserved_qty, bin.pos_reserved_qty + sign * qty)
+			.set(bin.modified, now())
+			.where(bin.name == bin_name)
+		).run()
+
+
+def rebuild_pos_reserved_qty():
+	"""
+	Recompute the POS reserved qty of all bins from the unconsolidated POS Invoices.
+
+	Usage: bench --site <site> execute erpnext.accounts.doctype.pos_invoice.pos_invoice.rebuild_pos_reserved_qty
+	"""
+	frappe.db.sql("update `tabBin` set pos_reserved_qty = 0 where pos_reserved_qty != 0")
+
+	reserved_qty = frappe.db.sql(
+		"""select p_item.item_code, p_item.warehouse, sum(p_item.stock_qty) as qty
+		from `tabPOS Invoice` p, `tabPOS Invoice Item` p_item, `tabItem` item
+		where p.name = p_item.parent
+		and item.name = p_item.item_code
+		and ifnull(p.consolidated_invoice, '') = ''
+		and p_item.docstatus = 1
+		and item.is_stock_item = 1
+		and ifnull(p_item.warehouse, '') != ''
+		group by p_item.item_code, p_item.warehouse""",
+		as_dict=1,
+	)
+
+	for d in reserved_qty:
+		frappe.db.set_value(
+			"Bin",
+			get_or_make_bin(d.item_code, d.warehouse),
+			"pos_reserved_qty",
+			flt(d.qty),
+			update_modified=False,
+		)
+
+
 @frappe.whitelist()
 def make_sales_return(source_name, target_doc=None):
 	from erpnext.controllers.sales_and_purchase_return import make_return_doc
@@ -897,6 +897,58 @@ class TestPOSInvoice(unittest.TestCase):
 			frappe.db.rollback(save_point="before_test_returned_serial_no_case")
 			frappe.set_user("Administrator")
 
+	def test_pos_reserved_qty(self):
+		from erpnext.accounts.doctype.pos_invoice.pos_invoice import (
+			get_stock_availability,
+			get_stock_availability_for_items,
+			rebuild_pos_reserved_qty,
+		)
+		from erpnext.accounts.doctype.pos_invoice_merge_log.pos_invoice_merge_log import (
+			consolidate_pos_invoices,
+			get_all_unconsolidated_invoices,
+		)
+
+		item_code = make_item("_Test POS Reserved Qty Item", {"is_stock_item": 1}).name
+		warehouse = "_Test Warehouse - _TC"
+		make_stock_entry(target=warehouse, item_code=item_code, qty=10, basic_rate=100)
+
+		def get_reserved_qty():
+			return frappe.db.get_value(
+				"Bin", {"item_code": item_code, "warehouse": warehouse}, "pos_reserved_qty"
+			)
+
+		rebuild_pos_reserved_qty()
+		self.assertEqual(get_stock_availability(item_code, warehouse), (10, True))
+
+		pos_inv = create_pos_invoice(item_code=item_code, qty=3, do_not_submit=1)
+		pos_inv.append("payments", {"mode_of_payment": "Cash", "account": "Cash - _TC", "amount": 300})
+		pos_inv.submit()
+		self.assertEqual(get_reserved_qty(), 3)
+
+		availability = get_stock_availability_for_items([item_code, "_Test Non Stock Item"], warehouse)
+		self.assertEqual(availability[item_code], (7, True))
+		self.assertEqual(availability["_Test Non Stock Item"], (0, False))
+
+		# the running counter matches a full recount
+		rebuild_pos_reserved_qty()
+		self.assertEqual(get_reserved_qty(), 3)
+
+		pos_inv.cancel()
+		self.assertEqual(get_reserved_qty(), 0)
+
+		pos_inv = create_pos_invoice(item_code=item_code, qty=2, do_not_submit=1)
+		pos_inv.append("payments", {"mode_of_payment": "Cash", "account": "Cash - _TC", "amount": 200})
+		pos_inv.submit()
+		self.assertEqual(get_reserved_qty(), 2)
+
+		# consolidated invoices have already moved stock through the sales invoice
+		consolidate_pos_invoices(
+			[d for d in get_all_unconsolidated_invoices() if d.pos_invoice == pos_inv.name]
+		)
+		pos_inv.load_from_db()
+		self.assertTrue(pos_inv.consolidated_invoice)
+		self.assertEqual(get_reserved_qty(), 0)
+
 
 def create_pos_invoice(**args):
 	args = frappe._dict(args)
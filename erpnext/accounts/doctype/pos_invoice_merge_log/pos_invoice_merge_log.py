@@ -261,6 +261,7 @@ class POSInvoiceMergeLog(Document):
 	def update_pos_invoices(self, invoice_docs, sales_invoice="", credit_note=""):
 		for doc in invoice_docs:
 			doc.load_from_db()
+			was_consolidated = bool(doc.consolidated_invoice)
 			doc.update(
 				{
 					"consolidated_invoice": None
@@ -271,6 +272,10 @@ class POSInvoiceMergeLog(Document):
 			doc.set_status(update=True)
 			doc.save()
 
+			if was_consolidated != bool(doc.consolidated_invoice):
+				# consolidated invoices no longer hold stock for POS
+				doc.update_pos_reserved_qty(cancel=not was_consolidated)
+
 	def cancel_linked_invoices(self):
 		for si_name in [self.consolidated_invoice, self.consolidated_credit_note]:
 			if not si_name:
@@ -6,6 +6,10 @@ import unittest
 
 import frappe
 
+from erpnext.accounts.doctype.pricing_rule.utils import (
+	clear_pricing_rule_index,
+	get_pricing_rule_index,
+)
 from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
 from erpnext.selling.doctype.sales_order.test_sales_order import make_sales_order
 from erpnext.stock.doctype.item.test_item import make_item
@@ -94,6 +98,7 @@ class TestPricingRule(unittest.TestCase):
 		self.assertEqual(details.get("discount_percentage"), 5)
 
 		frappe.db.sql("update `tabPricing Rule` set priority=NULL where campaign='_Test Campaign'")
+		clear_pricing_rule_index()
 		from erpnext.accounts.doctype.pricing_rule.utils import MultiplePricingRuleConflict
 
 		self.assertRaises(MultiplePricingRuleConflict, get_item_details, args)
@@ -982,6 +987,43 @@ class TestPricingRule(unittest.TestCase):
 		self.assertEqual(so.items[1].item_code, "_Test Item")
 		self.assertEqual(so.items[1].qty, 4)
 
+	def test_pricing_rule_index(self):
+		rule = make_pricing_rule(
+			selling=1, apply_on="Item Group", item_group="All Item Groups", discount_percentage=10
+		)
+
+		index = get_pricing_rule_index()
+		self.assertIn(rule.name, index.pricing_rules)
+		self.assertIn("All Item Groups", index.trees["Item Group"]["_Test Item Group"])
+
+		args = frappe._dict(
+			{
+				"item_code": "_Test Item",
+				"company": "_Test Company",
+				"price_list": "_Test Price List",
+				"currency": "_Test Currency",
+				"doctype": "Sales Order",
+				"conversion_rate": 1,
+				"price_list_currency": "_Test Currency",
+				"plc_conversion_rate": 1,
+				"order_type": "Sales",
+				"customer": "_Test Customer",
+				"name": None,
+			}
+		)
+		details = get_item_details(args.copy())
+		self.assertEqual(details.get("discount_percentage"), 10)
+
+		# saving the rule invalidates the index
+		rule.discount_percentage = 15
+		rule.save()
+		details = get_item_details(args.copy())
+		self.assertEqual(details.get("discount_percentage"), 15)
+
+		rule.db_set("disable", 1)
+		details = get_item_details(args.copy())
+		self.assertFalse(details.get("discount_percentage"))
+
 
 test_dependencies = ["Campaign"]
 
@@ -1058,6 +1100,8 @@ def delete_existing_pricing_rules():
 
 		frappe.db.sql("delete from `tab{0}`".format(doctype))
 
+	clear_pricing_rule_index()
+
 
 def make_item_price(item, price_list_name, item_price):
 	frappe.get_doc(
@@ -9,7 +9,7 @@ import json
 
 import frappe
 from frappe import _, bold
-from frappe.utils import cint, flt, fmt_money, get_link_to_form, getdate, today
+from frappe.utils import cint, cstr, flt, fmt_money, get_link_to_form, getdate, today
 
 from erpnext.setup.doctype.item_group.item_group import get_child_item_groups
 from erpnext.stock.doctype.warehouse.warehouse import get_child_warehouses
@@ -22,12 +22,14 @@ class MultiplePricingRuleConflict(frappe.ValidationError):
 
 apply_on_table = {"Item Code": "items", "Item Group": "item_groups", "Brand": "brands"}
 
+PRICING_RULE_INDEX_KEY = "pricing_rule_index"
+
 
 def get_pricing_rules(args, doc=None):
 	pricing_rules = []
 	values = {}
 
-	if not frappe.db.exists("Pricing Rule", {"disable": 0, args.transaction_type: 1}):
+	if not get_pricing_rule_index().transaction_types.get(args.transaction_type):
 		return
 
 	for apply_on in ["Item Code", "Item Group", "Brand"]:
@@ -96,82 +98,228 @@ def filter_pricing_rule_based_on_condition(pricing_rules, doc=None):
 
 
 def _get_pricing_rules(apply_on, args, values):
+	"""Active pricing rules (one row per matching apply on row) for the item in `args`,
+	looked up in the pricing rule index"""
 	apply_on_field = frappe.scrub(apply_on)
 
 	if not args.get(apply_on_field):
 		return []
 
-	child_doc = "`tabPricing Rule {0}`".format(apply_on)
+	index = get_pricing_rule_index()
+	rows_by_value = index.apply_on_rows[apply_on_field]
+	value = args.get(apply_on_field)
 
-	conditions = item_variant_condition = item_conditions = ""
-	values[apply_on_field] = args.get(apply_on_field)
-	if apply_on_field in ["item_code", "brand"]:
-		item_conditions = "{child_doc}.{apply_on_field}= %({apply_on_field})s".format(
-			child_doc=child_doc, apply_on_field=apply_on_field
-		)
+	def match_uom(row):
+		return not args.get("uom") or (row.uom or "") in ("", args.get("uom"))
 
-		if apply_on_field == "item_code":
-			if args.get("uom", None):
-				item_conditions += (
-					" and ({child_doc}.uom='{item_uom}' or IFNULL({child_doc}.uom, '')='')".format(
-						child_doc=child_doc, item_uom=args.get("uom")
-					)
-				)
-			if "variant_of" not in args:
-				args.variant_of = frappe.get_cached_value("Item", args.item_code, "variant_of")
+	if apply_on_field == "item_code":
+		if "variant_of" not in args:
+			args.variant_of = frappe.get_cached_value("Item", args.item_code, "variant_of")
 
-			if args.variant_of:
-				item_variant_condition = " or {child_doc}.item_code=%(variant_of)s ".format(
-					child_doc=child_doc
-				)
-				values["variant_of"] = args.variant_of
+		rows = [row for row in rows_by_value.get(value, []) if match_uom(row)]
+		if args.variant_of:
+			rows.extend(rows_by_value.get(args.variant_of, []))
 	elif apply_on_field == "item_group":
-		item_conditions = _get_tree_conditions(args, "Item Group", child_doc, False)
-		if args.get("uom", None):
-			item_conditions += (
-				" and ({child_doc}.uom='{item_uom}' or IFNULL({child_doc}.uom, '')='')".format(
-					child_doc=child_doc, item_uom=args.get("uom")
-				)
-			)
-	conditions += get_other_conditions(conditions, values, args)
-	warehouse_conditions = _get_tree_conditions(args, "Warehouse", "`tabPricing Rule`")
-	if warehouse_conditions:
-		warehouse_conditions = " and {0}".format(warehouse_conditions)
+		rows = [
+			row
+			for item_group in get_tree_ancestors(index, "Item Group", value)
+			for row in rows_by_value.get(item_group, [])
+			if match_uom(row)
+		]
+	else:
+		rows = list(rows_by_value.get(value, []))
+
+	# rules applied on other items list all of their apply on rows
+	for pricing_rule in index.apply_on_other[apply_on_field].get(value, []):
+		rows.extend(index.rows_by_rule[apply_on_field].get(pricing_rule, []))
 
 	if not args.price_list:
 		args.price_list = None
 
-	conditions += " and ifnull(`tabPricing Rule`.for_price_list, '') in (%(price_list)s, '')"
-	values["price_list"] = args.get("price_list")
-
-	pricing_rules = (
-		frappe.db.sql(
-			"""select `tabPricing Rule`.*,
-			{child_doc}.{apply_on_field}, {child_doc}.uom
-		from `tabPricing Rule`, {child_doc}
-		where ({item_conditions} or (`tabPricing Rule`.apply_rule_on_other is not null
-			and `tabPricing Rule`.{apply_on_other_field}=%({apply_on_field})s) {item_variant_condition})
-			and {child_doc}.parent = `tabPricing Rule`.name
-			and `tabPricing Rule`.disable = 0 and
-			`tabPricing Rule`.{transaction_type} = 1 {warehouse_cond} {conditions}
-		order by `tabPricing Rule`.priority desc,
-			`tabPricing Rule`.name desc""".format(
-				child_doc=child_doc,
-				apply_on_field=apply_on_field,
-				item_conditions=item_conditions,
-				item_variant_condition=item_variant_condition,
-				transaction_type=args.transaction_type,
-				warehouse_cond=warehouse_conditions,
-				apply_on_other_field="other_{0}".format(apply_on_field),
-				conditions=conditions,
-			),
-			values,
-			as_dict=1,
+	pricing_rules = []
+	for row in {row.name: row for row in rows}.values():
+		pricing_rule = index.pricing_rules[row.parent]
+		if match_pricing_rule_conditions(index, pricing_rule, args):
+			pricing_rules.append(
+				frappe._dict(pricing_rule, **{apply_on_field: row.get(apply_on_field), "uom": row.uom})
+			)
+
+	return sorted(
+		pricing_rules,
+		key=lambda d: (d.priority is not None, cstr(d.priority), d.name),
+		reverse=True,
+	)
+
+
+def match_pricing_rule_conditions(index, pricing_rule, args):
+	"""Python version of the conditions of `get_other_conditions`, the warehouse and
+	the price list for a pricing rule from the index"""
+	if not cint(pricing_rule.get(args.transaction_type)):
+		return False
+
+	for field in ["company", "customer", "supplier", "campaign", "sales_partner"]:
+		if (pricing_rule.get(field) or "") not in ("", args.get(field) or ""):
+			return False
+
+	for parenttype in ["Customer Group", "Territory", "Supplier Group", "Warehouse"]:
+		field = frappe.scrub(parenttype)
+		if (
+			args.get(field)
+			and pricing_rule.get(field)
+			and pricing_rule.get(field) not in get_tree_ancestors(index, parenttype, args.get(field))
+		):
+			return False
+
+	if args.get("transaction_date") and not (
+		getdate(pricing_rule.valid_from or "2000-01-01")
+		<= getdate(args.get("transaction_date"))
+		<= getdate(pricing_rule.valid_upto or "2500-12-31")
+	):
+		return False
+
+	if args.get("doctype") in [
+		"Quotation",
+		"Quotation Item",
+		"Sales Order",
+		"Sales Order Item",
+		"Delivery Note",
+		"Delivery Note Item",
+		"Sales Invoice",
+		"Sales Invoice Item",
+		"POS Invoice",
+		"POS Invoice Item",
+	]:
+		if not cint(pricing_rule.selling):
+			return False
+	elif not cint(pricing_rule.buying):
+		return False
+
+	return (pricing_rule.for_price_list or "") in ("", args.price_list or "")
+
+
+def get_pricing_rule_index():
+	"""Active pricing rules with their apply on rows keyed by item code, item group and brand,
+	and the ancestors of every tree node a pricing rule can be restricted to.
+
+	Kept in redis until a Pricing Rule, Promotional Scheme or tree node changes, and
+	loaded once per request.
+	"""
+	if frappe.flags.pricing_rule_index is None:
+		frappe.flags.pricing_rule_index = frappe.cache().get_value(
+			PRICING_RULE_INDEX_KEY, generator=build_pricing_rule_index
 		)
-		or []
+
+	return frappe.flags.pricing_rule_index
+
+
+def build_pricing_rule_index():
+	pricing_rules = {
+		d.name: d for d in frappe.get_all("Pricing Rule", filters={"disable": 0}, fields=["*"])
+	}
+
+	index = frappe._dict(
+		pricing_rules=pricing_rules,
+		transaction_types={
+			transaction_type: any(cint(d.get(transaction_type)) for d in pricing_rules.values())
+			for transaction_type in ["selling", "buying"]
+		},
+		apply_on_rows={},
+		rows_by_rule={},
+		apply_on_other={},
+		trees={},
+		roots={},
 	)
 
-	return pricing_rules
+	for apply_on in ["Item Code", "Item Group", "Brand"]:
+		apply_on_field = frappe.scrub(apply_on)
+		apply_on_rows = index.apply_on_rows[apply_on_field] = {}
+		rows_by_rule = index.rows_by_rule[apply_on_field] = {}
+		apply_on_other = index.apply_on_other[apply_on_field] = {}
+
+		for row in frappe.get_all(
+			"Pricing Rule {0}".format(apply_on),
+			filters={"parenttype": "Pricing Rule"},
+			fields=["name", "parent", apply_on_field, "uom"],
+			order_by="parent, idx",
+		):
+			if row.parent in pricing_rules:
+				apply_on_rows.setdefault(row.get(apply_on_field), []).append(row)
+				rows_by_rule.setdefault(row.parent, []).append(row)
+
+		for pricing_rule in pricing_rules.values():
+			other_value = pricing_rule.get("other_{0}".format(apply_on_field))
+			if pricing_rule.apply_rule_on_other is not None and other_value:
+				apply_on_other.setdefault(other_value, []).append(pricing_rule.name)
+
+	for parenttype in ["Item Group", "Customer Group", "Territory", "Supplier Group", "Warehouse"]:
+		parent_field = "parent_{0}".format(frappe.scrub(parenttype))
+		parents = dict(frappe.get_all(parenttype, fields=["name", parent_field], as_list=True))
+
+		ancestors = index.trees[parenttype] = {}
+		for name in parents:
+			ancestors[name] = get_ancestors_from_parents(name, parents)
+
+		if parenttype in ["Customer Group", "Item Group", "Territory"]:
+			index.roots[parenttype] = get_tree_root(parenttype)
+
+	return index
+
+
+def get_ancestors_from_parents(name, parents):
+	ancestors = [name]
+	while parents.get(ancestors[-1]) and parents[ancestors[-1]] not in ancestors:
+		ancestors.append(parents[ancestors[-1]])
+
+	return ancestors
+
+
+def get_tree_root(parenttype):
+	parent_field = "parent_{0}".format(frappe.scrub(parenttype))
+	root_name = frappe.db.get_list(
+		parenttype,
+		{"is_group": 1, parent_field: ("is", "not set")},
+		"name",
+		as_list=1,
+		ignore_permissions=True,
+	)
+
+	return root_name[0][0] if root_name and root_name[0][0] else None
+
+
+def get_tree_ancestors(index, parenttype, name):
+	"""`name` and its ancestors, as matched by `_get_tree_conditions`"""
+	ancestors = index.trees[parenttype].get(name)
+	if ancestors is None:
+		# created after the index was built
+		try:
+			lft, rgt = frappe.db.get_value(parenttype, name, ["lft", "rgt"])
+		except TypeError:
+			frappe.throw(_("Invalid {0}").format(name))
+
+		ancestors = index.trees[parenttype][name] = frappe.db.sql_list(
+			"""select name from `tab%s`
+			where lft<=%s and rgt>=%s"""
+			% (parenttype, "%s", "%s"),
+			(lft, rgt),
+		)
+
+	root = index.roots.get(parenttype)
+	if root and root not in ancestors:
+		ancestors = ancestors + [root]
+
+	return ancestors
+
+
+def clear_pricing_rule_index(doc=None, method=None, *args, **kwargs):
+	delete_pricing_rule_index()
+
+	# requests running meanwhile may cache the index built from the rows before this commit
+	frappe.db.after_commit.add(delete_pricing_rule_index)
+
+
+def delete_pricing_rule_index():
+	frappe.cache().delete_value(PRICING_RULE_INDEX_KEY)
+	frappe.flags.pricing_rule_index = None
 
 
 def apply_multiple_pricing_rules(pricing_rules):
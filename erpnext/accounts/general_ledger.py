@@ -14,7 +14,11 @@ from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 )
 from erpnext.accounts.doctype.budget.budget import validate_expense_against_budget
-from erpnext.accounts.utils import create_payment_ledger_entry
+from erpnext.accounts.doctype.daily_account_balance.daily_account_balance import (
+	update_account_balances,
+)
+from erpnext.accounts.doctype.gl_entry.gl_entry import make_gl_entries_in_bulk
+from erpnext.accounts.utils import create_payment_ledger_entry, use_bulk_ledger_posting
 
 
 class ClosedAccountingPeriod(frappe.ValidationError):
@@ -321,6 +325,10 @@ def save_entries(gl_map, adv_adj, update_outstanding, from_repost=False):
 	if gl_map:
 		check_freezing_date(gl_map[0]["posting_date"], adv_adj)
 
+	if gl_map and use_bulk_ledger_posting():
+		make_entries_in_bulk(gl_map, adv_adj, update_outstanding, from_repost)
+		return
+
 	for entry in gl_map:
 		make_entry(entry, adv_adj, update_outstanding, from_repost)
 
@@ -339,6 +347,14 @@ def make_entry(args, adv_adj, update_outstanding, from_repost=False):
 		validate_expense_against_budget(args)
 
 
+def make_entries_in_bulk(gl_map, adv_adj, update_outstanding, from_repost=False):
+	make_gl_entries_in_bulk(gl_map, adv_adj, update_outstanding or "Yes", from_repost)
+
+	for args in gl_map:
+		if not from_repost and args.get("voucher_type") != "Period Closing Voucher":
+			validate_expense_against_budget(args)
+
+
 def validate_cwip_accounts(gl_map):
 	"""Validate that CWIP account are not used in Journal Entry"""
 	if gl_map and gl_map[0].voucher_type != "Journal Entry":
@@ -523,16 +539,21 @@ def make_reverse_gl_entries(
 	and make reverse gl entries by swapping debit and credit
 	"""
 
+	if gl_entries:
+		voucher_type, voucher_no = gl_entries[0]["voucher_type"], gl_entries[0]["voucher_no"]
+
+	gl_entry = frappe.qb.DocType("GL Entry")
+	posted_gl_entries = (
+		frappe.qb.from_(gl_entry)
+		.select("*")
+		.where(gl_entry.voucher_type == voucher_type)
+		.where(gl_entry.voucher_no == voucher_no)
+		.where(gl_entry.is_cancelled == 0)
+		.for_update()
+	).run(as_dict=1)
+
 	if not gl_entries:
-		gl_entry = frappe.qb.DocType("GL Entry")
-		gl_entries = (
-			frappe.qb.from_(gl_entry)
-			.select("*")
-			.where(gl_entry.voucher_type == voucher_type)
-			.where(gl_entry.voucher_no == voucher_no)
-			.where(gl_entry.is_cancelled == 0)
-			.for_update()
-		).run(as_dict=1)
+		gl_entries = posted_gl_entries
 
 	if gl_entries:
 		create_payment_ledger_entry(
@@ -541,7 +562,10 @@ def make_reverse_gl_entries(
 		validate_accounting_period(gl_entries)
 		check_freezing_date(gl_entries[0]["posting_date"], adv_adj)
 		set_as_cancel(gl_entries[0]["voucher_type"], gl_entries[0]["voucher_no"])
+		# subtract what was posted (merged, with round off), not the gl_map passed for cancellation
+		update_account_balances(posted_gl_entries, cancel=True)
 
+		new_gl_entries = []
 		for entry in gl_entries:
 			new_gle = copy.deepcopy(entry)
 			new_gle["name"] = None
@@ -560,7 +584,14 @@ def make_reverse_gl_entries(
 			new_gle["is_cancelled"] = 1
 
 			if new_gle["debit"] or new_gle["credit"]:
-				make_entry(new_gle, adv_adj, "Yes")
+				new_gl_entries.append(new_gle)
+
+		if new_gl_entries and use_bulk_ledger_posting():
+			make_entries_in_bulk(new_gl_entries, adv_adj, "Yes")
+			return
+
+		for new_gle in new_gl_entries:
+			make_entry(new_gle, adv_adj, "Yes")
 
 
 def check_freezing_date(posting_date, adv_adj=False):
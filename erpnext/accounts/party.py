@@ -754,6 +754,10 @@ def get_timeline_data(doctype, name):
 
 
 def get_dashboard_info(party_type, party, loyalty_program=None):
+	from erpnext.accounts.doctype.party_ageing_snapshot.party_ageing_snapshot import (
+		get_snapshot_outstanding,
+	)
+
 	current_fiscal_year = get_fiscal_year(nowdate(), as_dict=True)
 
 	doctype = "Sales Invoice" if party_type == "Customer" else "Purchase Invoice"
@@ -805,17 +809,26 @@ def get_dashboard_info(party_type, party, loyalty_program=None):
 			d.company, {"grand_total": d.grand_total, "base_grand_total": d.base_grand_total}
 		)
 
-	company_wise_total_unpaid = frappe._dict(
-		frappe.db.sql(
+	# outstanding from the ageing snapshots, as debit - credit like the GL Entries
+	company_wise_total_unpaid = frappe._dict()
+	for d in companies:
+		outstanding = get_snapshot_outstanding(d.company, party_type, party)
+		if outstanding is not None:
+			company_wise_total_unpaid[d.company] = (
+				-outstanding if party_type == "Supplier" else outstanding
+			)
+
+	if len(company_wise_total_unpaid) < len(companies):
+		for company, total_unpaid in frappe.db.sql(
 			"""
-		select company, sum(debit_in_account_currency) - sum(credit_in_account_currency)
-		from `tabGL Entry`
-		where party_type = %s and party=%s
-		and is_cancelled = 0
-		group by company""",
+			select company, sum(debit_in_account_currency) - sum(credit_in_account_currency)
+			from `tabGL Entry`
+			where party_type = %s and party=%s
+			and is_cancelled = 0
+			group by company""",
 			(party_type, party),
-		)
-	)
+		):
+			company_wise_total_unpaid.setdefault(company, total_unpaid)
 
 	for d in companies:
 		company_default_currency = frappe.db.get_value("Company", d.company, "default_currency")
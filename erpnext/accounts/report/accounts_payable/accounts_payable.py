@@ -2,12 +2,12 @@
 # License: GNU General Public License v3. See license.txt
 
 
-from erpnext.accounts.report.accounts_receivable.accounts_receivable import ReceivablePayableReport
+from erpnext.accounts.report.accounts_receivable.accounts_receivable import (
+	REPORT_ARGS,
+	ReceivablePayableReport,
+)
 
 
 def execute(filters=None):
-	args = {
-		"party_type": "Supplier",
-		"naming_by": ["Buying Settings", "supp_master_name"],
-	}
+	args = REPORT_ARGS["Accounts Payable"]
 	return ReceivablePayableReport(filters).run(args)
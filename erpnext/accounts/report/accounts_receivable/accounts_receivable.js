@@ -217,6 +217,16 @@ frappe.query_reports["Accounts Receivable"] = {
 			var filters = report.get_values();
 			frappe.set_route('query-report', 'Accounts Receivable Summary', {company: filters.company});
 		});
+
+		report.page.add_inner_button(__("Export CSV in Background"), function() {
+			frappe.call({
+				method: "erpnext.accounts.report.accounts_receivable.accounts_receivable.export_report_in_background",
+				args: {
+					report_name: "Accounts Receivable",
+					filters: report.get_values()
+				}
+			});
+		});
 	}
 }
 
@@ -1,7 +1,7 @@
 # Copyright (c) 2015, Frappe Technologies Pvt. Ltd.
 # License: GNU General Public License v3. See license.txt
 
-
+import csv
 from collections import OrderedDict
 
 import frappe
@@ -32,18 +32,89 @@ from erpnext.accounts.utils import get_currency_precision
 # 10. This reports is based on all GL Entries that are made against account_type "Receivable" or "Payable"
 
 
-def execute(filters=None):
-	args = {
+REPORT_ARGS = {
+	"Accounts Receivable": {
 		"party_type": "Customer",
 		"naming_by": ["Selling Settings", "cust_master_name"],
-	}
+	},
+	"Accounts Payable": {
+		"party_type": "Supplier",
+		"naming_by": ["Buying Settings", "supp_master_name"],
+	},
+}
+
+
+def execute(filters=None):
+	args = REPORT_ARGS["Accounts Receivable"]
 	return ReceivablePayableReport(filters).run(args)
 
 
+@frappe.whitelist()
+def export_report_in_background(report_name, filters):
+	"""Queue a CSV export of Accounts Receivable / Payable, built party chunk by party chunk"""
+	if report_name not in REPORT_ARGS:
+		frappe.throw(_("CSV export is not available for {0}").format(report_name))
+
+	if not frappe.get_doc("Report", report_name).is_permitted():
+		frappe.throw(
+			_("You don't have access to Report: {0}").format(report_name), frappe.PermissionError
+		)
+
+	frappe.enqueue(
+		"erpnext.accounts.report.accounts_receivable.accounts_receivable.export_report_to_csv",
+		queue="long",
+		timeout=7200,
+		report_name=report_name,
+		filters=frappe.parse_json(filters),
+	)
+	frappe.msgprint(
+		_("{0} is being exported in the background. You will be notified when it is ready.").format(
+			_(report_name)
+		),
+		alert=True,
+	)
+
+
+def export_report_to_csv(report_name, filters):
+	"""Write the report rows to a private CSV file as they are built and notify the user"""
+	report = ReceivablePayableReport(filters)
+	chunks = report.run_in_chunks(REPORT_ARGS[report_name])
+	fields = [column.get("fieldname") for column in report.columns]
+
+	file_name = "{0} {1} {2}.csv".format(
+		report_name, report.filters.report_date, frappe.generate_hash(length=6)
+	)
+	with open(frappe.get_site_path("private", "files", file_name), "w", newline="") as f:
+		writer = csv.writer(f)
+		writer.writerow([column.get("label") for column in report.columns])
+		for rows in chunks:
+			writer.writerows([[cstr(row.get(field)) for field in fields] for row in rows])
+
+	_file = frappe.get_doc(
+		{
+			"doctype": "File",
+			"file_name": file_name,
+			"file_url": "/private/files/" + file_name,
+			"is_private": True,
+		}
+	)
+	_file.insert(ignore_permissions=True)
+
+	frappe.publish_realtime(
+		"msgprint",
+		_("{0} export is ready: {1}").format(
+			_(report_name), "<a href='{0}'>{1}</a>".format(_file.file_url, file_name)
+		),
+		user=frappe.session.user,
+	)
+	return _file
+
+
 class ReceivablePayableReport(object):
 	def __init__(self, filters=None):
 		self.filters = frappe._dict(filters or {})
 		self.qb_selection_filter = []
+		self.parties = None
 		self.ple = qb.DocType("Payment Ledger Entry")
 		self.filters.report_date = getdate(self.filters.report_date or nowdate())
 		self.age_as_on = (
@@ -63,6 +134,42 @@ class ReceivablePayableReport(object):
 		self.get_chart_data()
 		return self.columns, self.data, None, self.chart, None, self.skip_total_row
 
+	def run_in_chunks(self, args, chunk_size=500, parties=None):
+		"""
+		Columns are set right away, rows are returned by a generator yielding one list of rows
+		(and subtotals) per chunk of `chunk_size` parties, ordered by party. `parties` limits the
+		report to the given parties.
+
+		Ledger entries, invoice details and future payments are fetched per chunk, so memory
+		depends on the parties of a chunk instead of the whole ledger.
+		"""
+		self.filters.update(args)
+		self.set_defaults()
+		self.party_naming_by = frappe.db.get_value(
+			args.get("naming_by")[0], None, args.get("naming_by")[1]
+		)
+		self.get_columns()
+		self.get_sales_invoices_or_customers_based_on_sales_person()
+		self.get_exchange_rate_revaluations()
+
+		return self.get_data_in_chunks(chunk_size, parties)
+
+	def get_data_in_chunks(self, chunk_size, parties=None):
+		if parties is None:
+			parties = self.get_parties()
+		else:
+			parties = sorted(parties)
+
+		has_rows = False
+		for start in range(0, len(parties), chunk_size):
+			self.get_data(parties[start : start + chunk_size])
+			if self.data:
+				has_rows = True
+				yield self.data
+
+		if self.filters.get("group_by_party") and has_rows:
+			yield [self.total_row_map.get("Total")]
+
 	def set_defaults(self):
 		if not self.filters.get("company"):
 			self.filters.company = frappe.db.get_single_value("Global Defaults", "default_company")
@@ -81,9 +188,17 @@ class ReceivablePayableReport(object):
 			self.total_row_map = {}
 			self.skip_total_row = 1
 
-	def get_data(self):
+	def get_data(self, parties=None):
+		self.parties = parties
 		self.get_ple_entries()
-		self.get_sales_invoices_or_customers_based_on_sales_person()
+
+		if parties:
+			# sales persons and revaluations are fetched once in `run_in_chunks`
+			self.invoices = set()
+			self.party_details = {}
+		else:
+			self.get_sales_invoices_or_customers_based_on_sales_person()
+
 		self.voucher_balance = OrderedDict()
 		self.init_voucher_balance()  # invoiced, paid, credit_note, outstanding
 
@@ -100,7 +215,8 @@ class ReceivablePayableReport(object):
 		self.get_return_entries()
 
 		# Get Exchange Rate Revaluations
-		self.get_exchange_rate_revaluations()
+		if not parties:
+			self.get_exchange_rate_revaluations()
 
 		self.data = []
 
@@ -279,7 +395,11 @@ class ReceivablePayableReport(object):
 
 		if self.filters.get("group_by_party"):
 			self.append_subtotal_row(self.previous_party)
-			if self.data:
+			if self.parties:
+				# the total row follows the last chunk of parties
+				self.previous_party = ""
+				self.total_row_map = {"Total": self.total_row_map.get("Total")}
+			elif self.data:
 				self.data.append(self.total_row_map.get("Total"))
 
 	def append_row(self, row):
@@ -351,14 +471,25 @@ class ReceivablePayableReport(object):
 
 	def get_invoice_details(self):
 		self.invoice_details = frappe._dict()
+
+		# only the vouchers of the current chunk of parties
+		voucher_condition, parent_condition = "", ""
+		values = {"report_date": self.filters.report_date}
+		if self.parties:
+			voucher_condition = "and name in %(vouchers)s"
+			parent_condition = "and parent in %(vouchers)s"
+			values["vouchers"] = tuple({key[1] for key in self.voucher_balance}) or ("",)
+
 		if self.party_type == "Customer":
 			si_list = frappe.db.sql(
 				"""
 				select name, due_date, po_no
 				from `tabSales Invoice`
-				where posting_date <= %s
-			""",
-				self.filters.report_date,
+				where posting_date <= %(report_date)s {0}
+			""".format(
+					voucher_condition
+				),
+				values,
 				as_dict=1,
 			)
 			for d in si_list:
@@ -370,8 +501,11 @@ class ReceivablePayableReport(object):
 					"""
 					select parent, sales_person
 					from `tabSales Team`
-					where parenttype = 'Sales Invoice'
-				""",
+					where parenttype = 'Sales Invoice' {0}
+				""".format(
+						parent_condition
+					),
+					values,
 					as_dict=1,
 				)
 				for d in sales_team:
@@ -384,9 +518,11 @@ class ReceivablePayableReport(object):
 				"""
 				select name, due_date, bill_no, bill_date
 				from `tabPurchase Invoice`
-				where posting_date <= %s
-			""",
-				self.filters.report_date,
+				where posting_date <= %(report_date)s {0}
+			""".format(
+					voucher_condition
+				),
+				values,
 				as_dict=1,
 			):
 				self.invoice_details.setdefault(pi.name, pi)
@@ -396,9 +532,11 @@ class ReceivablePayableReport(object):
 			"""
 			select name, due_date, bill_no, bill_date
 			from `tabJournal Entry`
-			where posting_date <= %s
-		""",
-			self.filters.report_date,
+			where posting_date <= %(report_date)s {0}
+		""".format(
+				voucher_condition
+			),
+			values,
 			as_dict=1,
 		)
 
@@ -520,6 +658,10 @@ class ReceivablePayableReport(object):
 					if d.future_amount and d.invoice_no:
 						self.future_payments.setdefault((d.invoice_no, d.party), []).append(d)
 
+	def get_party_condition(self, party_field):
+		"Restrict a query to the current chunk of parties"
+		return "and {0} in %(parties)s".format(party_field) if self.parties else ""
+
 	def get_future_payments_from_payment_entry(self):
 		return frappe.db.sql(
 			"""
@@ -536,10 +678,17 @@ class ReceivablePayableReport(object):
 				(ref.parent = payment_entry.name)
 			where
 				payment_entry.docstatus < 2
-				and payment_entry.posting_date > %s
-				and payment_entry.party_type = %s
-			""",
-			(self.filters.report_date, self.party_type),
+				and payment_entry.posting_date > %(report_date)s
+				and payment_entry.party_type = %(party_type)s
+				{0}
+			""".format(
+				self.get_party_condition("payment_entry.party")
+			),
+			{
+				"report_date": self.filters.report_date,
+				"party_type": self.party_type,
+				"parties": self.parties,
+			},
 			as_dict=1,
 		)
 
@@ -568,15 +717,20 @@ class ReceivablePayableReport(object):
 				(jea.parent = je.name)
 			where
 				je.docstatus < 2
-				and je.posting_date > %s
-				and jea.party_type = %s
+				and je.posting_date > %(report_date)s
+				and jea.party_type = %(party_type)s
 				and jea.reference_name is not null and jea.reference_name != ''
+				{1}
 			group by je.name, jea.reference_name
 			having future_amount > 0
 			""".format(
-				amount_field
+				amount_field, self.get_party_condition("jea.party")
 			),
-			(self.filters.report_date, self.party_type),
+			{
+				"report_date": self.filters.report_date,
+				"party_type": self.party_type,
+				"parties": self.parties,
+			},
 			as_dict=1,
 		)
 
@@ -613,6 +767,8 @@ class ReceivablePayableReport(object):
 		party_field = scrub(self.filters.party_type)
 		if self.filters.get(party_field):
 			filters.update({party_field: self.filters.get(party_field)})
+		elif self.parties:
+			filters.update({party_field: ("in", self.parties)})
 		self.return_entries = frappe._dict(
 			frappe.get_all(doctype, filters, ["name", "return_against"], as_list=1)
 		)
@@ -666,9 +822,22 @@ class ReceivablePayableReport(object):
 			index = 4
 		row["range" + str(index + 1)] = row.outstanding
 
-	def get_ple_entries(self):
-		# get all the GL entries filtered by the given filters
+	def get_parties(self):
+		"Parties with Payment Ledger Entries for the filters, in order"
+		self.set_ple_filters()
 
+		ple = self.ple
+		return (
+			qb.from_(ple)
+			.select(ple.party)
+			.distinct()
+			.where(ple.delinked == 0)
+			.where(Criterion.all(self.qb_selection_filter))
+			.orderby(ple.party)
+			.run(pluck=True)
+		)
+
+	def set_ple_filters(self):
 		self.prepare_conditions()
 
 		if self.filters.show_future_payments:
@@ -684,6 +853,13 @@ class ReceivablePayableReport(object):
 		else:
 			self.qb_selection_filter.append(self.ple.posting_date.lte(self.filters.report_date))
 
+	def get_ple_entries(self):
+		# get all the GL entries filtered by the given filters
+
+		self.set_ple_filters()
+		if self.parties:
+			self.qb_selection_filter.append(self.ple.party.isin(self.parties))
+
 		ple = qb.DocType("Payment Ledger Entry")
 		query = (
 			qb.from_(ple)
@@ -707,7 +883,7 @@ class ReceivablePayableReport(object):
 			.where(Criterion.all(self.qb_selection_filter))
 		)
 
-		if self.filters.get("group_by_party"):
+		if self.filters.get("group_by_party") or self.parties:
 			query = query.orderby(self.ple.party, self.ple.posting_date)
 		else:
 			query = query.orderby(self.ple.posting_date, self.ple.party)
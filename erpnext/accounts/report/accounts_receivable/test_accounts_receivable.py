@@ -7,7 +7,11 @@ from frappe.utils import add_days, flt, getdate, today
 from erpnext import get_default_cost_center
 from erpnext.accounts.doctype.payment_entry.payment_entry import get_payment_entry
 from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
-from erpnext.accounts.report.accounts_receivable.accounts_receivable import execute
+from erpnext.accounts.report.accounts_receivable.accounts_receivable import (
+	REPORT_ARGS,
+	ReceivablePayableReport,
+	execute,
+)
 from erpnext.selling.doctype.sales_order.test_sales_order import make_sales_order
 
 
@@ -210,6 +214,32 @@ class TestAccountsReceivable(FrappeTestCase):
 			],
 		)
 
+	def test_report_in_chunks_of_parties(self):
+		filters = {
+			"company": "_Test Company 2",
+			"report_date": today(),
+			"group_by_party": 1,
+			"range1": 30,
+			"range2": 60,
+			"range3": 90,
+			"range4": 120,
+		}
+
+		make_payment(make_sales_invoice(no_payment_schedule=True).name)
+		make_sales_invoice(no_payment_schedule=True)
+
+		data = execute(filters)[1]
+		chunks = list(
+			ReceivablePayableReport(filters).run_in_chunks(
+				REPORT_ARGS["Accounts Receivable"], chunk_size=1
+			)
+		)
+
+		# rows and subtotals of each party, the total row last
+		self.assertEqual([row for rows in chunks for row in rows], data)
+		self.assertEqual(chunks[-1], [data[-1]])
+		self.assertEqual(data[-1]["outstanding"], 160)
+
 
 def make_sales_invoice(no_payment_schedule=False, do_not_submit=False):
 	frappe.set_user("Administrator")
@@ -129,6 +129,16 @@ frappe.query_reports["Accounts Receivable Summary"] = {
 			var filters = report.get_values();
 			frappe.set_route('query-report', 'Accounts Receivable', { company: filters.company });
 		});
+
+		report.page.add_inner_button(__("Refresh Ageing Snapshot"), function() {
+			frappe.call({
+				method: "erpnext.accounts.doctype.party_ageing_snapshot.party_ageing_snapshot.enqueue_ageing_snapshot",
+				args: {
+					company: report.get_values().company,
+					party_type: "Customer"
+				}
+			});
+		});
 	}
 }
 
@@ -6,6 +6,9 @@ import frappe
 from frappe import _, scrub
 from frappe.utils import cint, flt
 
+from erpnext.accounts.doctype.party_ageing_snapshot.party_ageing_snapshot import (
+	get_receivables_from_snapshot,
+)
 from erpnext.accounts.party import get_partywise_advanced_payment_amount
 from erpnext.accounts.report.accounts_receivable.accounts_receivable import ReceivablePayableReport
 
@@ -32,7 +35,10 @@ class AccountsReceivableSummary(ReceivablePayableReport):
 	def get_data(self, args):
 		self.data = []
 
-		self.receivables = ReceivablePayableReport(self.filters).run(args)[1]
+		# start from the ageing snapshot if there is one for the filters
+		self.receivables = get_receivables_from_snapshot(self.filters, args)
+		if self.receivables is None:
+			self.receivables = ReceivablePayableReport(self.filters).run(args)[1]
 
 		self.get_party_total(args)
 
@@ -23,7 +23,9 @@ from erpnext.accounts.report.cash_flow.cash_flow import (
 )
 from erpnext.accounts.report.cash_flow.cash_flow import get_report_summary as get_cash_flow_summary
 from erpnext.accounts.report.financial_statements import (
+	accumulate_into_parents,
 	filter_out_zero_value_rows,
+	get_date_bucket,
 	get_fiscal_year_data,
 	sort_accounts,
 )
@@ -363,6 +365,7 @@ def get_data(
 			accounts_by_name,
 			accounts,
 			ignore_closing_entries=False,
+			opening_date=get_opening_date(filters, fiscal_year),
 		)
 
 	calculate_values(accounts_by_name, gl_entries_by_account, companies, filters, fiscal_year)
@@ -388,13 +391,17 @@ def get_company_currency(filters=None):
 	)
 
 
-def calculate_values(accounts_by_name, gl_entries_by_account, companies, filters, fiscal_year):
-	start_date = (
+def get_opening_date(filters, fiscal_year):
+	return (
 		fiscal_year.year_start_date
 		if filters.filter_based_on == "Fiscal Year"
 		else filters.period_start_date
 	)
 
+
+def calculate_values(accounts_by_name, gl_entries_by_account, companies, filters, fiscal_year):
+	start_date = get_opening_date(filters, fiscal_year)
+
 	for entries in gl_entries_by_account.values():
 		for entry in entries:
 			if entry.account_number:
@@ -437,22 +444,28 @@ def calculate_values(accounts_by_name, gl_entries_by_account, companies, filters
 
 def accumulate_values_into_parents(accounts, accounts_by_name, companies):
 	"""accumulate children's values in parent accounts"""
-	for d in reversed(accounts):
-		if d.parent_account:
-			account = d.parent_account_name
-
-			for company in companies:
-				accounts_by_name[account][company] = accounts_by_name[account].get(company, 0.0) + d.get(
-					company, 0.0
-				)
+	position = {d.name: idx for idx, d in enumerate(accounts)}
+	parents = [
+		position.get(accounts_by_name[d.parent_account_name].name) if d.parent_account else None
+		for d in accounts
+	]
 
-				accounts_by_name[account]["company_wise_opening_bal"][company] += d.get(
-					"company_wise_opening_bal", {}
-				).get(company, 0.0)
+	values = accumulate_into_parents(
+		[
+			[d.get(company, 0.0) for company in companies]
+			+ [d.get("company_wise_opening_bal", {}).get(company, 0.0) for company in companies]
+			+ [d.get("opening_balance", 0.0)]
+			for d in accounts
+		],
+		parents,
+	)
 
-			accounts_by_name[account]["opening_balance"] = accounts_by_name[account].get(
-				"opening_balance", 0.0
-			) + d.get("opening_balance", 0.0)
+	for d, row in zip(accounts, values):
+		d.update(zip(companies, row))
+		d.setdefault("company_wise_opening_bal", defaultdict(float)).update(
+			zip(companies, row[len(companies) :])
+		)
+		d["opening_balance"] = row[-1]
 
 
 def get_account_heads(root_type, companies, filters):
@@ -606,8 +619,13 @@ def set_gl_entries_by_account(
 	accounts_by_name,
 	accounts,
 	ignore_closing_entries=False,
+	opening_date=None,
 ):
-	"""Returns a dict like { "account": [gl entries], ... }"""
+	"""
+	Returns a dict like { "account": [gl entries], ... }
+
+	Entries are summed up per account, before and after `opening_date`.
+	"""
 
 	company_lft, company_rgt = frappe.get_cached_value(
 		"Company", filters.get("company"), ["lft", "rgt"]
@@ -628,15 +646,21 @@ def set_gl_entries_by_account(
 		{"report_date": to_date, "presentation_currency": filters.get("presentation_currency")}
 	)
 
+	date_bucket = get_date_bucket([getdate(opening_date)] if opening_date else [], "gl.posting_date")
+
 	for d in companies:
 		gl_entries = frappe.db.sql(
-			"""select gl.posting_date, gl.account, gl.debit, gl.credit, gl.is_opening, gl.company,
-			gl.fiscal_year, gl.debit_in_account_currency, gl.credit_in_account_currency, gl.account_currency,
+			"""select min(gl.posting_date) as posting_date, gl.account,
+			sum(gl.debit) as debit, sum(gl.credit) as credit, gl.is_opening, gl.company, gl.fiscal_year,
+			sum(gl.debit_in_account_currency) as debit_in_account_currency,
+			sum(gl.credit_in_account_currency) as credit_in_account_currency, gl.account_currency,
 			acc.account_name, acc.account_number
 			from `tabGL Entry` gl, `tabAccount` acc where acc.name = gl.account and gl.company = %(company)s and gl.is_cancelled = 0
 			{additional_conditions} and gl.posting_date <= %(to_date)s and acc.lft >= %(lft)s and acc.rgt <= %(rgt)s
-			order by gl.account, gl.posting_date""".format(
-				additional_conditions=additional_conditions
+			group by gl.account, {date_bucket}, gl.is_opening, gl.company, gl.fiscal_year,
+				gl.account_currency, acc.account_name, acc.account_number
+			order by gl.account, min(gl.posting_date)""".format(
+				additional_conditions=additional_conditions, date_bucket=date_bucket
 			),
 			{
 				"from_date": from_date,
@@ -5,6 +5,7 @@
 import functools
 import math
 import re
+from bisect import bisect_left
 
 import frappe
 from frappe import _
@@ -14,6 +15,9 @@ from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 	get_dimension_with_children,
 )
+from erpnext.accounts.doctype.daily_account_balance.daily_account_balance import (
+	can_use_account_balances,
+)
 from erpnext.accounts.report.utils import convert_to_presentation_currency, get_currency
 from erpnext.accounts.utils import get_fiscal_year
 
@@ -188,6 +192,7 @@ def get_data(
 			filters,
 			gl_entries_by_account,
 			ignore_closing_entries=ignore_closing_entries,
+			period_list=period_list,
 		)
 
 	calculate_values(
@@ -221,6 +226,9 @@ def calculate_values(
 	accumulated_values,
 	ignore_accumulated_values_for_fy,
 ):
+	to_dates = [period.to_date for period in period_list]
+	movements_by_account = {}
+
 	for entries in gl_entries_by_account.values():
 		for entry in entries:
 			d = accounts_by_name.get(entry.account)
@@ -230,31 +238,66 @@ def calculate_values(
 					title="Error",
 					raise_exception=1,
 				)
-			for period in period_list:
-				# check if posting date is within the period
 
-				if entry.posting_date <= period.to_date:
-					if (accumulated_values or entry.posting_date >= period.from_date) and (
-						not ignore_accumulated_values_for_fy or entry.fiscal_year == period.to_date_fiscal_year
-					):
-						d[period.key] = d.get(period.key, 0.0) + flt(entry.debit) - flt(entry.credit)
+			amount = flt(entry.debit) - flt(entry.credit)
+
+			# first period ending on or after the posting date, later periods only accumulate it
+			idx = bisect_left(to_dates, entry.posting_date)
+			if idx < len(period_list) and (
+				accumulated_values or entry.posting_date >= period_list[idx].from_date
+			):
+				fiscal_year = entry.fiscal_year if ignore_accumulated_values_for_fy else None
+				movements = movements_by_account.setdefault(entry.account, {}).setdefault(idx, {})
+				movements[fiscal_year] = movements.get(fiscal_year, 0.0) + amount
 
 			if entry.posting_date < period_list[0].year_start_date:
-				d["opening_balance"] = d.get("opening_balance", 0.0) + flt(entry.debit) - flt(entry.credit)
+				d["opening_balance"] = d.get("opening_balance", 0.0) + amount
+
+	for account, movements in movements_by_account.items():
+		d = accounts_by_name[account]
+		balances = {}
+		for idx, period in enumerate(period_list):
+			if not accumulated_values:
+				balances = {}
+
+			for fiscal_year, amount in movements.get(idx, {}).items():
+				balances[fiscal_year] = balances.get(fiscal_year, 0.0) + amount
+
+			if ignore_accumulated_values_for_fy:
+				d[period.key] = d.get(period.key, 0.0) + balances.get(period.to_date_fiscal_year, 0.0)
+			else:
+				d[period.key] = d.get(period.key, 0.0) + sum(balances.values())
 
 
 def accumulate_values_into_parents(accounts, accounts_by_name, period_list):
 	"""accumulate children's values in parent accounts"""
-	for d in reversed(accounts):
-		if d.parent_account:
-			for period in period_list:
-				accounts_by_name[d.parent_account][period.key] = accounts_by_name[d.parent_account].get(
-					period.key, 0.0
-				) + d.get(period.key, 0.0)
+	keys = [period.key for period in period_list] + ["opening_balance"]
+	position = {d.name: idx for idx, d in enumerate(accounts)}
+
+	values = accumulate_into_parents(
+		[[d.get(key, 0.0) for key in keys] for d in accounts],
+		[position.get(d.parent_account) for d in accounts],
+	)
+	for d, row in zip(accounts, values):
+		d.update(zip(keys, row))
+
 
-			accounts_by_name[d.parent_account]["opening_balance"] = accounts_by_name[d.parent_account].get(
-				"opening_balance", 0.0
-			) + d.get("opening_balance", 0.0)
+def accumulate_into_parents(values, parents):
+	"""
+	Add the values of each account to its parent, children first.
+
+	`values` has one list of values per account in tree order (parents before children) and
+	`parents` the position of the parent of each account, or None for roots. The lists are
+	updated in place and returned.
+	"""
+	for idx in reversed(range(len(values))):
+		parent = parents[idx]
+		if parent is not None:
+			parent_values = values[parent]
+			for i, value in enumerate(values[idx]):
+				parent_values[i] += value
+
+	return values
 
 
 def prepare_data(accounts, balance_must_be, period_list, company_currency):
@@ -416,10 +459,19 @@ def set_gl_entries_by_account(
 	filters,
 	gl_entries_by_account,
 	ignore_closing_entries=False,
+	period_list=None,
 ):
-	"""Returns a dict like { "account": [gl entries], ... }"""
+	"""
+	Returns a dict like { "account": [gl entries], ... }
 
-	additional_conditions = get_additional_conditions(from_date, ignore_closing_entries, filters)
+	Entries are summed up per account and period of `period_list` (per day without periods),
+	each with the first posting date of the entries it adds up.
+	"""
+
+	use_account_balances = can_use_account_balances(filters)
+	additional_conditions = get_additional_conditions(
+		from_date, ignore_closing_entries, filters, use_account_balances
+	)
 
 	accounts = frappe.db.sql_list(
 		"""select name from `tabAccount`
@@ -446,15 +498,27 @@ def set_gl_entries_by_account(
 			if value:
 				gl_filters.update({key: value})
 
+		# daily balances have one row per account, cost center and day instead of every GL Entry
+		table = "tabDaily Account Balance" if use_account_balances else "tabGL Entry"
+		if not use_account_balances:
+			additional_conditions += " and is_cancelled = 0"
+
+		date_bucket = (
+			get_date_bucket(get_period_boundaries(period_list)) if period_list else "posting_date"
+		)
+
 		gl_entries = frappe.db.sql(
 			"""
-			select posting_date, account, debit, credit, is_opening, fiscal_year,
-				debit_in_account_currency, credit_in_account_currency, account_currency from `tabGL Entry`
+			select min(posting_date) as posting_date, account,
+				sum(debit) as debit, sum(credit) as credit, is_opening, fiscal_year,
+				sum(debit_in_account_currency) as debit_in_account_currency,
+				sum(credit_in_account_currency) as credit_in_account_currency, account_currency
+			from `{table}`
 			where company=%(company)s
 			{additional_conditions}
 			and posting_date <= %(to_date)s
-			and is_cancelled = 0""".format(
-				additional_conditions=additional_conditions
+			group by account, {date_bucket}, is_opening, fiscal_year, account_currency""".format(
+				table=table, additional_conditions=additional_conditions, date_bucket=date_bucket
 			),
 			gl_filters,
 			as_dict=True,
@@ -469,13 +533,45 @@ def set_gl_entries_by_account(
 		return gl_entries_by_account
 
 
-def get_additional_conditions(from_date, ignore_closing_entries, filters):
+def get_period_boundaries(period_list):
+	"""Dates on which the opening or a period of `period_list` ends"""
+	boundaries = {getdate(period_list[0].year_start_date)}
+	for period in period_list:
+		boundaries.add(getdate(period.from_date))
+		boundaries.add(add_days(getdate(period.to_date), 1))
+
+	return sorted(boundaries)
+
+
+def get_date_bucket(boundaries, date_field="posting_date"):
+	"""
+	SQL expression numbering the date ranges between `boundaries`, to group GL Entries by period.
+	All entries of a range compare the same way against every boundary.
+	"""
+	if not boundaries:
+		return "0"
+
+	return "case {0} else {1} end".format(
+		" ".join(
+			"when {0} < {1} then {2}".format(date_field, frappe.db.escape(str(date)), idx)
+			for idx, date in enumerate(boundaries)
+		),
+		len(boundaries),
+	)
+
+
+def get_additional_conditions(
+	from_date, ignore_closing_entries, filters, use_account_balances=False
+):
 	additional_conditions = []
 
 	accounting_dimensions = get_accounting_dimensions(as_list=False)
 
 	if ignore_closing_entries:
-		additional_conditions.append("ifnull(voucher_type, '')!='Period Closing Voucher'")
+		if use_account_balances:
+			additional_conditions.append("is_period_closing_voucher_entry = 0")
+		else:
+			additional_conditions.append("ifnull(voucher_type, '')!='Period Closing Voucher'")
 
 	if from_date:
 		additional_conditions.append("posting_date >= %(from_date)s")
@@ -396,6 +396,7 @@ def get_column_names():
 class GrossProfitGenerator(object):
 	def __init__(self, filters=None):
 		self.sle = {}
+		self.item_warehouses_with_sle = {}
 		self.data = []
 		self.average_buying_rate = {}
 		self.filters = frappe._dict(filters)
@@ -408,6 +409,8 @@ class GrossProfitGenerator(object):
 		self.load_product_bundle()
 		self.load_non_stock_items()
 		self.get_returned_invoice_items()
+		self.load_voucher_stock_ledger_entries()
+		self.load_sales_order_buying_amounts()
 		self.process()
 
 	def process(self):
@@ -614,40 +617,39 @@ class GrossProfitGenerator(object):
 
 		return flt(buying_amount, self.currency_precision)
 
-	def calculate_buying_amount_from_sle(self, row, my_sle, parenttype, parent, item_row, item_code):
-		for i, sle in enumerate(my_sle):
-			# find the stock valution rate from stock ledger entry
-			if (
-				sle.voucher_type == parenttype
-				and parent == sle.voucher_no
-				and sle.voucher_detail_no == item_row
-			):
-				previous_stock_value = len(my_sle) > i + 1 and flt(my_sle[i + 1].stock_value) or 0.0
-
-				if previous_stock_value:
-					return abs(previous_stock_value - flt(sle.stock_value)) * flt(row.qty) / abs(flt(sle.qty))
-				else:
-					return flt(row.qty) * self.get_average_buying_rate(row, item_code)
-		return 0.0
+	def calculate_buying_amount_from_sle(
+		self, row, parenttype, parent, item_row, item_code, warehouse
+	):
+		# find the stock valution rate from stock ledger entry
+		sle = self.sle.get((parenttype, parent, item_row, item_code, warehouse))
+		if not sle:
+			return 0.0
+
+		previous_stock_value = flt(sle.previous_stock_value)
+		if previous_stock_value:
+			return abs(previous_stock_value - flt(sle.stock_value)) * flt(row.qty) / abs(flt(sle.qty))
+		else:
+			return flt(row.qty) * self.get_average_buying_rate(row, item_code)
 
 	def get_buying_amount(self, row, item_code):
 		# IMP NOTE
-		# stock_ledger_entries should already be filtered by item_code and warehouse and
-		# sorted by posting_date desc, posting_time desc
+		# stock ledger entries are loaded by `load_voucher_stock_ledger_entries` for the vouchers
+		# of the report, with the stock value of the entry before them
 		if item_code in self.non_stock_items and (row.project or row.cost_center):
 			# Issue 6089-Get last purchasing rate for non-stock item
 			item_rate = self.get_last_purchase_rate(item_code, row)
 			return flt(row.qty) * item_rate
 
 		else:
-			my_sle = self.get_stock_ledger_entries(item_code, row.warehouse)
-			if (row.update_stock or row.dn_detail) and my_sle:
+			if (row.update_stock or row.dn_detail) and self.has_stock_ledger_entries(
+				item_code, row.warehouse
+			):
 				parenttype, parent = row.parenttype, row.parent
 				if row.dn_detail:
 					parenttype, parent = "Delivery Note", row.delivery_note
 
 				return self.calculate_buying_amount_from_sle(
-					row, my_sle, parenttype, parent, row.item_row, item_code
+					row, parenttype, parent, row.item_row, item_code, row.warehouse
 				)
 			elif self.delivery_notes.get((row.parent, row.item_code), None):
 				#  check if Invoice has delivery notes
@@ -658,9 +660,8 @@ class GrossProfitGenerator(object):
 					dn["item_row"],
 					dn["warehouse"],
 				)
-				my_sle = self.get_stock_ledger_entries(item_code, row.warehouse)
 				return self.calculate_buying_amount_from_sle(
-					row, my_sle, parenttype, parent, item_row, item_code
+					row, parenttype, parent, item_row, item_code, row.warehouse
 				)
 			elif row.sales_order and row.so_detail:
 				incoming_amount = self.get_buying_amount_from_so_dn(row.sales_order, row.so_detail, item_code)
@@ -672,22 +673,39 @@ class GrossProfitGenerator(object):
 		return flt(row.qty) * self.get_average_buying_rate(row, item_code)
 
 	def get_buying_amount_from_so_dn(self, sales_order, so_detail, item_code):
+		return self.sales_order_buying_amounts.get((sales_order, so_detail, item_code), 0)
+
+	def load_sales_order_buying_amounts(self):
+		"""Incoming amount of the Delivery Note Items of each Sales Order Item, used for invoice
+		rows against a Sales Order without Delivery Note"""
 		from frappe.query_builder.functions import Sum
 
-		delivery_note_item = frappe.qb.DocType("Delivery Note Item")
+		self.sales_order_buying_amounts = {}
+		so_details = list({row.so_detail for row in self.si_list if row.sales_order and row.so_detail})
 
-		query = (
-			frappe.qb.from_(delivery_note_item)
-			.select(Sum(delivery_note_item.incoming_rate * delivery_note_item.stock_qty))
-			.where(delivery_note_item.docstatus == 1)
-			.where(delivery_note_item.item_code == item_code)
-			.where(delivery_note_item.against_sales_order == sales_order)
-			.where(delivery_note_item.so_detail == so_detail)
-			.groupby(delivery_note_item.item_code)
-		)
+		delivery_note_item = frappe.qb.DocType("Delivery Note Item")
+		for i in range(0, len(so_details), 1000):
+			query = (
+				frappe.qb.from_(delivery_note_item)
+				.select(
+					delivery_note_item.against_sales_order,
+					delivery_note_item.so_detail,
+					delivery_note_item.item_code,
+					Sum(delivery_note_item.incoming_rate * delivery_note_item.stock_qty),
+				)
+				.where(delivery_note_item.docstatus == 1)
+				.where(delivery_note_item.so_detail.isin(so_details[i : i + 1000]))
+				.groupby(
+					delivery_note_item.against_sales_order,
+					delivery_note_item.so_detail,
+					delivery_note_item.item_code,
+				)
+			)
 
-		incoming_amount = query.run()
-		return flt(incoming_amount[0][0]) if incoming_amount else 0
+			for sales_order, so_detail, item_code, incoming_amount in query.run():
+				self.sales_order_buying_amounts[(sales_order, so_detail, item_code)] = flt(
+					incoming_amount
+				)
 
 	def get_average_buying_rate(self, row, item_code):
 		args = row
@@ -946,11 +964,28 @@ class GrossProfitGenerator(object):
 			"Item", item_code, ["item_name", "description", "item_group", "brand"]
 		)
 
-	def get_stock_ledger_entries(self, item_code, warehouse):
-		if item_code and warehouse:
-			if (item_code, warehouse) not in self.sle:
-				sle = qb.DocType("Stock Ledger Entry")
-				res = (
+	def load_voucher_stock_ledger_entries(self):
+		"""
+		Load the Stock Ledger Entries of the Sales Invoices (with update stock) and Delivery Notes
+		of the report, keyed by (voucher_type, voucher_no, voucher_detail_no, item_code, warehouse),
+		instead of the whole ledger of each item and warehouse
+		"""
+		voucher_nos_by_type = {}
+		for row in self.si_list:
+			if row.update_stock and row.parent:
+				voucher_nos_by_type.setdefault(row.parenttype, set()).add(row.parent)
+			if row.dn_detail and row.delivery_note:
+				voucher_nos_by_type.setdefault("Delivery Note", set()).add(row.delivery_note)
+
+		for dn in self.delivery_notes.values():
+			voucher_nos_by_type.setdefault("Delivery Note", set()).add(dn.delivery_note)
+
+		sle = qb.DocType("Stock Ledger Entry")
+		for voucher_type in voucher_nos_by_type:
+			voucher_nos = list(voucher_nos_by_type[voucher_type])
+
+			for i in range(0, len(voucher_nos), 1000):
+				entries = (
 					qb.from_(sle)
 					.select(
 						sle.item_code,
@@ -960,22 +995,78 @@ class GrossProfitGenerator(object):
 						sle.stock_value,
 						sle.warehouse,
 						sle.actual_qty.as_("qty"),
+						sle.posting_datetime,
+						sle.creation,
 					)
 					.where(
 						(sle.company == self.filters.company)
-						& (sle.item_code == item_code)
-						& (sle.warehouse == warehouse)
+						& (sle.voucher_type == voucher_type)
+						& (sle.voucher_no.isin(voucher_nos[i : i + 1000]))
 						& (sle.is_cancelled == 0)
 					)
-					.orderby(sle.item_code)
-					.orderby(sle.warehouse, sle.posting_date, sle.posting_time, sle.creation, order=Order.desc)
+					.orderby(sle.posting_datetime, sle.creation, order=Order.desc)
 					.run(as_dict=True)
 				)
 
-				self.sle[(item_code, warehouse)] = res
+				for d in entries:
+					self.item_warehouses_with_sle[(d.item_code, d.warehouse)] = True
+					self.sle.setdefault(
+						(d.voucher_type, d.voucher_no, d.voucher_detail_no, d.item_code, d.warehouse), d
+					)
+
+		self.set_previous_stock_values(list(self.sle.values()))
+
+	def set_previous_stock_values(self, entries, chunk_size=100):
+		"""Set the stock value of the previous Stock Ledger Entry of the same item and warehouse"""
+		query = """
+			(select %s as sle_index, stock_value
+			from `tabStock Ledger Entry`
+			where company = %s
+				and item_code = %s
+				and warehouse = %s
+				and is_cancelled = 0
+				and (posting_datetime < %s or (posting_datetime = %s and creation < %s))
+			order by posting_datetime desc, creation desc
+			limit 1)"""
+
+		for start in range(0, len(entries), chunk_size):
+			chunk = entries[start : start + chunk_size]
+
+			values = []
+			for idx, d in enumerate(chunk):
+				values.extend(
+					[
+						idx,
+						self.filters.company,
+						d.item_code,
+						d.warehouse,
+						d.posting_datetime,
+						d.posting_datetime,
+						d.creation,
+					]
+				)
+
+			for idx, stock_value in frappe.db.sql(" union all ".join([query] * len(chunk)), values):
+				chunk[cint(idx)].previous_stock_value = flt(stock_value)
+
+	def has_stock_ledger_entries(self, item_code, warehouse):
+		if not (item_code and warehouse):
+			return False
+
+		if (item_code, warehouse) not in self.item_warehouses_with_sle:
+			self.item_warehouses_with_sle[(item_code, warehouse)] = bool(
+				frappe.db.exists(
+					"Stock Ledger Entry",
+					{
+						"company": self.filters.company,
+						"item_code": item_code,
+						"warehouse": warehouse,
+						"is_cancelled": 0,
+					},
+				)
+			)
 
-			return self.sle[(item_code, warehouse)]
-		return []
+		return self.item_warehouses_with_sle[(item_code, warehouse)]
 
 	def load_product_bundle(self):
 		self.product_bundles = {}
@@ -460,3 +460,29 @@ class TestGrossProfit(FrappeTestCase):
 		}
 		gp_entry = [x for x in data if x.parent_invoice == sinv.name]
 		self.assertDictContainsSubset(expected_entry, gp_entry[0])
+
+	def test_invoices_with_update_stock(self):
+		"""
+		Buying amount of invoices updating stock comes from the stock value before their own
+		Stock Ledger Entry, which can belong to another invoice
+		"""
+		make_stock_entry(
+			company=self.company, item_code=self.item, target=self.warehouse, qty=2, basic_rate=100
+		)
+
+		invoices = []
+		for i in range(2):
+			sinv = self.create_sales_invoice(qty=1, rate=150, do_not_submit=True)
+			sinv.update_stock = 1
+			invoices.append(sinv.save().submit())
+
+		filters = frappe._dict(
+			company=self.company, from_date=nowdate(), to_date=nowdate(), group_by="Invoice"
+		)
+
+		columns, data = execute(filters=filters)
+		for sinv in invoices:
+			gp_entry = [x for x in data if x.parent_invoice == sinv.name]
+			self.assertDictContainsSubset(
+				{"qty": 1.0, "buying_amount": 100.0, "gross_profit": 50.0}, gp_entry[0]
+			)
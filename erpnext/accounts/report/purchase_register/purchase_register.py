@@ -10,6 +10,9 @@ from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 	get_dimension_with_children,
 )
+from erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update import (
+	notify_pending_outstanding_updates,
+)
 
 
 def execute(filters=None):
@@ -20,6 +23,8 @@ def _execute(filters=None, additional_table_columns=None, additional_query_colum
 	if not filters:
 		filters = {}
 
+	notify_pending_outstanding_updates("Purchase Invoice")
+
 	invoice_list = get_invoices(filters, additional_query_columns)
 	columns, expense_accounts, tax_accounts, unrealized_profit_loss_accounts = get_columns(
 		invoice_list, additional_table_columns
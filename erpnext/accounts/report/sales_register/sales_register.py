@@ -11,6 +11,9 @@ from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 	get_dimension_with_children,
 )
+from erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update import (
+	notify_pending_outstanding_updates,
+)
 
 
 def execute(filters=None):
@@ -21,6 +24,8 @@ def _execute(filters, additional_table_columns=None, additional_query_columns=No
 	if not filters:
 		filters = frappe._dict({})
 
+	notify_pending_outstanding_updates("Sales Invoice")
+
 	invoice_list = get_invoices(filters, additional_query_columns)
 	columns, income_accounts, tax_accounts, unrealized_profit_loss_accounts = get_columns(
 		invoice_list, additional_table_columns
@@ -0,0 +1,97 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import getdate
+
+from erpnext.accounts.report.financial_statements import (
+	accumulate_values_into_parents,
+	calculate_values,
+	get_period_boundaries,
+)
+
+
+class TestFinancialStatements(FrappeTestCase):
+	def get_period_list(self):
+		return [
+			frappe._dict(
+				key=key,
+				from_date=getdate(from_date),
+				to_date=getdate(to_date),
+				to_date_fiscal_year=fiscal_year,
+				year_start_date=getdate("2021-01-01"),
+			)
+			for key, from_date, to_date, fiscal_year in (
+				("jan_2021", "2021-01-01", "2021-01-31", "2021"),
+				("feb_2021", "2021-02-01", "2021-02-28", "2021"),
+				("jan_2022", "2022-01-01", "2022-01-31", "2022"),
+			)
+		]
+
+	def get_values(self, accumulated_values, ignore_accumulated_values_for_fy=False):
+		period_list = self.get_period_list()
+		accounts = [
+			frappe._dict(name="Assets", parent_account=None),
+			frappe._dict(name="Cash", parent_account="Assets"),
+			frappe._dict(name="Bank", parent_account="Assets"),
+		]
+		accounts_by_name = {d.name: d for d in accounts}
+		gl_entries_by_account = {
+			"Cash": [
+				frappe._dict(
+					account="Cash", posting_date=getdate(posting_date), fiscal_year=fy, debit=debit, credit=0
+				)
+				for posting_date, fy, debit in (
+					("2020-12-31", "2020", 1),
+					("2021-01-15", "2021", 10),
+					("2021-02-01", "2021", 100),
+					("2022-01-31", "2022", 1000),
+				)
+			],
+			"Bank": [
+				frappe._dict(
+					account="Bank", posting_date=getdate("2021-01-31"), fiscal_year="2021", debit=0, credit=5
+				)
+			],
+		}
+
+		calculate_values(
+			accounts_by_name,
+			gl_entries_by_account,
+			period_list,
+			accumulated_values,
+			ignore_accumulated_values_for_fy,
+		)
+		accumulate_values_into_parents(accounts, accounts_by_name, period_list)
+
+		return {
+			d.name: [d.get(period.key, 0.0) for period in period_list] + [d.opening_balance]
+			for d in accounts
+		}
+
+	def test_period_values(self):
+		self.assertEqual(
+			self.get_values(accumulated_values=0),
+			{"Cash": [10, 100, 1000, 1], "Bank": [-5, 0, 0, 0], "Assets": [5, 100, 1000, 1]},
+		)
+		self.assertEqual(
+			self.get_values(accumulated_values=1),
+			{"Cash": [11, 111, 1111, 1], "Bank": [-5, -5, -5, 0], "Assets": [6, 106, 1106, 1]},
+		)
+		self.assertEqual(
+			self.get_values(accumulated_values=1, ignore_accumulated_values_for_fy=True),
+			{"Cash": [10, 110, 1000, 1], "Bank": [-5, -5, 0, 0], "Assets": [5, 105, 1000, 1]},
+		)
+
+	def test_period_boundaries(self):
+		self.assertEqual(
+			get_period_boundaries(self.get_period_list()),
+			[
+				getdate("2021-01-01"),
+				getdate("2021-02-01"),
+				getdate("2021-03-01"),
+				getdate("2022-01-01"),
+				getdate("2022-02-01"),
+			],
+		)
@@ -11,6 +11,9 @@ from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 	get_dimension_with_children,
 )
+from erpnext.accounts.doctype.daily_account_balance.daily_account_balance import (
+	can_use_account_balances,
+)
 from erpnext.accounts.report.financial_statements import (
 	filter_accounts,
 	filter_out_zero_value_rows,
@@ -137,6 +140,7 @@ def get_opening_balances(filters):
 
 
 def get_rootwise_opening_balances(filters, report_type):
+	use_account_balances = can_use_account_balances(filters)
 	additional_conditions = ""
 	if not filters.show_unclosed_fy_pl_balances:
 		additional_conditions = (
@@ -144,7 +148,13 @@ def get_rootwise_opening_balances(filters, report_type):
 		)
 
 	if not flt(filters.with_period_closing_entry):
-		additional_conditions += " and ifnull(voucher_type, '')!='Period Closing Voucher'"
+		if use_account_balances:
+			additional_conditions += " and is_period_closing_voucher_entry = 0"
+		else:
+			additional_conditions += " and ifnull(voucher_type, '')!='Period Closing Voucher'"
+
+	if not use_account_balances:
+		additional_conditions += " and is_cancelled = 0"
 
 	if filters.cost_center:
 		lft, rgt = frappe.db.get_value("Cost Center", filters.cost_center, ["lft", "rgt"])
@@ -194,15 +204,15 @@ def get_rootwise_opening_balances(filters, report_type):
 		"""
 		select
 			account, sum(debit) as opening_debit, sum(credit) as opening_credit
-		from `tabGL Entry`
+		from `{table}`
 		where
 			company=%(company)s
 			{additional_conditions}
 			and (posting_date < %(from_date)s or (ifnull(is_opening, 'No') = 'Yes' and posting_date <= %(to_date)s))
 			and account in (select name from `tabAccount` where report_type=%(report_type)s)
-			and is_cancelled = 0
 		group by account""".format(
-			additional_conditions=additional_conditions
+			table="tabDaily Account Balance" if use_account_balances else "tabGL Entry",
+			additional_conditions=additional_conditions,
 		),
 		query_filters,
 		as_dict=True,
@@ -176,7 +176,9 @@ def get_balance_on(
 	if not cost_center and frappe.form_dict.get("cost_center"):
 		cost_center = frappe.form_dict.get("cost_center")
 
-	cond = ["is_cancelled=0"]
+	# party balances are not kept in the daily account balances
+	use_account_balances = not (party_type and party)
+	cond = ["1=1"] if use_account_balances else ["is_cancelled=0"]
 	if date:
 		cond.append("posting_date <= %s" % frappe.db.escape(cstr(date)))
 	else:
@@ -225,7 +227,13 @@ def get_balance_on(
 		if report_type == "Profit and Loss":
 			# for pl accounts, get balance within a fiscal year
 			cond.append(
-				"posting_date >= '%s' and voucher_type != 'Period Closing Voucher'" % year_start_date
+				"posting_date >= '%s' and %s"
+				% (
+					year_start_date,
+					"is_period_closing_voucher_entry = 0"
+					if use_account_balances
+					else "voucher_type != 'Period Closing Voucher'",
+				)
 			)
 		# different filter for group and ledger - improved performance
 		if acc.is_group:
@@ -261,9 +269,11 @@ def get_balance_on(
 		bal = frappe.db.sql(
 			"""
 			SELECT {0}
-			FROM `tabGL Entry` gle
-			WHERE {1}""".format(
-				select_field, " and ".join(cond)
+			FROM `{1}` gle
+			WHERE {2}""".format(
+				select_field,
+				"tabDaily Account Balance" if use_account_balances else "tabGL Entry",
+				" and ".join(cond),
 			)
 		)[0][0]
 
@@ -661,8 +671,21 @@ def unlink_ref_doc_from_payment_entries(ref_doc):
 		(now(), frappe.session.user, ref_doc.doctype, ref_doc.name),
 	)
 
+	from erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding import (
+		get_active_entries,
+		update_outstanding_summary,
+	)
+
 	ple = qb.DocType("Payment Ledger Entry")
 
+	# move the outstanding of unlinked entries from the reference to their own vouchers
+	unlinked_entries = get_active_entries(
+		(ple.against_voucher_type == ref_doc.doctype)
+		& (ple.against_voucher_no == ref_doc.name)
+		& ((ple.voucher_type != ref_doc.doctype) | (ple.voucher_no != ref_doc.name))
+	)
+	update_outstanding_summary(unlinked_entries, cancel=True)
+
 	qb.update(ple).set(ple.against_voucher_type, ple.voucher_type).set(
 		ple.against_voucher_no, ple.voucher_no
 	).set(ple.modified, now()).set(ple.modified_by, frappe.session.user).where(
@@ -671,6 +694,10 @@ def unlink_ref_doc_from_payment_entries(ref_doc):
 		& (ple.delinked == 0)
 	).run()
 
+	for entry in unlinked_entries:
+		entry.against_voucher_type, entry.against_voucher_no = entry.voucher_type, entry.voucher_no
+	update_outstanding_summary(unlinked_entries)
+
 	if ref_doc.doctype in ("Sales Invoice", "Purchase Invoice"):
 		ref_doc.set("advances", [])
 
@@ -1180,6 +1207,12 @@ def repost_gle_for_stock_vouchers(
 
 
 def _delete_pl_entries(voucher_type, voucher_no):
+	from erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding import (
+		remove_outstanding_summary,
+	)
+
+	remove_outstanding_summary(voucher_type, voucher_no)
+
 	ple = qb.DocType("Payment Ledger Entry")
 	qb.from_(ple).delete().where(
 		(ple.voucher_type == voucher_type) & (ple.voucher_no == voucher_no)
@@ -1187,6 +1220,12 @@ def _delete_pl_entries(voucher_type, voucher_no):
 
 
 def _delete_gl_entries(voucher_type, voucher_no):
+	from erpnext.accounts.doctype.daily_account_balance.daily_account_balance import (
+		remove_account_balances,
+	)
+
+	remove_account_balances(voucher_type, voucher_no)
+
 	gle = qb.DocType("GL Entry")
 	qb.from_(gle).delete().where(
 		(gle.voucher_type == voucher_type) & (gle.voucher_no == voucher_no)
@@ -1473,6 +1512,20 @@ def create_payment_ledger_entry(
 	if gl_entries:
 		ple_map = get_payment_ledger_entries(gl_entries, cancel=cancel)
 
+		if ple_map and use_bulk_ledger_posting():
+			from erpnext.accounts.doctype.payment_ledger_entry.payment_ledger_entry import (
+				make_payment_ledger_entries_in_bulk,
+			)
+
+			make_payment_ledger_entries_in_bulk(
+				ple_map,
+				cancel=cancel,
+				adv_adj=adv_adj,
+				update_outstanding=update_outstanding,
+				from_repost=from_repost,
+			)
+			return
+
 		for entry in ple_map:
 
 			ple = frappe.get_doc(entry)
@@ -1487,7 +1540,52 @@ def create_payment_ledger_entry(
 			ple.submit()
 
 
+# events apps use to follow inserted and submitted documents, not run by bulk insertion
+LEDGER_POSTING_EVENTS = (
+	"before_insert",
+	"after_insert",
+	"before_validate",
+	"validate",
+	"before_save",
+	"before_submit",
+	"on_update",
+	"on_submit",
+	"on_change",
+)
+
+
+def use_bulk_ledger_posting():
+	"""GL and Payment Ledger Entries are inserted in bulk unless row by row posting is enabled
+	or an app hooks into their document events"""
+	if frappe.db.get_single_value("Accounts Settings", "post_ledger_entries_row_by_row"):
+		return False
+
+	doc_events = frappe.get_doc_hooks()
+	if any(doctype in doc_events for doctype in ("GL Entry", "Payment Ledger Entry")):
+		return False
+
+	# handlers of other apps for all doctypes, eg: audit logs, expect every ledger entry
+	for app in frappe.get_installed_apps():
+		if app in ("frappe", "erpnext"):
+			continue
+
+		app_doc_events = frappe.get_hooks("doc_events", {}, app_name=app).get("*") or {}
+		if any(event in app_doc_events for event in LEDGER_POSTING_EVENTS):
+			return False
+
+	return True
+
+
 def update_voucher_outstanding(voucher_type, voucher_no, account, party_type, party):
+	from erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update import (
+		defer_outstanding_updates,
+		queue_outstanding_updates,
+	)
+
+	if defer_outstanding_updates():
+		queue_outstanding_updates([(voucher_type, voucher_no, account, party_type, party)])
+		return
+
 	ple = frappe.qb.DocType("Payment Ledger Entry")
 	vouchers = [frappe._dict({"voucher_type": voucher_type, "voucher_no": voucher_no})]
 	common_filter = []
@@ -1527,23 +1625,31 @@ def update_voucher_outstanding(voucher_type, voucher_no, account, party_type, pa
 
 def delink_original_entry(pl_entry):
 	if pl_entry:
+		from erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding import (
+			get_active_entries,
+			update_outstanding_summary,
+		)
+
 		ple = qb.DocType("Payment Ledger Entry")
+		criterion = (
+			(ple.company == pl_entry.company)
+			& (ple.account_type == pl_entry.account_type)
+			& (ple.account == pl_entry.account)
+			& (ple.party_type == pl_entry.party_type)
+			& (ple.party == pl_entry.party)
+			& (ple.voucher_type == pl_entry.voucher_type)
+			& (ple.voucher_no == pl_entry.voucher_no)
+			& (ple.against_voucher_type == pl_entry.against_voucher_type)
+			& (ple.against_voucher_no == pl_entry.against_voucher_no)
+		)
+		update_outstanding_summary(get_active_entries(criterion), cancel=True)
+
 		query = (
 			qb.update(ple)
 			.set(ple.delinked, True)
 			.set(ple.modified, now())
 			.set(ple.modified_by, frappe.session.user)
-			.where(
-				(ple.company == pl_entry.company)
-				& (ple.account_type == pl_entry.account_type)
-				& (ple.account == pl_entry.account)
-				& (ple.party_type == pl_entry.party_type)
-				& (ple.party == pl_entry.party)
-				& (ple.voucher_type == pl_entry.voucher_type)
-				& (ple.voucher_no == pl_entry.voucher_no)
-				& (ple.against_voucher_type == pl_entry.against_voucher_type)
-				& (ple.against_voucher_no == pl_entry.against_voucher_no)
-			)
+			.where(criterion)
 		)
 		query.run()
 
@@ -1553,8 +1659,19 @@ class QueryPaymentLedger(object):
 	Helper Class for Querying Payment Ledger Entry
 	"""
 
-	def __init__(self):
+	# filters which can be applied to the voucher outstanding summary as well
+	summary_filter_fields = {"company", "account", "account_type", "party_type", "party"}
+	summary_date_fields = {"posting_date", "due_date"}
+
+	def __init__(self, use_outstanding_summary=None):
 		self.ple = qb.DocType("Payment Ledger Entry")
+		self.summary = qb.DocType("Payment Ledger Outstanding")
+
+		if use_outstanding_summary is None:
+			use_outstanding_summary = frappe.db.get_single_value(
+				"Accounts Settings", "use_payment_ledger_outstanding"
+			)
+		self.use_outstanding_summary = cint(use_outstanding_summary)
 
 		# query result
 		self.voucher_outstandings = []
@@ -1575,6 +1692,82 @@ class QueryPaymentLedger(object):
 		# clear result
 		self.voucher_outstandings.clear()
 
+	def get_outstanding_amount_filter(self, outstanding):
+		filter_on_outstanding_amount = []
+		if self.min_outstanding:
+			if self.min_outstanding > 0:
+				filter_on_outstanding_amount.append(outstanding >= self.min_outstanding)
+			else:
+				filter_on_outstanding_amount.append(outstanding <= self.min_outstanding)
+		if self.max_outstanding:
+			if self.max_outstanding > 0:
+				filter_on_outstanding_amount.append(outstanding <= self.max_outstanding)
+			else:
+				filter_on_outstanding_amount.append(outstanding >= self.max_outstanding)
+
+		return filter_on_outstanding_amount
+
+	def can_use_outstanding_summary(self):
+		"""
+		The summary is kept per voucher, account and party. Filters on other ledger fields, like
+		accounting dimensions, need the entries themselves.
+		"""
+		if not self.use_outstanding_summary or self.dimensions_filter:
+			return False
+
+		def get_fields(criteria):
+			return {field.name for criterion in criteria for field in criterion.fields_()}
+
+		return get_fields(self.common_filter) <= self.summary_filter_fields and get_fields(
+			self.voucher_posting_date
+		) <= self.summary_date_fields
+
+	def query_outstanding_summary(self):
+		"""
+		Indexed lookup of voucher amount and voucher outstanding in Payment Ledger Outstanding,
+		with the columns of `query_for_outstanding`
+		"""
+		summary = self.summary
+
+		filters = [
+			criterion.replace_table(self.ple, summary)
+			for criterion in self.common_filter + self.voucher_posting_date
+		]
+		if self.vouchers:
+			filters.append(summary.voucher_type.isin({x.voucher_type for x in self.vouchers}))
+			filters.append(summary.voucher_no.isin({x.voucher_no for x in self.vouchers}))
+
+		filters += self.get_outstanding_amount_filter(summary.outstanding_in_account_currency)
+		if self.get_invoices:
+			filters.append(summary.outstanding_in_account_currency > 0)
+		elif self.get_payments:
+			filters.append(summary.outstanding_in_account_currency < 0)
+
+		self.voucher_outstandings = (
+			qb.from_(summary)
+			.select(
+				summary.account,
+				summary.voucher_type,
+				summary.voucher_no,
+				summary.party_type,
+				summary.party,
+				summary.posting_date,
+				summary.invoice_amount,
+				summary.invoice_amount_in_account_currency,
+				summary.outstanding,
+				summary.outstanding_in_account_currency,
+				(summary.invoice_amount - summary.outstanding).as_("paid_amount"),
+				(
+					summary.invoice_amount_in_account_currency - summary.outstanding_in_account_currency
+				).as_("paid_amount_in_account_currency"),
+				summary.due_date,
+				summary.account_currency.as_("currency"),
+			)
+			.where(summary.voucher_entries > 0)
+			.where(Criterion.all(filters))
+			.run(as_dict=True)
+		)
+
 	def query_for_outstanding(self):
 		"""
 		Database query to fetch voucher amount and voucher outstanding using Common Table Expression
@@ -1595,25 +1788,9 @@ class QueryPaymentLedger(object):
 			filter_on_against_voucher_no.append(ple.against_voucher_no.isin(voucher_nos))
 
 		# build outstanding amount filter
-		filter_on_outstanding_amount = []
-		if self.min_outstanding:
-			if self.min_outstanding > 0:
-				filter_on_outstanding_amount.append(
-					Table("outstanding").amount_in_account_currency >= self.min_outstanding
-				)
-			else:
-				filter_on_outstanding_amount.append(
-					Table("outstanding").amount_in_account_currency <= self.min_outstanding
-				)
-		if self.max_outstanding:
-			if self.max_outstanding > 0:
-				filter_on_outstanding_amount.append(
-					Table("outstanding").amount_in_account_currency <= self.max_outstanding
-				)
-			else:
-				filter_on_outstanding_amount.append(
-					Table("outstanding").amount_in_account_currency >= self.max_outstanding
-				)
+		filter_on_outstanding_amount = self.get_outstanding_amount_filter(
+			Table("outstanding").amount_in_account_currency
+		)
 
 		# build query for voucher amount
 		query_voucher_amount = (
@@ -1743,6 +1920,10 @@ class QueryPaymentLedger(object):
 		self.max_outstanding = max_outstanding
 		self.get_payments = get_payments
 		self.get_invoices = get_invoices
-		self.query_for_outstanding()
+
+		if self.can_use_outstanding_summary():
+			self.query_outstanding_summary()
+		else:
+			self.query_for_outstanding()
 
 		return self.voucher_outstandings
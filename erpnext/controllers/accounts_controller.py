@@ -26,6 +26,12 @@ import erpnext
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 )
+from erpnext.accounts.doctype.daily_account_balance.daily_account_balance import (
+	remove_account_balances,
+)
+from erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding import (
+	remove_outstanding_summary,
+)
 from erpnext.accounts.doctype.pricing_rule.utils import (
 	apply_pricing_rule_for_free_items,
 	apply_pricing_rule_on_transaction,
@@ -55,6 +61,7 @@ from erpnext.stock.get_item_details import (
 	get_item_tax_map,
 	get_item_warehouse,
 )
+from erpnext.stock.utils import get_combine_datetime
 from erpnext.utilities.transaction_base import TransactionBase
 
 
@@ -225,10 +232,12 @@ class AccountsController(TransactionBase):
 
 		# delete sl and gl entries on deletion of transaction
 		if frappe.db.get_single_value("Accounts Settings", "delete_linked_ledger_entries"):
+			remove_outstanding_summary(self.doctype, self.name)
 			ple = frappe.qb.DocType("Payment Ledger Entry")
 			frappe.qb.from_(ple).delete().where(
 				(ple.voucher_type == self.doctype) & (ple.voucher_no == self.name)
 			).run()
+			remove_account_balances(self.doctype, self.name)
 			frappe.db.sql(
 				"delete from `tabGL Entry` where voucher_type=%s and voucher_no=%s", (self.doctype, self.name)
 			)
@@ -752,6 +761,7 @@ class AccountsController(TransactionBase):
 			{
 				"company": self.company,
 				"posting_date": posting_date,
+				"posting_datetime": get_combine_datetime(posting_date, self.get("posting_time")),
 				"fiscal_year": fiscal_year,
 				"voucher_type": self.doctype,
 				"voucher_no": self.name,
@@ -7,6 +7,7 @@ from frappe import _
 from frappe.model.document import Document
 from frappe.utils import comma_and, flt, unique
 
+from erpnext.e_commerce.local_search import enqueue_local_search_index_build
 from erpnext.e_commerce.redisearch_utils import (
 	create_website_items_index,
 	define_autocomplete_dictionary,
@@ -43,6 +44,7 @@ class ECommerceSettings(Document):
 
 	def after_save(self):
 		self.create_redisearch_indexes()
+		self.create_local_search_index()
 
 	def create_redisearch_indexes(self):
 		# if redisearch is enabled (value changed) create indexes and dictionary
@@ -51,6 +53,16 @@ class ECommerceSettings(Document):
 			define_autocomplete_dictionary()
 			create_website_items_index()
 
+	def create_local_search_index(self):
+		# build the index if it was enabled or its fields changed
+		if not self.is_local_search_enabled or self.is_redisearch_enabled:
+			return
+
+		if self.has_value_changed("is_local_search_enabled") or self.has_value_changed(
+			"search_index_fields"
+		):
+			enqueue_local_search_index_build()
+
 	@staticmethod
 	def validate_field_filters(filter_fields, enable_field_filters):
 		if not (enable_field_filters and filter_fields):
@@ -15,6 +15,7 @@ from frappe.website.doctype.website_slideshow.website_slideshow import get_slide
 from frappe.website.website_generator import WebsiteGenerator
 
 from erpnext.e_commerce.doctype.item_review.item_review import get_item_reviews
+from erpnext.e_commerce.local_search import update_local_search_index
 from erpnext.e_commerce.redisearch_utils import (
 	delete_item_from_index,
 	insert_item_to_index,
@@ -80,6 +81,7 @@ class WebsiteItem(WebsiteGenerator):
 	def on_trash(self):
 		super(WebsiteItem, self).on_trash()
 		delete_item_from_index(self)
+		update_local_search_index(self)
 		self.publish_unpublish_desk_item(publish=False)
 
 	def validate_duplicate_website_item(self):
@@ -395,6 +397,7 @@ def invalidate_cache_for_web_item(doc):
 
 	# Update Search Cache
 	update_index_for_item(doc)
+	update_local_search_index(doc)
 
 	invalidate_item_variants_cache_for_website(doc)
 
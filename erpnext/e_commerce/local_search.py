@@ -0,0 +1,311 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import fcntl
+import os
+import re
+import sqlite3
+from contextlib import closing, contextmanager
+
+import frappe
+from frappe.utils import cint, strip_html_tags
+
+from erpnext.e_commerce.redisearch_utils import get_indexable_web_fields, is_redisearch_enabled
+
+INDEX_FILE = "website_items.sqlite3"
+
+# fields searched when no Search Index Fields are set, same as the product listing search
+DEFAULT_SEARCH_FIELDS = ["item_code", "item_name", "item_group", "web_long_description"]
+
+# bm25 weights of the indexed fields, other indexable fields have a weight of 1
+FIELD_WEIGHTS = {
+	"web_item_name": 5.0,
+	"item_name": 3.0,
+	"item_code": 3.0,
+	"brand": 2.0,
+	"item_group": 2.0,
+	"website_image_alt": 0.5,
+	"description": 0.5,
+	"web_long_description": 0.5,
+}
+
+# best matches considered by the product listing, which pages and filters them further
+LISTING_SEARCH_LIMIT = 5000
+
+# stored with every item to show search results without a database query
+RESULT_FIELDS = ["name", "web_item_name", "route", "thumbnail", "brand", "ranking"]
+
+
+def get_index_path():
+	return frappe.get_site_path("indexes", INDEX_FILE)
+
+
+def is_local_search_enabled(built=True):
+	"Return True if the local index is enabled (and built), and Redisearch is not enabled."
+	is_local_search_enabled = frappe.db.get_single_value(
+		"E Commerce Settings", "is_local_search_enabled"
+	)
+	return (
+		bool(is_local_search_enabled)
+		and not is_redisearch_enabled()
+		and (not built or os.path.exists(get_index_path()))
+	)
+
+
+def get_search_fields():
+	"Website Item Name and the Search Index Fields of E Commerce Settings."
+	fields = frappe.db.get_single_value("E Commerce Settings", "search_index_fields")
+	fields = fields.split(",") if fields else DEFAULT_SEARCH_FIELDS
+	indexable_fields = get_indexable_web_fields()
+
+	return ["web_item_name"] + [
+		field for field in fields if field in indexable_fields and field != "web_item_name"
+	]
+
+
+class WebsiteItemSearchIndex:
+	"""Full text index of published Website Items, in an SQLite FTS5 file in the site folder.
+
+	Items are ranked by bm25 with `FIELD_WEIGHTS` and then by Website Item ranking.
+	"""
+
+	def __init__(self, path=None):
+		self.path = path or get_index_path()
+		self.journal_path = f"{self.path}.journal"
+		self.fields = get_search_fields()
+
+	def connect(self, path=None):
+		return closing(sqlite3.connect(path or self.path, timeout=30))
+
+	def exists(self):
+		return os.path.exists(self.path)
+
+	@contextmanager
+	def lock(self):
+		"Serialise writes to the index, its journal and swapping in a rebuilt index."
+		with open(f"{self.path}.lock", "w") as lock_file:
+			fcntl.flock(lock_file, fcntl.LOCK_EX)
+			yield
+
+	def build(self, chunk_size=5000):
+		"""Index all published Website Items in a new file and swap it in.
+
+		Items updated meanwhile are journaled and reindexed in the new file after the swap."""
+		os.makedirs(os.path.dirname(self.path), exist_ok=True)
+		path = f"{self.path}.{frappe.generate_hash(length=8)}"
+
+		with self.lock():
+			open(self.journal_path, "w").close()
+
+		try:
+			with self.connect(path) as conn:
+				self.create_tables(conn)
+
+				start = 0
+				while True:
+					names = frappe.get_all(
+						"Website Item",
+						filters={"published": 1},
+						order_by="name",
+						limit_start=start,
+						limit_page_length=chunk_size,
+						pluck="name",
+					)
+					if not names:
+						break
+
+					self.insert_items(conn, get_items_to_index(names, self.fields))
+					start += chunk_size
+
+				# merge the b-trees written per chunk for faster queries
+				conn.execute("insert into items_fts(items_fts) values ('optimize')")
+				conn.commit()
+
+			with self.lock():
+				os.replace(path, self.path)
+				names = self.pop_journal()
+				if names:
+					# read the items as saved during the build, not the snapshot of its first read
+					frappe.db.rollback()
+					self.write_items(names)
+		finally:
+			if os.path.exists(path):
+				os.remove(path)
+
+			with self.lock():
+				if os.path.exists(self.journal_path):
+					os.remove(self.journal_path)
+
+	def pop_journal(self):
+		with open(self.journal_path) as journal:
+			names = {name.strip() for name in journal if name.strip()}
+
+		os.remove(self.journal_path)
+		return list(names)
+
+	def create_tables(self, conn):
+		columns = ", ".join(f'"{field}"' for field in self.fields)
+		weights = ", ".join(str(FIELD_WEIGHTS.get(field, 1.0)) for field in self.fields)
+
+		conn.execute("create table fields (fieldname text)")
+		conn.executemany("insert into fields values (?)", [(field,) for field in self.fields])
+		conn.execute(
+			"""create table items (id integer primary key, name text unique,
+			web_item_name text, route text, thumbnail text, brand text, ranking integer)"""
+		)
+		# prefix indexes for autocomplete of the first few characters
+		conn.execute(
+			f"""create virtual table items_fts using fts5({columns},
+			tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"""
+		)
+		conn.execute(f"insert into items_fts(items_fts, rank) values ('rank', 'bm25({weights})')")
+
+	def insert_items(self, conn, items):
+		columns = ", ".join(f'"{field}"' for field in self.fields)
+		placeholders = ", ".join("?" for field in self.fields)
+
+		for item in items:
+			cursor = conn.execute(
+				"""insert into items (name, web_item_name, route, thumbnail, brand, ranking)
+				values (?, ?, ?, ?, ?, ?)""",
+				[item.get(field) for field in RESULT_FIELDS],
+			)
+			conn.execute(
+				f"insert into items_fts (rowid, {columns}) values (?, {placeholders})",
+				[cursor.lastrowid] + [item.get(field) or "" for field in self.fields],
+			)
+
+	def delete_items(self, conn, names):
+		ids = []
+		for name in names:
+			ids.extend(row for row in conn.execute("select id from items where name = ?", [name]))
+
+		conn.executemany("delete from items_fts where rowid = ?", ids)
+		conn.executemany("delete from items where id = ?", ids)
+
+	def is_current(self, conn):
+		"Return False if the index was built for other fields and waits for a rebuild."
+		return [row[0] for row in conn.execute("select fieldname from fields")] == self.fields
+
+	def update(self, names):
+		"Reindex the given Website Items, removing those which are deleted or unpublished."
+		with self.lock():
+			if os.path.exists(self.journal_path):
+				# a rebuild is running, reindex these in the new file too
+				with open(self.journal_path, "a") as journal:
+					journal.writelines(f"{name}\n" for name in names)
+
+			self.write_items(names)
+
+	def write_items(self, names):
+		if not (names and self.exists()):
+			return
+
+		with self.connect() as conn:
+			if not self.is_current(conn):
+				return
+
+			self.delete_items(conn, names)
+			self.insert_items(conn, get_items_to_index(names, self.fields))
+			conn.commit()
+
+	def search(self, text, limit=10, start=0):
+		"Published Website Items with words starting with each word of `text`."
+		match = get_match_expression(text)
+		if not match or not self.exists():
+			return []
+
+		with self.connect() as conn:
+			conn.row_factory = sqlite3.Row
+			rows = conn.execute(
+				"""select items.name, items.web_item_name, items.route, items.thumbnail, items.brand,
+					items.ranking
+				from items_fts join items on items.id = items_fts.rowid
+				where items_fts match ?
+				order by items_fts.rank, items.ranking desc
+				limit ? offset ?""",
+				[match, cint(limit), cint(start)],
+			).fetchall()
+
+		return [frappe._dict(row) for row in rows]
+
+
+def get_match_expression(text):
+	"FTS5 query matching all words of `text` as prefixes, so that partly typed words match."
+	words = re.findall(r"\w+", (text or "").lower())
+	return " AND ".join(f'"{word}"*' for word in words)
+
+
+def get_items_to_index(names, fields):
+	"Published Website Items with their searchable text, Table MultiSelect values joined."
+	meta = frappe.get_meta("Website Item", cached=True)
+	table_fields = [
+		field for field in fields if meta.get_field(field).fieldtype == "Table MultiSelect"
+	]
+	value_fields = [field for field in fields if field not in table_fields]
+	html_fields = [field for field in fields if meta.get_field(field).fieldtype == "Text Editor"]
+
+	items = frappe.get_all(
+		"Website Item",
+		filters={"name": ("in", names), "published": 1},
+		fields=list(set(RESULT_FIELDS + value_fields)),
+	)
+
+	for field in table_fields:
+		child_doctype = meta.get_field(field).options
+		link_field = frappe.get_meta(child_doctype).get("fields", {"fieldtype": "Link"})[0].fieldname
+		values = {}
+		for row in frappe.get_all(
+			child_doctype,
+			filters={"parent": ("in", names), "parenttype": "Website Item", "parentfield": field},
+			fields=["parent", link_field],
+		):
+			values.setdefault(row.parent, []).append(row.get(link_field))
+
+		for item in items:
+			item[field] = " ".join(values.get(item.name, []))
+
+	for item in items:
+		for field in html_fields:
+			item[field] = strip_html_tags(item.get(field) or "")
+
+	return items
+
+
+def update_local_search_index(website_item_doc):
+	"Reindex a saved or deleted Website Item once the transaction is committed."
+	if not is_local_search_enabled(built=False):
+		return
+
+	frappe.enqueue(
+		"erpnext.e_commerce.local_search.reindex_website_items",
+		queue="short",
+		names=[website_item_doc.name],
+		enqueue_after_commit=True,
+	)
+
+
+def reindex_website_items(names):
+	WebsiteItemSearchIndex().update(names)
+
+
+def build_local_search_index():
+	"""
+	Build the local Website Item search index.
+
+	Usage: bench --site <site> execute erpnext.e_commerce.local_search.build_local_search_index
+	"""
+	WebsiteItemSearchIndex().build()
+
+
+def enqueue_local_search_index_build():
+	frappe.enqueue(
+		"erpnext.e_commerce.local_search.build_local_search_index",
+		queue="long",
+		timeout=3600,
+		enqueue_after_commit=True,
+	)
+
+
+def search_website_items(text, limit=10, start=0):
+	return WebsiteItemSearchIndex().search(text, limit=limit, start=start)
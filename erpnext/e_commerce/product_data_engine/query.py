@@ -5,7 +5,12 @@ import frappe
 from frappe.utils import flt
 
 from erpnext.e_commerce.doctype.item_review.item_review import get_customer
-from erpnext.e_commerce.shopping_cart.product_info import get_product_info_for_website
+from erpnext.e_commerce.local_search import (
+	LISTING_SEARCH_LIMIT,
+	is_local_search_enabled,
+	search_website_items,
+)
+from erpnext.e_commerce.shopping_cart.product_info import get_product_prices_for_website
 from erpnext.utilities.product import get_non_stock_item_status
 
 
@@ -202,6 +207,11 @@ class ProductQuery:
 		Args:
 		        search_term (str): Search candidate
 		"""
+		if is_local_search_enabled():
+			matches = search_website_items(search_term, limit=LISTING_SEARCH_LIMIT)
+			self.filters.append(["name", "in", [item.name for item in matches] or [""]])
+			return
+
 		# Default fields to search from
 		default_fields = {"item_code", "item_name", "web_long_description", "item_group"}
 
@@ -221,25 +231,20 @@ class ProductQuery:
 
 	def add_display_details(self, result, discount_list, cart_items):
 		"""Add price and availability details in result."""
-		for item in result:
-			product_info = get_product_info_for_website(item.item_code, skip_quotation_creation=True).get(
-				"product_info"
-			)
+		item_codes = [item.item_code for item in result]
+		prices = get_product_prices_for_website(item_codes)
+		wished_items = self.get_wished_items(item_codes)
 
-			if product_info and product_info["price"]:
-				# update/mutate item and discount_list objects
-				self.get_price_discount_info(item, product_info["price"], discount_list)
+		if self.settings.show_stock_availability:
+			self.set_stock_availability(result)
 
-			if self.settings.show_stock_availability:
-				self.get_stock_availability(item)
+		for item in result:
+			if prices.get(item.item_code):
+				# update/mutate item and discount_list objects
+				self.get_price_discount_info(item, prices[item.item_code], discount_list)
 
 			item.in_cart = item.item_code in cart_items
-
-			item.wished = False
-			if frappe.db.exists(
-				"Wishlist Item", {"item_code": item.item_code, "parent": frappe.session.user}
-			):
-				item.wished = True
+			item.wished = item.item_code in wished_items
 
 		return result, discount_list
 
@@ -258,27 +263,66 @@ class ProductQuery:
 				"formatted_discount_rate"
 			)
 
-	def get_stock_availability(self, item):
-		"""Modify item object and add stock details."""
-		item.in_stock = False
-		warehouse = item.get("website_warehouse")
-		is_stock_item = frappe.get_cached_value("Item", item.item_code, "is_stock_item")
+	def set_stock_availability(self, result):
+		"""Modify item objects and add stock details."""
+		for item in result:
+			item.in_stock = False
 
-		if item.get("on_backorder"):
+		items = [item for item in result if not item.get("on_backorder")]
+		if not items:
 			return
 
-		if not is_stock_item:
-			if warehouse:
-				# product bundle case
-				item.in_stock = get_non_stock_item_status(item.item_code, "website_warehouse")
-			else:
-				item.in_stock = True
-		elif warehouse:
-			# stock item and has warehouse
-			actual_qty = frappe.db.get_value(
-				"Bin", {"item_code": item.item_code, "warehouse": item.get("website_warehouse")}, "actual_qty"
+		stock_items = set(
+			frappe.get_all(
+				"Item",
+				filters={"name": ("in", [item.item_code for item in items]), "is_stock_item": 1},
+				pluck="name",
+			)
+		)
+
+		bin_items = [
+			item for item in items if item.item_code in stock_items and item.get("website_warehouse")
+		]
+		actual_qty = {}
+		if bin_items:
+			bin = frappe.qb.DocType("Bin")
+			actual_qty = {
+				(row.item_code, row.warehouse): row.actual_qty
+				for row in (
+					frappe.qb.from_(bin)
+					.select(bin.item_code, bin.warehouse, bin.actual_qty)
+					.where(
+						bin.item_code.isin([item.item_code for item in bin_items])
+						& bin.warehouse.isin(list({item.website_warehouse for item in bin_items}))
+					)
+					.run(as_dict=True)
+				)
+			}
+
+		for item in items:
+			warehouse = item.get("website_warehouse")
+
+			if item.item_code not in stock_items:
+				if warehouse:
+					# product bundle case
+					item.in_stock = get_non_stock_item_status(item.item_code, "website_warehouse")
+				else:
+					item.in_stock = True
+			elif warehouse:
+				# stock item and has warehouse
+				item.in_stock = bool(flt(actual_qty.get((item.item_code, warehouse))))
+
+	def get_wished_items(self, item_codes):
+		if not item_codes or frappe.session.user == "Guest":
+			return set()
+
+		return set(
+			frappe.get_all(
+				"Wishlist Item",
+				filters={"item_code": ("in", item_codes), "parent": frappe.session.user},
+				pluck="item_code",
 			)
-			item.in_stock = bool(flt(actual_qty))
+		)
 
 	def get_cart_items(self):
 		customer = get_customer(silent=True)
@@ -237,6 +237,50 @@ class TestProductDataEngine(unittest.TestCase):
 		self.assertEqual(len(items), 1)
 		self.assertEqual(items[0].get("item_code"), "Test 12I Laptop")
 
+	def test_product_list_prices(self):
+		"Test if prices of a page of items are the same as those fetched per item."
+		from erpnext.e_commerce.doctype.website_item.test_website_item import (
+			make_web_item_price,
+			make_web_pricing_rule,
+		)
+		from erpnext.e_commerce.shopping_cart.product_info import (
+			get_product_info_for_website,
+			get_product_prices_for_website,
+		)
+
+		make_web_item_price(item_code="Test 14I Laptop")
+		make_web_item_price(item_code="Test 15I Laptop", price_list_rate=500)
+		make_web_pricing_rule(
+			title="Test Pricing Rule for Test 15I Laptop",  # 10% discount
+			item_code="Test 15I Laptop",
+			selling=1,
+		)
+
+		setup_e_commerce_settings({"show_price": 1, "guest_price_cache_ttl": 60})
+		frappe.local.shopping_cart_settings = None
+
+		item_codes = ["Test 14I Laptop", "Test 15I Laptop", "Test 16I Laptop"]
+		expected_prices = {}
+		for item_code in item_codes[:2]:
+			product_info = get_product_info_for_website(item_code, skip_quotation_creation=True)
+			expected_prices[item_code] = product_info["product_info"]["price"]
+
+		self.assertEqual(get_product_prices_for_website(item_codes), expected_prices)
+		self.assertEqual(expected_prices["Test 15I Laptop"].price_list_rate, 450)
+
+		# guests are served cached prices until the cache expires
+		frappe.set_user("Guest")
+		try:
+			guest_prices = get_product_prices_for_website(item_codes)
+			frappe.db.set_value("Item Price", {"item_code": "Test 14I Laptop"}, "price_list_rate", 1200)
+			self.assertEqual(get_product_prices_for_website(item_codes), guest_prices)
+		finally:
+			frappe.set_user("Administrator")
+			frappe.cache().delete_keys("website_item_price:")
+
+		prices = get_product_prices_for_website(item_codes)
+		self.assertEqual(prices["Test 14I Laptop"].price_list_rate, 1200)
+
 	def test_product_list_with_api(self):
 		"Test products listing using API."
 		from erpnext.e_commerce.api import get_product_filter_data
@@ -2,6 +2,7 @@
 # License: GNU General Public License v3. See license.txt
 
 import frappe
+from frappe.utils import cint
 
 from erpnext.e_commerce.doctype.e_commerce_settings.e_commerce_settings import (
 	get_shopping_cart_settings,
@@ -11,6 +12,7 @@ from erpnext.e_commerce.shopping_cart.cart import _get_cart_quotation, _set_pric
 from erpnext.utilities.product import (
 	get_non_stock_item_status,
 	get_price,
+	get_prices,
 	get_web_item_qty_in_stock,
 )
 
@@ -81,6 +83,48 @@ def get_product_info_for_website(item_code, skip_quotation_creation=False):
 	return frappe._dict({"product_info": product_info, "cart_settings": cart_settings})
 
 
+def get_product_prices_for_website(item_codes):
+	"""get website prices of multiple items (e.g. a page of product listing) at once"""
+	cart_settings = get_shopping_cart_settings()
+	if not cart_settings.enabled or not cart_settings.show_price:
+		return {}
+
+	is_guest = frappe.session.user == "Guest"
+	if is_guest and cart_settings.hide_price_for_guest:
+		return {}
+
+	selling_price_list = _set_price_list(cart_settings, None)
+	args = (selling_price_list, cart_settings.default_customer_group, cart_settings.company)
+
+	# all guests see the same prices, so they can be cached for a short while
+	ttl = cint(cart_settings.guest_price_cache_ttl) if is_guest else 0
+	if not ttl:
+		return get_prices(item_codes, *args)
+
+	prices, uncached = {}, []
+	for item_code in set(item_codes):
+		price = frappe.cache().get_value(get_price_cache_key(item_code, *args))
+		if price is None:
+			uncached.append(item_code)
+		elif price:
+			prices[item_code] = price
+
+	if uncached:
+		uncached_prices = get_prices(uncached, *args)
+		for item_code in uncached:
+			# items without price are cached as well
+			price = uncached_prices.get(item_code) or {}
+			frappe.cache().set_value(get_price_cache_key(item_code, *args), price, expires_in_sec=ttl)
+			if price:
+				prices[item_code] = price
+
+	return prices
+
+
+def get_price_cache_key(item_code, price_list, customer_group, company):
+	return f"website_item_price:{price_list}:{customer_group}:{company}:{item_code}"
+
+
 def set_product_info_for_website(item):
 	"""set product price uom for website"""
 	product_info = get_product_info_for_website(item.item_code, skip_quotation_creation=True).get(
@@ -0,0 +1,195 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import os
+import random
+import statistics
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import frappe
+from frappe.utils import now
+
+from erpnext.e_commerce.doctype.website_item.test_website_item import create_regular_web_item
+from erpnext.e_commerce.local_search import WebsiteItemSearchIndex, get_match_expression
+from erpnext.templates.pages.product_search import get_product_data
+
+
+class TestLocalSearch(unittest.TestCase):
+	def setUp(self):
+		self.path = os.path.join(tempfile.mkdtemp(), "website_items.sqlite3")
+
+	def tearDown(self):
+		frappe.db.rollback()
+		if os.path.exists(self.path):
+			os.remove(self.path)
+
+	def test_match_expression(self):
+		self.assertEqual(get_match_expression("Lap-top  pro!"), '"lap"* AND "top"* AND "pro"*')
+		self.assertEqual(get_match_expression("' \""), "")
+
+	def test_search_index(self):
+		laptop = create_regular_web_item(
+			"Test Local Search Laptop", web_args={"web_item_name": "Featherlight Laptop", "ranking": 2}
+		)
+		sleeve = create_regular_web_item(
+			"Test Local Search Sleeve",
+			web_args={
+				"web_item_name": "Neoprene Sleeve",
+				"web_long_description": "<p>Fits a <b>featherlight</b> laptop</p>",
+				"ranking": 5,
+			},
+		)
+
+		index = WebsiteItemSearchIndex(self.path)
+		index.build()
+
+		def search(text):
+			return [item.name for item in index.search(text)]
+
+		# matches in the item name rank above matches in the description
+		self.assertEqual(search("feather"), [laptop.name, sleeve.name])
+		self.assertEqual(search("featherl lap"), [laptop.name, sleeve.name])
+		self.assertEqual(search("neopr"), [sleeve.name])
+		self.assertEqual(search("unknown"), [])
+
+		frappe.db.set_value("Website Item", sleeve.name, "web_item_name", "Sleeve for Featherlight")
+		index.update([sleeve.name])
+		self.assertEqual(search("neopr"), [])
+		self.assertEqual(index.search("sleeve")[0].web_item_name, "Sleeve for Featherlight")
+
+		# unpublished and deleted items are removed
+		frappe.db.set_value("Website Item", laptop.name, "published", 0)
+		index.update([laptop.name])
+		self.assertEqual(search("feather"), [sleeve.name])
+
+		frappe.db.delete("Website Item", sleeve.name)
+		index.update([sleeve.name])
+		self.assertEqual(search("feather"), [])
+
+		# updates made while the index is rebuilt are journaled and replayed on the new file
+		open(index.journal_path, "w").close()
+		frappe.db.set_value("Website Item", laptop.name, "published", 1)
+		index.update([laptop.name])
+		self.assertEqual(index.pop_journal(), [laptop.name])
+		self.assertEqual(search("feather"), [laptop.name])
+
+	def test_updates_during_build_are_replayed(self):
+		lamp = create_regular_web_item(
+			"Test Local Search Lamp", web_args={"web_item_name": "Adjustable Desk Lamp"}
+		)
+		frappe.db.commit()
+		self.addCleanup(self.delete_committed_item, lamp)
+
+		index = WebsiteItemSearchIndex(self.path)
+		insert_items = index.insert_items
+
+		def insert_and_rename(conn, items):
+			insert_items(conn, items)
+
+			# saved by another request after the build read the item
+			frappe.db.set_value("Website Item", lamp.name, "web_item_name", "Adjustable Floor Lamp")
+			frappe.db.commit()
+			index.update([lamp.name])
+
+		with patch.object(index, "insert_items", side_effect=insert_and_rename):
+			index.build()
+
+		self.assertFalse(os.path.exists(index.journal_path))
+		self.assertEqual([item.name for item in index.search("adjustable floor")], [lamp.name])
+		self.assertEqual(index.search("adjustable desk"), [])
+
+	def delete_committed_item(self, web_item):
+		frappe.delete_doc("Website Item", web_item.name, force=True)
+		frappe.delete_doc("Item", web_item.item_code, force=True)
+		frappe.db.commit()
+
+
+def run_search_index_benchmark(items=300_000, queries=200):
+	"""
+	Time building the local search index and querying it, against the database search.
+
+	Usage: bench --site test_site execute erpnext.e_commerce.test_local_search.run_search_index_benchmark
+	"""
+	words = (
+		"laptop phone cable charger sleeve monitor keyboard mouse speaker camera tripod lens router "
+		"adapter battery stand case headset"
+	).split()
+	colours = ["black", "white", "silver", "blue", "red", "green"]
+	random.seed(0)
+	item_group = frappe.db.get_value("Item Group", {"is_group": 0}, "name")
+	timestamp = now()
+	audit = (timestamp, timestamp, "Administrator", "Administrator")
+
+	rows = []
+	for idx in range(items):
+		name = f"{random.choice(colours).title()} {random.choice(words).title()} {idx:06d}"
+		description = " ".join(random.choices(words + colours, k=20))
+		code = f"_Test Search Item {idx:06d}"
+		rows.append(
+			(code, code, code, name, name, f"search/{idx}", item_group, description, 1, idx % 100)
+			+ audit
+		)
+
+	frappe.db.bulk_insert(
+		"Website Item",
+		[
+			"name",
+			"item_code",
+			"item_name",
+			"web_item_name",
+			"route",
+			"item_group",
+			"web_long_description",
+			"published",
+			"ranking",
+			"creation",
+			"modified",
+			"owner",
+			"modified_by",
+		],
+		rows,
+	)
+
+	# partly typed words, as sent while typing in the search bar
+	search_terms = []
+	for _ in range(queries):
+		term = " ".join(random.sample(words + colours, k=random.randint(1, 2)))
+		search_terms.append(term[: random.randint(3, len(term))])
+
+	path = os.path.join(tempfile.mkdtemp(), "website_items.sqlite3")
+	index = WebsiteItemSearchIndex(path)
+
+	def time_queries(search):
+		timings = []
+		for term in search_terms:
+			start = time.perf_counter()
+			search(term)
+			timings.append((time.perf_counter() - start) * 1000)
+
+		timings.sort()
+		return statistics.mean(timings), timings[int(len(timings) * 0.95) - 1]
+
+	try:
+		start = time.perf_counter()
+		index.build()
+		build_time = time.perf_counter() - start
+		index_size = os.path.getsize(path)
+
+		index_latency = time_queries(lambda term: index.search(term, limit=10))
+		database_latency = time_queries(lambda term: get_product_data(term, 0, 10))
+
+		start = time.perf_counter()
+		index.update([row[0] for row in rows[:1000]])
+		update_time = time.perf_counter() - start
+	finally:
+		frappe.db.rollback()
+		if os.path.exists(path):
+			os.remove(path)
+
+	print(f"build: {build_time:.2f}s, {index_size / 1024 / 1024:.0f} MiB for {items} items")
+	print(f"update: {update_time:.2f}s for 1000 items")
+	for label, (mean, p95) in (("index", index_latency), ("database", database_latency)):
+		print(f"{label} search: {mean:.1f}ms mean, {p95:.1f}ms p95 over {queries} queries")
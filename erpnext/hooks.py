@@ -352,6 +352,27 @@ doc_events = {
 		"Purchase Order",
 		"Purchase Receipt",
 	): {"validate": ["erpnext.regional.india.utils.set_place_of_supply"]},
+	("Item Group", "Customer Group", "Territory", "Supplier Group", "Warehouse"): {
+		"on_update": "erpnext.accounts.doctype.pricing_rule.utils.clear_pricing_rule_index",
+		"on_trash": "erpnext.accounts.doctype.pricing_rule.utils.clear_pricing_rule_index",
+	},
+	# renaming these updates the values in pricing rules directly
+	(
+		"Item",
+		"Item Group",
+		"Brand",
+		"UOM",
+		"Company",
+		"Customer",
+		"Customer Group",
+		"Territory",
+		"Supplier",
+		"Supplier Group",
+		"Campaign",
+		"Sales Partner",
+		"Warehouse",
+		"Price List",
+	): {"after_rename": "erpnext.accounts.doctype.pricing_rule.utils.clear_pricing_rule_index"},
 	"Contact": {
 		"on_trash": "erpnext.support.doctype.issue.issue.update_issue",
 		"after_insert": "erpnext.telephony.doctype.call_log.call_log.link_existing_conversations",
@@ -381,6 +402,7 @@ scheduler_events = {
 		"0/15 * * * *": [
 			"erpnext.manufacturing.doctype.bom_update_log.bom_update_log.resume_bom_cost_update_jobs",
 			"erpnext.accounts.doctype.process_payment_reconciliation.process_payment_reconciliation.trigger_reconciliation_for_queued_docs",
+			"erpnext.accounts.doctype.pending_outstanding_update.pending_outstanding_update.process_pending_outstanding_updates",
 		],
 		"0/30 * * * *": [
 			"erpnext.utilities.doctype.video.video.update_youtube_data",
@@ -437,11 +459,13 @@ scheduler_events = {
 		"erpnext.loan_management.doctype.process_loan_security_shortfall.process_loan_security_shortfall.create_process_loan_security_shortfall",
 		"erpnext.loan_management.doctype.process_loan_interest_accrual.process_loan_interest_accrual.process_loan_interest_accrual_for_term_loans",
 		"erpnext.crm.utils.open_leads_opportunities_based_on_todays_event",
+		"erpnext.accounts.doctype.party_ageing_snapshot.party_ageing_snapshot.make_ageing_snapshots",
 	],
 	"weekly": ["erpnext.hr.doctype.employee.employee_reminders.send_reminders_in_advance_weekly"],
 	"monthly": ["erpnext.hr.doctype.employee.employee_reminders.send_reminders_in_advance_monthly"],
 	"monthly_long": [
 		"erpnext.accounts.deferred_revenue.process_deferred_accounting",
+		"erpnext.stock.doctype.stock_ageing_checkpoint.stock_ageing_checkpoint.make_stock_ageing_checkpoints",
 		"erpnext.loan_management.doctype.process_loan_interest_accrual.process_loan_interest_accrual.process_loan_interest_accrual_for_demand_loans",
 	],
 }
@@ -11,6 +11,7 @@ import frappe
 from frappe import _
 from frappe.core.doctype.version.version import get_diff
 from frappe.model.mapper import get_mapped_doc
+from frappe.query_builder.functions import IfNull, Sum
 from frappe.utils import cint, cstr, flt, today
 from frappe.website.website_generator import WebsiteGenerator
 
@@ -21,6 +22,8 @@ from erpnext.stock.get_item_details import get_conversion_factor, get_price_list
 
 form_grid_templates = {"items": "templates/form_grid/item_grid.html"}
 
+EXPLODED_BOM_CACHE_KEY = "bom_exploded_items"
+
 
 class BOMRecursionError(frappe.ValidationError):
 	pass
@@ -202,10 +205,12 @@ class BOM(WebsiteGenerator):
 
 	def on_update(self):
 		frappe.cache().hdel("bom_children", self.name)
+		clear_exploded_bom_cache()
 		self.check_recursion()
 
 	def on_submit(self):
 		self.manage_default_bom()
+		clear_exploded_bom_cache()
 
 	def on_cancel(self):
 		self.db_set("is_active", 0)
@@ -214,10 +219,12 @@ class BOM(WebsiteGenerator):
 		# check if used in any other bom
 		self.validate_bom_links()
 		self.manage_default_bom()
+		clear_exploded_bom_cache()
 
 	def on_update_after_submit(self):
 		self.validate_bom_links()
 		self.manage_default_bom()
+		clear_exploded_bom_cache()
 
 	def get_item_det(self, item_code):
 		item = get_item_details(item_code)
@@ -1111,6 +1118,115 @@ def get_bom_items_as_dict(
 	return item_dict
 
 
+def get_exploded_bom_items(
+	bom_no, include_non_stock_items=False, include_subcontracted_items=False
+):
+	"""
+	Items for one unit of `bom_no` with sub-assemblies replaced by the items of their default BOM,
+	as [[item_code, qty, source_warehouse, description, stock_uom], ...].
+
+	Sub-assemblies are exploded if their default material request type is Manufacture or Purchase,
+	or if they are sub-contracted and `include_subcontracted_items` is set; other sub-assemblies
+	are left out. Results are kept in the cache until a BOM or the planning fields of an Item change.
+	"""
+	key = f"{bom_no}::{cint(include_non_stock_items)}::{cint(include_subcontracted_items)}"
+	exploded_items = frappe.cache().hget(EXPLODED_BOM_CACHE_KEY, key)
+	if exploded_items is None:
+		exploded_items = explode_bom(bom_no, include_non_stock_items, include_subcontracted_items)
+		frappe.cache().hset(EXPLODED_BOM_CACHE_KEY, key, exploded_items)
+
+	return exploded_items
+
+
+def explode_bom(bom_no, include_non_stock_items=False, include_subcontracted_items=False):
+	bom_item = frappe.qb.DocType("BOM Item")
+	bom = frappe.qb.DocType("BOM")
+	item = frappe.qb.DocType("Item")
+
+	items = (
+		frappe.qb.from_(bom_item)
+		.join(bom)
+		.on(bom.name == bom_item.parent)
+		.join(item)
+		.on(bom_item.item_code == item.name)
+		.select(
+			bom_item.item_code,
+			IfNull(Sum(bom_item.stock_qty / IfNull(bom.quantity, 1)), 0).as_("qty"),
+			bom_item.source_warehouse,
+			bom_item.description,
+			bom_item.stock_uom,
+			item.default_bom,
+			item.default_material_request_type,
+			item.is_sub_contracted_item,
+		)
+		.where(
+			(bom.name == bom_no)
+			& (bom_item.docstatus < 2)
+			& (item.is_stock_item.isin([0, 1]) if include_non_stock_items else item.is_stock_item == 1)
+		)
+		.groupby(bom_item.item_code)
+	).run(as_dict=True)
+
+	exploded_items = {}
+
+	def add_item(row, qty):
+		if row[0] in exploded_items:
+			exploded_items[row[0]][1] += qty
+		else:
+			exploded_items[row[0]] = [row[0], qty, *row[2:]]
+
+	for d in items:
+		row = [d.item_code, flt(d.qty), d.source_warehouse, d.description, d.stock_uom]
+		if not d.default_bom:
+			add_item(row, row[1])
+		elif (
+			(
+				d.default_material_request_type in ["Manufacture", "Purchase"]
+				and not d.is_sub_contracted_item
+			)
+			or (d.is_sub_contracted_item and include_subcontracted_items)
+		) and row[1] > 0:
+			for child in get_exploded_bom_items(
+				d.default_bom, include_non_stock_items, include_subcontracted_items
+			):
+				add_item(child, child[1] * row[1])
+
+	return list(exploded_items.values())
+
+
+def clear_exploded_bom_cache():
+	frappe.cache().delete_key(EXPLODED_BOM_CACHE_KEY)
+
+
+def build_exploded_bom_cache(include_non_stock_items=False, include_subcontracted_items=False):
+	"""
+	Fill the exploded BOM cache for all active BOMs, one BOM level at a time from the leaves up,
+	so that every BOM is exploded from the cached items of its sub-assemblies.
+
+	Usage: bench --site <site> execute erpnext.manufacturing.doctype.bom.bom.build_exploded_bom_cache
+	"""
+	from erpnext.manufacturing.doctype.bom_update_log.bom_updation_utils import (
+		_generate_dependence_map,
+		get_leaf_boms,
+	)
+
+	dependants_map, dependency_map = _generate_dependence_map()
+	processed = set()
+	current_level = get_leaf_boms()
+
+	while current_level:
+		for bom_no in current_level:
+			get_exploded_bom_items(bom_no, include_non_stock_items, include_subcontracted_items)
+		processed.update(current_level)
+
+		current_level = {
+			parent
+			for bom_no in current_level
+			for parent in dependants_map.get(bom_no, [])
+			if parent not in processed and all(d in processed for d in dependency_map.get(parent, []))
+		}
+
+
 @frappe.whitelist()
 def get_bom_items(bom, company, qty=1, fetch_exploded=1):
 	items = get_bom_items_as_dict(
@@ -4,13 +4,18 @@
 import copy
 import json
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
 	from erpnext.manufacturing.doctype.bom_update_log.bom_update_log import BOMUpdateLog
 
 import frappe
 from frappe import _
+from frappe.query_builder.functions import IfNull, Sum
+from frappe.utils import flt
+
+from erpnext.manufacturing.doctype.bom.bom import clear_exploded_bom_cache, get_bom_item_rate
+from erpnext.stock.stock_ledger import bulk_update_values
 
 
 def replace_bom(boms: Dict, log_name: str) -> None:
@@ -23,6 +28,7 @@ def replace_bom(boms: Dict, log_name: str) -> None:
 	update_new_bom_in_bom_items(unit_cost, current_bom, new_bom)
 
 	frappe.cache().delete_key("bom_children")
+	clear_exploded_bom_cache()
 	parent_boms = get_ancestor_boms(new_bom)
 
 	for bom in parent_boms:
@@ -114,18 +120,383 @@ def get_bom_unit_cost(bom_name: str) -> float:
 	return frappe.utils.flt(new_bom_unitcost[0][0])
 
 
-def update_cost_in_boms(bom_list: List[str]) -> None:
-	"Updates cost in given BOMs. Returns current and total updated BOMs."
+def update_cost_in_boms(bom_list: List[str], chunk_size: int = 500) -> None:
+	"Updates cost in given BOMs, a chunk of BOMs at a time."
 
-	for index, bom in enumerate(bom_list):
-		bom_doc = frappe.get_doc("BOM", bom, for_update=True)
-		bom_doc.calculate_cost(save_updates=True, update_hour_rate=True)
-		bom_doc.db_update()
+	for start in range(0, len(bom_list), chunk_size):
+		BOMCostRollup(bom_list[start : start + chunk_size]).run()
 
-		if (index % 50 == 0) and not frappe.flags.in_test:
+		if not frappe.flags.in_test:
 			frappe.db.commit()  # nosemgrep
 
 
+class BOMCostRollup:
+	"""
+	Recalculate the cost of a batch of BOMs the way `BOM.calculate_cost(save_updates=True,
+	update_hour_rate=True)` does, without loading each BOM as a document.
+
+	Rows, rates and precisions of the whole batch are fetched upfront and the changed values
+	are written back with one update statement per table (and chunk of records).
+	"""
+
+	bom_fields = [
+		"name",
+		"company",
+		"quantity",
+		"conversion_rate",
+		"plc_conversion_rate",
+		"rm_cost_as_per",
+		"buying_price_list",
+		"currency",
+		"set_rate_of_sub_assembly_item_based_on_bom",
+		"with_operations",
+		"fg_based_operating_cost",
+		"operating_cost_per_bom_quantity",
+	]
+	cost_fields = [
+		"operating_cost",
+		"base_operating_cost",
+		"raw_material_cost",
+		"base_raw_material_cost",
+		"scrap_material_cost",
+		"base_scrap_material_cost",
+		"total_cost",
+		"base_total_cost",
+	]
+
+	def __init__(self, bom_list: List[str]) -> None:
+		self.bom_list = bom_list
+		self.updates = {}
+
+	def run(self) -> None:
+		self.boms = {
+			bom.name: bom
+			for bom in frappe.get_all(
+				"BOM",
+				filters={"name": ("in", self.bom_list)},
+				fields=self.bom_fields + self.cost_fields,
+				order_by=None,
+				for_update=True,
+			)
+		}
+		if not self.boms:
+			return
+
+		self.set_precisions()
+		self.load_rows()
+		self.load_rates()
+
+		for bom in self.boms.values():
+			self.calculate_cost(bom)
+
+		for doctype, updates in self.updates.items():
+			bulk_update_values(doctype, updates)
+
+	def set_precisions(self) -> None:
+		bom, bom_item, scrap_item = (
+			frappe.new_doc(doctype) for doctype in ("BOM", "BOM Item", "BOM Scrap Item")
+		)
+		self.precision = frappe._dict(
+			quantity=bom.precision("quantity"),
+			conversion_rate=bom.precision("conversion_rate"),
+			rate=bom_item.precision("rate"),
+			qty=bom_item.precision("qty"),
+			stock_qty=bom_item.precision("stock_qty"),
+			scrap_rate=scrap_item.precision("rate"),
+			scrap_stock_qty=scrap_item.precision("stock_qty"),
+			scrap_amount=scrap_item.precision("amount"),
+		)
+
+	def load_rows(self) -> None:
+		self.items = self.get_child_rows(
+			"BOM Item",
+			[
+				"item_code",
+				"bom_no",
+				"qty",
+				"uom",
+				"stock_uom",
+				"stock_qty",
+				"conversion_factor",
+				"sourced_by_supplier",
+				"rate",
+				"base_rate",
+			],
+		)
+		self.operations = self.get_child_rows(
+			"BOM Operation",
+			[
+				"workstation",
+				"hour_rate",
+				"base_hour_rate",
+				"time_in_mins",
+				"batch_size",
+				"operating_cost",
+				"base_operating_cost",
+				"cost_per_unit",
+				"base_cost_per_unit",
+				"set_cost_based_on_bom_qty",
+			],
+		)
+		self.scrap_items = self.get_child_rows(
+			"BOM Scrap Item", ["rate", "stock_qty", "base_rate", "amount", "base_amount"]
+		)
+		self.exploded_items = self.get_child_rows(
+			"BOM Explosion Item", ["item_code", "stock_qty", "rate"]
+		)
+
+	def get_child_rows(self, doctype: str, fields: List[str]) -> defaultdict:
+		rows = defaultdict(list)
+		for row in frappe.get_all(
+			doctype,
+			filters={"parent": ("in", list(self.boms)), "parenttype": "BOM"},
+			fields=["name", "parent", *fields],
+			order_by="idx",
+		):
+			rows[row.parent].append(row)
+
+		return rows
+
+	def load_rates(self) -> None:
+		rows = [row for items in self.items.values() for row in items]
+		item_codes = list({row.item_code for row in rows})
+		child_boms = list({row.bom_no for row in rows if row.bom_no})
+
+		self.item_details = {
+			item.name: item
+			for item in frappe.get_all(
+				"Item",
+				filters={"name": ("in", item_codes or [""])},
+				fields=["name", "is_customer_provided_item", "last_purchase_rate", "valuation_rate"],
+			)
+		}
+		self.hour_rates = dict(
+			frappe.get_all(
+				"Workstation",
+				filters={
+					"name": (
+						"in",
+						list({row.workstation for ops in self.operations.values() for row in ops}) or [""],
+					)
+				},
+				fields=["name", "hour_rate"],
+				as_list=True,
+			)
+		)
+
+		self.explosion_rates = defaultdict(dict)
+		self.bom_unit_costs = {}
+		if child_boms:
+			for row in frappe.get_all(
+				"BOM Explosion Item",
+				filters={"parent": ("in", child_boms), "parenttype": "BOM"},
+				fields=["parent", "item_code", "rate"],
+				order_by=None,
+			):
+				self.explosion_rates[row.parent][row.item_code] = flt(row.rate)
+
+			bom = frappe.qb.DocType("BOM")
+			self.bom_unit_costs = dict(
+				frappe.qb.from_(bom)
+				.select(bom.name, bom.base_total_cost / bom.quantity)
+				.where((bom.is_active == 1) & (bom.name.isin(child_boms)))
+				.run()
+			)
+
+		self.valuation_rates = self.get_valuation_rates(item_codes)
+
+	def get_valuation_rates(self, item_codes: List[str]) -> Dict:
+		"Average valuation rate per (item, company) from Bins, like `get_valuation_rate`."
+		if not item_codes:
+			return {}
+
+		companies = list({bom.company for bom in self.boms.values()})
+
+		bin_table = frappe.qb.DocType("Bin")
+		wh_table = frappe.qb.DocType("Warehouse")
+		return {
+			(item_code, company): valuation_rate
+			for item_code, company, valuation_rate in (
+				frappe.qb.from_(bin_table)
+				.join(wh_table)
+				.on(bin_table.warehouse == wh_table.name)
+				.select(
+					bin_table.item_code,
+					wh_table.company,
+					IfNull(Sum(bin_table.stock_value) / Sum(bin_table.actual_qty), 0.0),
+				)
+				.where((bin_table.item_code.isin(item_codes)) & (wh_table.company.isin(companies)))
+				.groupby(bin_table.item_code, wh_table.company)
+			).run()
+		}
+
+	def get_valuation_rate(self, item_code: str, company: str) -> float:
+		valuation_rate = self.valuation_rates.get((item_code, company))
+
+		if (valuation_rate is not None) and valuation_rate <= 0:
+			# Bins without value, fall back to the last valuation rate from SLE
+			sle = frappe.qb.DocType("Stock Ledger Entry")
+			last_val_rate = (
+				frappe.qb.from_(sle)
+				.select(sle.valuation_rate)
+				.where((sle.item_code == item_code) & (sle.valuation_rate > 0) & (sle.is_cancelled == 0))
+				.orderby(sle.posting_date, order=frappe.qb.desc)
+				.orderby(sle.posting_time, order=frappe.qb.desc)
+				.orderby(sle.creation, order=frappe.qb.desc)
+				.limit(1)
+			).run()
+			valuation_rate = flt(last_val_rate[0][0]) if last_val_rate else 0
+			self.valuation_rates[(item_code, company)] = valuation_rate
+
+		if not valuation_rate:
+			valuation_rate = (self.item_details.get(item_code) or {}).get("valuation_rate")
+
+		return flt(valuation_rate)
+
+	def set_values(self, doctype: str, row: Dict, values: Dict) -> None:
+		"Queue the values which differ from `row` to be written back."
+		changed = {field: value for field, value in values.items() if row.get(field) != value}
+		if changed:
+			self.updates.setdefault(doctype, {}).setdefault(row.name, {}).update(changed)
+
+	def calculate_cost(self, bom: Dict) -> None:
+		costs = frappe._dict()
+		costs.operating_cost, costs.base_operating_cost = self.calculate_op_cost(bom)
+		costs.raw_material_cost, costs.base_raw_material_cost = self.calculate_rm_cost(bom)
+		costs.scrap_material_cost, costs.base_scrap_material_cost = self.calculate_sm_cost(bom)
+		self.calculate_exploded_cost(bom)
+
+		costs.total_cost = costs.operating_cost + costs.raw_material_cost - costs.scrap_material_cost
+		costs.base_total_cost = (
+			costs.base_operating_cost + costs.base_raw_material_cost - costs.base_scrap_material_cost
+		)
+		self.set_values("BOM", bom, costs)
+
+	def calculate_op_cost(self, bom: Dict) -> Tuple[float, float]:
+		operating_cost = base_operating_cost = 0
+		conversion_rate = flt(bom.conversion_rate)
+
+		if bom.with_operations:
+			for row in self.operations[bom.name]:
+				if row.workstation:
+					values = frappe._dict(hour_rate=row.hour_rate)
+					hour_rate = flt(self.hour_rates.get(row.workstation))
+					if hour_rate:
+						values.hour_rate = hour_rate / conversion_rate if conversion_rate else hour_rate
+
+					if values.hour_rate and row.time_in_mins:
+						values.base_hour_rate = flt(values.hour_rate) * conversion_rate
+						values.operating_cost = flt(values.hour_rate) * flt(row.time_in_mins) / 60.0
+						values.base_operating_cost = flt(values.operating_cost) * conversion_rate
+						values.cost_per_unit = values.operating_cost / (row.batch_size or 1.0)
+						values.base_cost_per_unit = values.base_operating_cost / (row.batch_size or 1.0)
+
+					self.set_values("BOM Operation", row, values)
+					row.update(values)
+
+				if row.set_cost_based_on_bom_qty:
+					operating_cost += flt(flt(row.cost_per_unit) * flt(bom.quantity))
+					base_operating_cost += flt(flt(row.base_cost_per_unit) * flt(bom.quantity))
+				else:
+					operating_cost += flt(row.operating_cost)
+					base_operating_cost += flt(row.base_operating_cost)
+
+		elif bom.fg_based_operating_cost:
+			operating_cost = flt(bom.quantity) * flt(bom.operating_cost_per_bom_quantity)
+			base_operating_cost = flt(operating_cost * bom.conversion_rate, 2)
+
+		return operating_cost, base_operating_cost
+
+	def calculate_rm_cost(self, bom: Dict) -> Tuple[float, float]:
+		total_rm_cost = base_total_rm_cost = 0
+		conversion_rate = flt(bom.conversion_rate)
+		bom_qty = flt(bom.quantity, self.precision.quantity)
+
+		if self.items[bom.name] and not bom.rm_cost_as_per:
+			bom.rm_cost_as_per = "Valuation Rate"
+			self.set_values("BOM", frappe._dict(name=bom.name), {"rm_cost_as_per": "Valuation Rate"})
+
+		for row in self.items[bom.name]:
+			rate = self.get_rm_rate(bom, row)
+			values = frappe._dict(rate=rate, base_rate=flt(rate) * conversion_rate)
+			values.amount = flt(rate, self.precision.rate) * flt(row.qty, self.precision.qty)
+			values.base_amount = values.amount * conversion_rate
+			values.qty_consumed_per_unit = flt(row.stock_qty, self.precision.stock_qty) / bom_qty
+
+			total_rm_cost += values.amount
+			base_total_rm_cost += values.base_amount
+			if row.rate != rate:
+				self.set_values("BOM Item", frappe._dict(name=row.name), values)
+
+			row.update(values)
+
+		return total_rm_cost, base_total_rm_cost
+
+	def get_rm_rate(self, bom: Dict, row: Dict) -> float:
+		"Raw material rate as per `BOM.get_rm_rate`."
+		rate = 0
+		item = self.item_details.get(row.item_code) or frappe._dict()
+		conversion_factor = row.conversion_factor or 1
+
+		if not item.is_customer_provided_item and not row.sourced_by_supplier:
+			if row.bom_no and bom.set_rate_of_sub_assembly_item_based_on_bom:
+				rate = flt(self.bom_unit_costs.get(row.bom_no)) * conversion_factor
+			elif bom.rm_cost_as_per == "Valuation Rate":
+				rate = self.get_valuation_rate(row.item_code, bom.company) * conversion_factor
+			elif bom.rm_cost_as_per == "Last Purchase Rate":
+				rate = flt(item.last_purchase_rate) * conversion_factor
+			else:
+				rate = get_bom_item_rate(
+					{
+						"company": bom.company,
+						"item_code": row.item_code,
+						"bom_no": row.bom_no,
+						"qty": row.qty,
+						"uom": row.uom,
+						"stock_uom": row.stock_uom,
+						"conversion_factor": row.conversion_factor,
+						"sourced_by_supplier": row.sourced_by_supplier,
+					},
+					bom,
+				)
+
+		return flt(rate) * flt(bom.plc_conversion_rate or 1) / (bom.conversion_rate or 1)
+
+	def calculate_sm_cost(self, bom: Dict) -> Tuple[float, float]:
+		total_sm_cost = base_total_sm_cost = 0
+		conversion_rate = flt(bom.conversion_rate, self.precision.conversion_rate)
+
+		for row in self.scrap_items[bom.name]:
+			rate = flt(row.rate, self.precision.scrap_rate)
+			values = frappe._dict(base_rate=rate * conversion_rate)
+			values.amount = rate * flt(row.stock_qty, self.precision.scrap_stock_qty)
+			values.base_amount = flt(values.amount, self.precision.scrap_amount) * conversion_rate
+
+			total_sm_cost += values.amount
+			base_total_sm_cost += values.base_amount
+			self.set_values("BOM Scrap Item", row, values)
+
+		return total_sm_cost, base_total_sm_cost
+
+	def calculate_exploded_cost(self, bom: Dict) -> None:
+		"Set exploded row cost from the raw material rates, like `BOM.calculate_exploded_cost`."
+		rm_rate_map = {}
+		for row in self.items[bom.name]:
+			if row.bom_no:
+				rm_rate_map.update(self.explosion_rates.get(row.bom_no) or {})
+			else:
+				rm_rate_map[row.item_code] = flt(row.base_rate) / flt(row.conversion_factor or 1.0)
+
+		for row in self.exploded_items[bom.name]:
+			rate = flt(rm_rate_map.get(row.item_code))
+			if flt(row.rate) != rate:
+				self.set_values(
+					"BOM Explosion Item",
+					frappe._dict(name=row.name),
+					{"rate": rate, "amount": flt(row.stock_qty) * rate},
+				)
+
+
 def get_next_higher_level_boms(
 	child_boms: List[str], processed_boms: Dict[str, bool]
 ) -> List[str]:
@@ -8,6 +8,10 @@ from erpnext.manufacturing.doctype.bom_update_log.bom_update_log import (
 	BOMMissingError,
 	resume_bom_cost_update_jobs,
 )
+from erpnext.manufacturing.doctype.bom_update_log.bom_updation_utils import (
+	get_leaf_boms,
+	update_cost_in_boms,
+)
 from erpnext.manufacturing.doctype.bom_update_tool.bom_update_tool import (
 	enqueue_replace_bom,
 	enqueue_update_cost,
@@ -57,6 +61,42 @@ class TestBOMUpdateLog(FrappeTestCase):
 		log.reload()
 		self.assertEqual(log.status, "Completed")
 
+	def test_bom_cost_rollup(self):
+		"Test if the batched cost update matches BOM.calculate_cost."
+
+		def get_costs():
+			costs = {}
+			for doctype, fields in (
+				("BOM", ["operating_cost", "raw_material_cost", "scrap_material_cost", "base_total_cost"]),
+				("BOM Item", ["rate", "base_rate", "amount", "base_amount", "qty_consumed_per_unit"]),
+				("BOM Operation", ["hour_rate", "operating_cost", "base_cost_per_unit"]),
+				("BOM Scrap Item", ["base_rate", "amount", "base_amount"]),
+				("BOM Explosion Item", ["rate", "amount"]),
+			):
+				parent_field = "name" if doctype == "BOM" else "parent"
+				for row in frappe.get_all(
+					doctype, filters={parent_field: ("in", bom_list)}, fields=["name", *fields]
+				):
+					costs[(doctype, row.name)] = [frappe.utils.flt(row[field], 6) for field in fields]
+
+			return costs
+
+		bom_list = get_leaf_boms()
+		bom_item = frappe.qb.DocType("BOM Item")
+		frappe.qb.update(bom_item).set(bom_item.rate, 0).where(bom_item.parent.isin(bom_list)).run()
+
+		frappe.db.savepoint("bom_cost_rollup")
+		for bom in bom_list:
+			bom_doc = frappe.get_doc("BOM", bom)
+			bom_doc.calculate_cost(save_updates=True, update_hour_rate=True)
+			bom_doc.db_update()
+
+		expected = get_costs()
+		frappe.db.rollback(save_point="bom_cost_rollup")
+
+		update_cost_in_boms(bom_list, chunk_size=2)
+		self.assertEqual(get_costs(), expected)
+
 
 def update_cost_in_all_boms_in_test():
 	"""
@@ -24,8 +24,8 @@ from frappe.utils import (
 	time_diff_in_seconds,
 )
 
-from erpnext.manufacturing.doctype.manufacturing_settings.manufacturing_settings import (
-	get_mins_between_operations,
+from erpnext.manufacturing.doctype.workstation.workstation_calendar import (
+	get_workstation_calendar,
 )
 from erpnext.manufacturing.doctype.workstation_type.workstation_type import get_workstations
 
@@ -212,27 +212,45 @@ class JobCard(Document):
 					return workstation
 
 	def schedule_time_logs(self, row):
+		calendar = get_workstation_calendar()
 		row.remaining_time_in_mins = row.time_in_mins
 		while row.remaining_time_in_mins > 0:
 			args = frappe._dict({"from_time": row.planned_start_time, "to_time": row.planned_end_time})
 
-			self.validate_overlap_for_workstation(args, row)
-			self.check_workstation_time(row)
+			self.validate_overlap_for_workstation(args, row, calendar)
+			self.check_workstation_time(row, calendar)
 
-	def validate_overlap_for_workstation(self, args, row):
+		# book the slots for the job cards scheduled next in the same batch
+		for time_log in self.time_logs:
+			calendar.add_time_log(self.workstation_type, self.workstation, time_log.to_time)
+
+	def validate_overlap_for_workstation(self, args, row, calendar=None):
 		# get the last record based on the to time from the job card
-		data = self.get_overlap_for(args, check_next_available_slot=True)
+		calendar = calendar or get_workstation_calendar()
+		data = calendar.get_overlap(self.workstation_type, self.workstation, args.from_time)
+		if self.workstation_type:
+			busy_workstations = calendar.get_busy_workstations(
+				self.workstation_type, self.workstation, args.from_time
+			)
+
+			# as in get_overlap_for, pick a free workstation of the type unless the slot overlaps
+			# time logs which still fit in the capacity of the workstation
+			if data or not busy_workstations:
+				for workstation in calendar.get_workstations(self.workstation_type):
+					if workstation not in busy_workstations:
+						self.workstation = workstation
+						return
+
 		if data:
 			if not self.workstation:
 				self.workstation = data.workstation
 
-			row.planned_start_time = get_datetime(data.to_time + get_mins_between_operations())
+			row.planned_start_time = get_datetime(data.to_time + calendar.mins_between_operations)
 
-	def check_workstation_time(self, row):
-		workstation_doc = frappe.get_cached_doc("Workstation", self.workstation)
-		if not workstation_doc.working_hours or cint(
-			frappe.db.get_single_value("Manufacturing Settings", "allow_overtime")
-		):
+	def check_workstation_time(self, row, calendar=None):
+		calendar = calendar or get_workstation_calendar()
+		workstation_doc = calendar.get_workstation(self.workstation)
+		if not workstation_doc.working_hours or calendar.allow_overtime:
 			if get_datetime(row.planned_end_time) < get_datetime(row.planned_start_time):
 				row.planned_end_time = add_to_date(row.planned_start_time, minutes=row.time_in_mins)
 				row.remaining_time_in_mins = 0.0
@@ -247,7 +265,7 @@ class JobCard(Document):
 		start_date = getdate(row.planned_start_time)
 		start_time = get_time(row.planned_start_time)
 
-		new_start_date = workstation_doc.validate_workstation_holiday(start_date)
+		new_start_date = calendar.get_next_working_day(self.workstation, start_date)
 
 		if new_start_date != start_date:
 			row.planned_start_time = datetime.datetime.combine(new_start_date, start_time)
@@ -19,7 +19,7 @@ from erpnext.manufacturing.doctype.job_card.job_card import (
 	make_stock_entry as make_stock_entry_from_jc,
 )
 from erpnext.manufacturing.doctype.work_order.test_work_order import make_wo_order_test_record
-from erpnext.manufacturing.doctype.work_order.work_order import WorkOrder
+from erpnext.manufacturing.doctype.work_order.work_order import WorkOrder, submit_work_orders
 from erpnext.manufacturing.doctype.workstation.test_workstation import make_workstation
 from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
 
@@ -175,6 +175,63 @@ class TestJobCard(FrappeTestCase):
 		jc2.save()
 		self.assertTrue(jc2.name)
 
+	def test_job_card_scheduling_for_batch_of_work_orders(self):
+		from erpnext.manufacturing.doctype.operation.test_operation import make_operation
+		from erpnext.manufacturing.doctype.production_plan.test_production_plan import make_bom
+		from erpnext.stock.doctype.item.test_item import make_item
+
+		frappe.db.set_value(
+			"Manufacturing Settings",
+			None,
+			{
+				"disable_capacity_planning": 0,
+				"capacity_planning_for_days": 30,
+				"mins_between_operations": 10,
+			},
+		)
+
+		workstation = make_workstation(workstation_name="_Test Workstation Calendar").name
+		make_operation(operation="_Test Operation Calendar", workstation=workstation)
+		item = make_item("_Test FG Item Calendar", {"is_stock_item": 1}).name
+
+		bom = make_bom(item=item, raw_materials=["_Test Item"], with_operations=1, do_not_save=True)
+		bom.append(
+			"operations",
+			{
+				"operation": "_Test Operation Calendar",
+				"workstation": workstation,
+				"time_in_mins": 60,
+				"hour_rate": 100,
+			},
+		)
+		bom.insert()
+		bom.submit()
+
+		work_orders = [
+			make_wo_order_test_record(
+				item=item,
+				qty=1,
+				bom_no=bom.name,
+				planned_start_date="2026-03-02 08:00:00",
+				do_not_submit=True,
+			).name
+			for i in range(3)
+		]
+		submit_work_orders(work_orders)
+
+		# job cards of later work orders are queued after the earlier ones on the workstation
+		job_cards = frappe.get_all("Job Card", {"work_order": ("in", work_orders)}, pluck="name")
+		time_logs = frappe.get_all(
+			"Job Card Time Log",
+			filters={"parent": ("in", job_cards)},
+			fields=["from_time", "to_time"],
+			order_by="from_time",
+		)
+		self.assertEqual(
+			[str(row.from_time) for row in time_logs],
+			["2026-03-02 08:00:00", "2026-03-02 09:10:00", "2026-03-02 10:20:00"],
+		)
+
 	def test_job_card_multiple_materials_transfer(self):
 		"Test transferring RMs separately against Job Card with multiple RMs."
 		self.transfer_material_against = "Job Card"
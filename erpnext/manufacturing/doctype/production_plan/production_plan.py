@@ -24,7 +24,7 @@ from frappe.utils.csvutils import build_csv_response
 from pypika.terms import ExistsCriterion
 
 from erpnext.manufacturing.doctype.bom.bom import get_children as get_bom_children
-from erpnext.manufacturing.doctype.bom.bom import validate_bom_no
+from erpnext.manufacturing.doctype.bom.bom import get_exploded_bom_items, validate_bom_no
 from erpnext.manufacturing.doctype.work_order.work_order import get_item_details
 from erpnext.setup.doctype.item_group.item_group import get_item_group_defaults
 from erpnext.stock.get_item_details import get_conversion_factor
@@ -1037,6 +1037,59 @@ def get_subitems(
 	return item_details
 
 
+def get_exploded_subitems(
+	item_details, bom_no, company, include_non_stock_items, include_subcontracted_items, planned_qty
+):
+	"""`get_subitems` with exploded sub-assemblies, from the exploded BOM cache"""
+	exploded_items = get_exploded_bom_items(
+		bom_no, include_non_stock_items, include_subcontracted_items
+	)
+	if not exploded_items:
+		return item_details
+
+	item = frappe.qb.DocType("Item")
+	item_default = frappe.qb.DocType("Item Default")
+	item_uom = frappe.qb.DocType("UOM Conversion Detail")
+
+	item_data = (
+		frappe.qb.from_(item)
+		.left_join(item_default)
+		.on((item.name == item_default.parent) & (item_default.company == company))
+		.left_join(item_uom)
+		.on((item.name == item_uom.parent) & (item_uom.uom == item.purchase_uom))
+		.select(
+			item.name,
+			item.default_material_request_type,
+			item.item_name,
+			item.is_sub_contracted_item.as_("is_sub_contracted"),
+			item.default_bom.as_("default_bom"),
+			item.min_order_qty.as_("min_order_qty"),
+			item.safety_stock.as_("safety_stock"),
+			item_default.default_warehouse,
+			item.purchase_uom,
+			item_uom.conversion_factor,
+		)
+		.where(item.name.isin([d[0] for d in exploded_items]))
+	).run(as_dict=True)
+	item_data = {d.pop("name"): d for d in item_data}
+
+	for item_code, qty, source_warehouse, description, stock_uom in exploded_items:
+		d = frappe._dict(
+			item_code=item_code,
+			qty=qty * planned_qty,
+			source_warehouse=source_warehouse,
+			description=description,
+			stock_uom=stock_uom,
+			**item_data.get(item_code, {}),
+		)
+		if not d.conversion_factor and d.purchase_uom:
+			d.conversion_factor = get_uom_conversion_factor(d.item_code, d.purchase_uom)
+
+		item_details[item_code] = d
+
+	return item_details
+
+
 def get_material_request_items(
 	row, sales_order, company, ignore_existing_ordered_qty, include_safety_stock, warehouse, bin_dict
 ):
@@ -1308,6 +1361,15 @@ def get_items_for_material_requests(doc, warehouses=None, get_parent_warehouse_d
 					item_details = get_exploded_items(
 						item_details, company, bom_no, include_non_stock_items, planned_qty=planned_qty
 					)
+				elif data.get("include_exploded_items") and flt(planned_qty) > 0:
+					item_details = get_exploded_subitems(
+						item_details,
+						bom_no,
+						company,
+						include_non_stock_items,
+						include_subcontracted_items,
+						flt(planned_qty),
+					)
 				else:
 					item_details = get_subitems(
 						doc,
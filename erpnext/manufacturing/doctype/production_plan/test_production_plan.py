@@ -868,6 +868,59 @@ class TestProductionPlan(FrappeTestCase):
 		for item_code in mr_items:
 			self.assertTrue(item_code in validate_mr_items)
 
+	def test_exploded_bom_cache(self):
+		from erpnext.manufacturing.doctype.bom.bom import (
+			EXPLODED_BOM_CACHE_KEY,
+			get_exploded_bom_items,
+		)
+		from erpnext.manufacturing.doctype.bom.test_bom import create_nested_bom
+		from erpnext.manufacturing.doctype.production_plan.production_plan import (
+			get_exploded_subitems,
+			get_subitems,
+		)
+
+		bom_tree = {
+			"Exploded FG": {
+				"Exploded SA1": {
+					"Exploded SA2": {"Exploded RM1": {}, "Exploded RM2": {}},
+					"Exploded RM1": {},
+				},
+				"Exploded RM2": {},
+			}
+		}
+		parent_bom = create_nested_bom(bom_tree, prefix="_Test ")
+
+		def get_items(use_cache):
+			if use_cache:
+				return get_exploded_subitems({}, parent_bom.name, "_Test Company", 0, 0, 5)
+
+			data = {"include_exploded_items": 1}
+			return get_subitems(None, data, {}, parent_bom.name, "_Test Company", 0, 0, 1, 5)
+
+		expected = get_items(use_cache=False)
+		self.assertEqual(
+			{d: flt(row.qty) for d, row in expected.items()},
+			{"_Test Exploded RM1": 10, "_Test Exploded RM2": 10},
+		)
+
+		exploded = get_items(use_cache=True)
+		self.assertEqual(list(exploded), list(expected))
+		for item_code, row in expected.items():
+			self.assertEqual(flt(exploded[item_code].qty), flt(row.qty))
+			self.assertEqual(exploded[item_code].stock_uom, row.stock_uom)
+		self.assertIsNotNone(frappe.cache().hget(EXPLODED_BOM_CACHE_KEY, f"{parent_bom.name}::0::0"))
+
+		# sub-assemblies which are not manufactured or purchased are left out
+		item = frappe.get_doc("Item", "_Test Exploded SA2")
+		item.default_material_request_type = "Material Transfer"
+		item.save()
+		self.assertIsNone(frappe.cache().hget(EXPLODED_BOM_CACHE_KEY, f"{parent_bom.name}::0::0"))
+		self.assertEqual(
+			{d[0]: d[1] for d in get_exploded_bom_items(parent_bom.name)},
+			{"_Test Exploded RM1": 1, "_Test Exploded RM2": 1},
+		)
+		self.assertEqual(list(get_items(use_cache=True)), list(get_items(use_cache=False)))
+
 
 def create_production_plan(**args):
 	"""
@@ -30,6 +30,7 @@ from erpnext.manufacturing.doctype.bom.bom import (
 from erpnext.manufacturing.doctype.manufacturing_settings.manufacturing_settings import (
 	get_mins_between_operations,
 )
+from erpnext.manufacturing.doctype.workstation.workstation_calendar import workstation_calendar
 from erpnext.stock.doctype.batch.batch import make_batch
 from erpnext.stock.doctype.item.item import get_item_defaults, validate_end_of_life
 from erpnext.stock.doctype.serial_no.serial_no import (
@@ -472,12 +473,13 @@ class WorkOrder(Document):
 		enable_capacity_planning = not cint(manufacturing_settings_doc.disable_capacity_planning)
 		plan_days = cint(manufacturing_settings_doc.capacity_planning_for_days) or 30
 
-		for index, row in enumerate(self.operations):
-			qty = self.qty
-			while qty > 0:
-				qty = split_qty_based_on_batch_size(self, row, qty)
-				if row.job_card_qty > 0:
-					self.prepare_data_for_job_card(row, index, plan_days, enable_capacity_planning)
+		with workstation_calendar():
+			for index, row in enumerate(self.operations):
+				qty = self.qty
+				while qty > 0:
+					qty = split_qty_based_on_batch_size(self, row, qty)
+					if row.job_card_qty > 0:
+						self.prepare_data_for_job_card(row, index, plan_days, enable_capacity_planning)
 
 		planned_end_date = self.operations and self.operations[-1].planned_end_time
 		if planned_end_date:
@@ -1304,6 +1306,21 @@ def make_job_card(work_order, operations):
 			if row.job_card_qty > 0:
 				create_job_card(work_order, row, auto_create=True)
 
+
+@frappe.whitelist()
+def submit_work_orders(work_orders):
+	"""Submit Work Orders together, scheduling all their Job Cards against one workstation calendar.
+
+	The Work Orders are submitted in the given order within the same transaction.
+	"""
+	if isinstance(work_orders, str):
+		work_orders = json.loads(work_orders)
+
+	with workstation_calendar():
+		for work_order in work_orders:
+			frappe.get_doc("Work Order", work_order).submit()
+
+
 @frappe.whitelist()
 def close_work_order(work_order, status):
 	if not frappe.has_permission("Work Order", "write"):
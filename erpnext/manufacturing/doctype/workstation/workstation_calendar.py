@@ -0,0 +1,165 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import frappe
+from frappe.utils import add_days, cint, get_datetime
+
+from erpnext.manufacturing.doctype.manufacturing_settings.manufacturing_settings import (
+	get_mins_between_operations,
+)
+from erpnext.manufacturing.doctype.workstation_type.workstation_type import get_workstations
+from erpnext.support.doctype.issue.issue import get_holidays
+
+
+class WorkstationCalendar:
+	"""
+	Busy time of workstations for capacity planning of Job Cards.
+
+	Time logs are loaded once per workstation (type) from the start of the planning window and kept
+	sorted by end time, so the next free slot is found by bisection instead of a query per slot.
+	Time logs scheduled through the calendar are added to it, so Job Cards planned in one batch
+	see each other before they are saved.
+	"""
+
+	def __init__(self) -> None:
+		self.time_logs: Dict[Tuple, Tuple[list, list]] = {}
+		self.loaded_from: Dict[Tuple, datetime] = {}
+		self.workstations = {}
+		self.workstations_by_type = {}
+		self.holidays = {}
+
+		self.allow_overtime = cint(
+			frappe.db.get_single_value("Manufacturing Settings", "allow_overtime")
+		)
+		self.allow_production_on_holidays = cint(
+			frappe.db.get_single_value("Manufacturing Settings", "allow_production_on_holidays")
+		)
+		self.mins_between_operations = get_mins_between_operations()
+
+	def get_workstation(self, workstation: str):
+		if workstation not in self.workstations:
+			self.workstations[workstation] = frappe.get_cached_doc("Workstation", workstation)
+
+		return self.workstations[workstation]
+
+	def get_workstations(self, workstation_type: str) -> List[str]:
+		if workstation_type not in self.workstations_by_type:
+			self.workstations_by_type[workstation_type] = get_workstations(workstation_type)
+
+		return self.workstations_by_type[workstation_type]
+
+	def get_next_working_day(self, workstation: str, schedule_date: date) -> date:
+		"First day from `schedule_date` which is not a holiday of the workstation."
+		holiday_list = self.get_workstation(workstation).holiday_list
+		if not holiday_list or self.allow_production_on_holidays:
+			return schedule_date
+
+		if holiday_list not in self.holidays:
+			self.holidays[holiday_list] = set(get_holidays(holiday_list))
+
+		while schedule_date in self.holidays[holiday_list]:
+			schedule_date = add_days(schedule_date, 1)
+
+		return schedule_date
+
+	def get_overlap(
+		self, workstation_type: Optional[str], workstation: Optional[str], from_time
+	) -> Optional[frappe._dict]:
+		"""
+		Last time log blocking a Job Card from starting at `from_time`, as in
+		`JobCard.get_overlap_for(check_next_available_slot=True)`.
+
+		Time logs running at or starting after `from_time` block the slot once they reach the
+		production capacity of the workstation.
+		"""
+		from_time = get_datetime(from_time)
+		end_times, workstations = self.get_time_logs(workstation_type, workstation, from_time)
+
+		overlaps = len(end_times) - bisect_right(end_times, from_time)
+		production_capacity = 1
+		if workstation:
+			production_capacity = cint(self.get_workstation(workstation).production_capacity) or 1
+
+		if not overlaps or production_capacity > overlaps:
+			return
+
+		return frappe._dict(to_time=end_times[-1], workstation=workstations[-1])
+
+	def get_busy_workstations(
+		self, workstation_type: Optional[str], workstation: Optional[str], from_time
+	) -> Set[str]:
+		from_time = get_datetime(from_time)
+		end_times, workstations = self.get_time_logs(workstation_type, workstation, from_time)
+
+		return set(workstations[bisect_right(end_times, from_time) :])
+
+	def get_time_logs(
+		self, workstation_type: Optional[str], workstation: Optional[str], from_time: datetime
+	) -> Tuple[list, list]:
+		"""
+		End times of the time logs of the workstation (type) ending after `from_time`, sorted,
+		and the workstations of those time logs in the same order.
+		"""
+		key = (workstation_type, workstation)
+		if key in self.time_logs and self.loaded_from[key] <= from_time:
+			return self.time_logs[key]
+
+		jc = frappe.qb.DocType("Job Card")
+		jctl = frappe.qb.DocType("Job Card Time Log")
+		query = (
+			frappe.qb.from_(jctl)
+			.join(jc)
+			.on(jctl.parent == jc.name)
+			.select(jctl.to_time, jc.workstation)
+			.where((jc.docstatus < 2) & (jctl.from_time.isnotnull()) & (jctl.to_time > from_time))
+		)
+		if workstation_type:
+			query = query.where(jc.workstation_type == workstation_type)
+		if workstation:
+			query = query.where(jc.workstation == workstation)
+
+		time_logs = sorted(
+			((get_datetime(to_time), jc_workstation) for to_time, jc_workstation in query.run()),
+			key=lambda row: row[0],
+		)
+		self.time_logs[key] = ([row[0] for row in time_logs], [row[1] for row in time_logs])
+		self.loaded_from[key] = from_time
+
+		return self.time_logs[key]
+
+	def add_time_log(self, workstation_type: Optional[str], workstation: Optional[str], to_time):
+		"Book a scheduled time log in every loaded workstation (type) it belongs to."
+		to_time = get_datetime(to_time)
+		for (key_workstation_type, key_workstation), (end_times, workstations) in self.time_logs.items():
+			if key_workstation_type and key_workstation_type != workstation_type:
+				continue
+			if key_workstation and key_workstation != workstation:
+				continue
+
+			index = bisect_right(end_times, to_time)
+			end_times.insert(index, to_time)
+			workstations.insert(index, workstation)
+
+
+def get_workstation_calendar() -> WorkstationCalendar:
+	"Calendar shared by the current batch, or a new one for a single Job Card."
+	return frappe.flags.workstation_calendar or WorkstationCalendar()
+
+
+@contextmanager
+def workstation_calendar():
+	"Schedule all Job Cards created within the block against one shared calendar."
+	if frappe.flags.workstation_calendar:
+		yield frappe.flags.workstation_calendar
+		return
+
+	frappe.flags.workstation_calendar = WorkstationCalendar()
+	try:
+		yield frappe.flags.workstation_calendar
+	finally:
+		frappe.flags.workstation_calendar = None
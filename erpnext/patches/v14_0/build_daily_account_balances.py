@@ -0,0 +1,7 @@
+from erpnext.accounts.doctype.daily_account_balance.daily_account_balance import (
+	rebuild_account_balances,
+)
+
+
+def execute():
+	rebuild_account_balances()
@@ -0,0 +1,7 @@
+from erpnext.accounts.doctype.payment_ledger_outstanding.payment_ledger_outstanding import (
+	rebuild_outstanding_summary,
+)
+
+
+def execute():
+	rebuild_outstanding_summary()
@@ -0,0 +1,37 @@
+import frappe
+
+from erpnext.stock.doctype.serial_no_ledger_entry.serial_no_ledger_entry import (
+	make_serial_no_ledger_entries,
+)
+
+
+def execute():
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+
+	last_sle = ""
+	while True:
+		sl_entries = (
+			frappe.qb.from_(sle)
+			.select(
+				sle.name,
+				sle.serial_no,
+				sle.item_code,
+				sle.warehouse,
+				sle.company,
+				sle.posting_datetime,
+				sle.voucher_type,
+				sle.voucher_no,
+			)
+			.where((sle.serial_no.isnotnull()) & (sle.serial_no != "") & (sle.name > last_sle))
+			.orderby(sle.name)
+			.limit(10000)
+		).run(as_dict=True)
+
+		if not sl_entries:
+			break
+
+		for row in sl_entries:
+			make_serial_no_ledger_entries(row)
+
+		last_sle = sl_entries[-1].name
+		frappe.db.commit()
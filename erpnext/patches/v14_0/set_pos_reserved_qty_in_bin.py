@@ -0,0 +1,5 @@
+from erpnext.accounts.doctype.pos_invoice.pos_invoice import rebuild_pos_reserved_qty
+
+
+def execute():
+	rebuild_pos_reserved_qty()
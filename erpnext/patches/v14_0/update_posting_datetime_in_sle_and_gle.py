@@ -0,0 +1,40 @@
+import frappe
+
+
+def execute():
+	frappe.db.sql(
+		"""
+		update `tabStock Ledger Entry`
+		set posting_datetime = timestamp(posting_date, time_format(posting_time, %s))
+		where posting_datetime is null
+		""",
+		"%H:%i:%s",
+	)
+
+	frappe.db.sql(
+		"""
+		update `tabGL Entry`
+		set posting_datetime = timestamp(posting_date, '00:00:00')
+		where posting_datetime is null
+		"""
+	)
+
+	# keep the posting time of vouchers which have one
+	voucher_types = frappe.get_all("GL Entry", distinct=True, pluck="voucher_type")
+	voucher_types_with_posting_time = frappe.get_all(
+		"DocField",
+		filters={"fieldname": "posting_time", "parent": ("in", voucher_types)},
+		pluck="parent",
+	)
+
+	for voucher_type in voucher_types_with_posting_time:
+		frappe.db.sql(
+			f"""
+			update `tabGL Entry` gle, `tab{voucher_type}` voucher
+			set gle.posting_datetime = timestamp(gle.posting_date, time_format(voucher.posting_time, %s))
+			where gle.voucher_type = %s
+				and gle.voucher_no = voucher.name
+				and gle.posting_date = voucher.posting_date
+			""",
+			("%H:%i:%s", voucher_type),
+		)
@@ -6,10 +6,14 @@ import json
 from typing import Dict, Optional
 
 import frappe
-from frappe.utils import cint
+from frappe.utils import add_to_date, cint, flt, now
 from frappe.utils.nestedset import get_root_of
 
-from erpnext.accounts.doctype.pos_invoice.pos_invoice import get_stock_availability
+from erpnext.accounts.doctype.pos_invoice.pos_invoice import (
+	get_bundle_availability,
+	get_stock_availability,
+	get_stock_availability_for_items,
+)
 from erpnext.accounts.doctype.pos_profile.pos_profile import get_child_nodes, get_item_groups
 from erpnext.stock.utils import scan_barcode
 
@@ -159,10 +163,12 @@ def get_items(start, page_length, price_list, item_group, pos_profile, search_te
 		for d in item_prices_data:
 			item_prices[d.item_code] = d
 
+		stock_availability = get_stock_availability_for_items(items, warehouse)
+
 		for item in items_data:
 			item_code = item.item_code
 			item_price = item_prices.get(item_code) or {}
-			item_stock_qty, is_stock_item = get_stock_availability(item_code, warehouse)
+			item_stock_qty, is_stock_item = stock_availability.get(item_code, (0, False))
 
 			row = {}
 			row.update(item)
@@ -178,6 +184,178 @@ def get_items(start, page_length, price_list, item_group, pos_profile, search_te
 	return {"items": result}
 
 
+# changes committed by transactions that started before a version was issued can carry an
+# older `modified`, so deltas look back a little further than the version they are asked for
+CATALOGUE_SYNC_OVERLAP = 300
+
+
+@frappe.whitelist()
+def get_catalogue(pos_profile, since=None, price_list=None):
+	"""
+	Items of a POS Profile with their prices, barcodes and available qty for search on the terminal.
+
+	Without `since` the whole catalogue is returned. With the `version` of an earlier response
+	only the items whose Item, Item Barcode, Item Price or Bin changed after it are returned,
+	along with the items which left the catalogue (`removed`).
+	"""
+	version = now()
+	warehouse, selling_price_list = frappe.db.get_value(
+		"POS Profile", pos_profile, ["warehouse", "selling_price_list"]
+	)
+	price_list = price_list or selling_price_list
+
+	item_codes = None
+	if since:
+		item_codes = get_changed_catalogue_items(
+			add_to_date(since, seconds=-CATALOGUE_SYNC_OVERLAP), warehouse, price_list
+		)
+		if not item_codes:
+			return {"version": version, "since": since, "items": [], "removed": []}
+
+	items = get_catalogue_items(pos_profile, warehouse, price_list, item_codes)
+
+	return {
+		"version": version,
+		"since": since,
+		"items": items,
+		"removed": sorted(set(item_codes) - {d.item_code for d in items}) if since else [],
+	}
+
+
+def get_changed_catalogue_items(since, warehouse, price_list):
+	changed = set(frappe.get_all("Item", filters={"modified": (">", since)}, pluck="name"))
+	changed.update(
+		frappe.get_all(
+			"Item Barcode", filters={"parenttype": "Item", "modified": (">", since)}, pluck="parent"
+		)
+	)
+	changed.update(
+		frappe.get_all(
+			"Item Price",
+			filters={"price_list": price_list, "modified": (">", since)},
+			pluck="item_code",
+		)
+	)
+
+	bin_items = frappe.get_all(
+		"Bin", filters={"warehouse": warehouse, "modified": (">", since)}, pluck="item_code"
+	)
+	changed.update(bin_items)
+	if bin_items:
+		# availability of bundles follows the stock of their components
+		changed.update(
+			frappe.get_all(
+				"Product Bundle Item",
+				filters={"parenttype": "Product Bundle", "item_code": ("in", bin_items)},
+				pluck="parent",
+			)
+		)
+
+	for d in frappe.get_all(
+		"Deleted Document",
+		filters={"deleted_doctype": ("in", ["Item", "Item Price"]), "creation": (">", since)},
+		fields=["deleted_doctype", "deleted_name", "data"],
+	):
+		if d.deleted_doctype == "Item":
+			changed.add(d.deleted_name)
+		elif json.loads(d.data).get("price_list") == price_list:
+			changed.add(json.loads(d.data).get("item_code"))
+
+	changed.discard(None)
+	return list(changed)
+
+
+def get_catalogue_items(pos_profile, warehouse, price_list, item_codes=None):
+	search_fields = [
+		d.fieldname
+		for d in frappe.get_all("POS Search Fields", fields=["fieldname"])
+		if d.fieldname not in ("name", "item_name", "description", "item_group", "stock_uom")
+	]
+
+	condition = get_item_group_condition(pos_profile)
+	if item_codes is not None:
+		condition += " and item.name in %(item_codes)s"
+
+	items = frappe.db.sql(
+		"""
+		SELECT
+			item.name AS item_code,
+			item.item_name,
+			item.description,
+			item.item_group,
+			item.stock_uom,
+			item.image AS item_image,
+			item.is_stock_item
+			{search_fields}
+		FROM
+			`tabItem` item
+		WHERE
+			item.disabled = 0
+			AND item.has_variants = 0
+			AND item.is_sales_item = 1
+			AND item.is_fixed_asset = 0
+			{condition}
+		ORDER BY
+			item.name asc""".format(
+			search_fields="".join(", item.`{0}`".format(field) for field in search_fields),
+			condition=condition,
+		),
+		{"item_codes": tuple(item_codes or ())},
+		as_dict=1,
+	)
+
+	if not items:
+		return items
+
+	item_filter = {"item_code": ("in", item_codes)} if item_codes is not None else {}
+
+	prices = {}
+	for d in frappe.get_all(
+		"Item Price",
+		filters={"price_list": price_list, **item_filter},
+		fields=["item_code", "uom", "price_list_rate", "currency"],
+	):
+		prices.setdefault(d.item_code, []).append([d.uom, d.price_list_rate, d.currency])
+
+	barcodes = {}
+	for d in frappe.get_all(
+		"Item Barcode",
+		filters={
+			"parenttype": "Item",
+			**({"parent": ("in", item_codes)} if item_codes is not None else {}),
+		},
+		fields=["parent", "barcode", "uom"],
+	):
+		barcodes.setdefault(d.parent, []).append([d.barcode, d.uom])
+
+	available_qty = {}
+	for d in frappe.get_all(
+		"Bin",
+		filters={"warehouse": warehouse, **item_filter},
+		fields=["item_code", "actual_qty", "pos_reserved_qty"],
+	):
+		available_qty[d.item_code] = flt(d.actual_qty) - flt(d.pos_reserved_qty)
+
+	non_stock_items = [d.item_code for d in items if not d.is_stock_item]
+	bundles = set()
+	if non_stock_items:
+		bundles = set(
+			frappe.get_all("Product Bundle", filters={"name": ("in", non_stock_items)}, pluck="name")
+		)
+
+	for d in items:
+		d.prices = prices.get(d.item_code, [])
+		d.barcodes = barcodes.get(d.item_code, [])
+		if d.is_stock_item:
+			d.actual_qty = available_qty.get(d.item_code, 0)
+		elif d.item_code in bundles:
+			d.actual_qty = get_bundle_availability(d.item_code, warehouse)
+		else:
+			d.actual_qty = 0
+
+	return items
+
+
 @frappe.whitelist()
 def search_for_serial_or_batch_or_barcode_number(search_value: str) -> Dict[str, Optional[str]]:
 	return scan_barcode(search_value)
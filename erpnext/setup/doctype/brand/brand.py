@@ -13,7 +13,8 @@ class Brand(Document):
 
 
 def get_brand_defaults(item, company):
-	item = frappe.get_cached_doc("Item", item)
+	if isinstance(item, str):
+		item = frappe.get_cached_doc("Item", item)
 	if item.brand:
 		brand = frappe.get_cached_doc("Brand", item.brand)
 
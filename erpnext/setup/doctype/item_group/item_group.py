@@ -210,7 +210,8 @@ def invalidate_cache_for(doc, item_group=None):
 
 
 def get_item_group_defaults(item, company):
-	item = frappe.get_cached_doc("Item", item)
+	if isinstance(item, str):
+		item = frappe.get_cached_doc("Item", item)
 	item_group = frappe.get_cached_doc("Item Group", item.item_group)
 
 	for d in item_group.item_group_defaults or []:
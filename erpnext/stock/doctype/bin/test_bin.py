@@ -32,3 +32,36 @@ class TestBin(FrappeTestCase):
 		indexes = frappe.db.sql("show index from tabBin where Non_unique = 0", as_dict=1)
 		if not any(index.get("Key_name") == "unique_item_warehouse" for index in indexes):
 			self.fail(f"Expected unique index on item-warehouse")
+
+	def test_rebuild_bins(self):
+		from erpnext.buying.doctype.purchase_order.test_purchase_order import create_purchase_order
+		from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+		from erpnext.stock.stock_balance import rebuild_bins
+
+		item_code = make_item("_TestRebuildBinItem", {"is_stock_item": 1}).name
+		warehouse = "_Test Warehouse - _TC"
+
+		make_stock_entry(item_code=item_code, target=warehouse, qty=10, rate=100)
+		create_purchase_order(item_code=item_code, warehouse=warehouse, qty=5)
+
+		bin = frappe.db.get_value("Bin", {"item_code": item_code, "warehouse": warehouse})
+		expected = frappe.db.get_value(
+			"Bin", bin, ["actual_qty", "ordered_qty", "projected_qty"], as_dict=True
+		)
+		self.assertEqual((expected.actual_qty, expected.ordered_qty), (10, 5))
+		self.assertFalse(rebuild_bins(items=[item_code], update=False))
+
+		frappe.db.set_value("Bin", bin, {"actual_qty": 0, "ordered_qty": 1, "projected_qty": 1})
+
+		differences = rebuild_bins(company="_Test Company", items=[item_code])
+		self.assertEqual(
+			sorted((d.field, d.old_value, d.new_value) for d in differences),
+			[("actual_qty", 0, 10), ("ordered_qty", 1, 5)],
+		)
+		self.assertEqual(
+			frappe.db.get_value("Bin", bin, ["actual_qty", "ordered_qty", "projected_qty"], as_dict=True),
+			expected,
+		)
+		self.assertFalse(rebuild_bins(warehouse=warehouse, items=[item_code]))
+
+		frappe.db.rollback()
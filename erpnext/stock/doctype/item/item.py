@@ -125,6 +125,25 @@ class Item(Document):
 		self.update_variants()
 		self.update_item_price()
 		self.update_website_item()
+		self.clear_exploded_bom_cache()
+
+	def clear_exploded_bom_cache(self):
+		"""Exploded BOMs depend on the default BOM and planning settings of their items"""
+		if not self.get_doc_before_save():
+			return
+
+		if any(
+			self.has_value_changed(field)
+			for field in (
+				"default_bom",
+				"default_material_request_type",
+				"is_sub_contracted_item",
+				"is_stock_item",
+			)
+		):
+			from erpnext.manufacturing.doctype.bom.bom import clear_exploded_bom_cache
+
+			clear_exploded_bom_cache()
 
 	def validate_description(self):
 		"""Clean HTML description if set"""
@@ -1186,7 +1205,8 @@ def check_stock_uom_with_bin(item, stock_uom):
 
 
 def get_item_defaults(item_code, company):
-	item = frappe.get_cached_doc("Item", item_code)
+	"""Item fields with the Item Default of `company`. `item_code` can also be an Item document"""
+	item = frappe.get_cached_doc("Item", item_code) if isinstance(item_code, str) else item_code
 
 	out = item.as_dict()
 
@@ -7,7 +7,19 @@ from frappe.exceptions import QueryDeadlockError, QueryTimeoutError
 from frappe.model.document import Document
 from frappe.query_builder import DocType, Interval
 from frappe.query_builder.functions import Now
-from frappe.utils import cint, get_link_to_form, get_weekday, getdate, now, nowtime
+from frappe.utils import (
+	cint,
+	cstr,
+	flt,
+	get_link_to_form,
+	get_weekday,
+	getdate,
+	now,
+	now_datetime,
+	nowtime,
+	time_diff_in_seconds,
+)
+from frappe.utils.background_jobs import get_jobs
 from frappe.utils.user import get_users_with_role
 from rq.timeouts import JobTimeoutException
 
@@ -21,6 +33,8 @@ from erpnext.stock.stock_ledger import (
 
 RecoverableErrors = (JobTimeoutException, QueryDeadlockError, QueryTimeoutError)
 
+PARALLEL_REPOST_JOB = "repost_item_valuation_worker"
+
 
 class RepostItemValuation(Document):
 	@staticmethod
@@ -167,6 +181,7 @@ def repost(doc):
 		frappe.db.MAX_WRITES_PER_TRANSACTION *= 4
 
 		doc.set_status("In Progress")
+		doc.db_set("reposting_started_at", now_datetime(), update_modified=False)
 		if not frappe.flags.in_test:
 			frappe.db.commit()
 
@@ -174,6 +189,7 @@ def repost(doc):
 		repost_gl_entries(doc)
 
 		doc.set_status("Completed")
+		update_reposting_metrics(doc)
 
 	except Exception as e:
 		if frappe.flags.in_test:
@@ -198,6 +214,24 @@ def repost(doc):
 			frappe.db.commit()
 
 
+def update_reposting_metrics(doc):
+	"""Record the item-warehouses reposted by this run and the rate at which they were processed"""
+	started_at, items_reposted = frappe.db.get_value(
+		doc.doctype, doc.name, ["reposting_started_at", "current_index"]
+	)
+	completed_at = now_datetime()
+	minutes_taken = time_diff_in_seconds(completed_at, started_at) / 60 if started_at else 0
+
+	doc.db_set(
+		{
+			"reposting_completed_at": completed_at,
+			"items_reposted": cint(items_reposted),
+			"reposting_throughput": flt(cint(items_reposted) / minutes_taken, 2) if minutes_taken else 0,
+		},
+		update_modified=False,
+	)
+
+
 def repost_sl_entries(doc):
 	if doc.based_on == "Transaction":
 		repost_future_sle(
@@ -300,8 +334,19 @@ def repost_entries():
 	if not in_configured_timeslot():
 		return
 
+	# entries of running partition jobs are "In Progress" and must not be picked up again
+	if is_parallel_reposting_in_progress():
+		return
+
 	riv_entries = get_repost_item_valuation_entries()
 
+	workers = cint(
+		frappe.db.get_single_value("Stock Reposting Settings", "parallel_reposting_workers")
+	)
+	if workers > 1 and len(riv_entries) > 1:
+		enqueue_parallel_reposts(riv_entries, workers)
+		return
+
 	for row in riv_entries:
 		doc = frappe.get_doc("Repost Item Valuation", row.name)
 		if doc.status in ("Queued", "In Progress"):
@@ -313,6 +358,167 @@ def repost_entries():
 		return
 
 
+def enqueue_parallel_reposts(riv_entries, workers):
+	"""Split pending reposts into partitions of unrelated items and repost them concurrently."""
+	partitions = get_repost_partitions(riv_entries, workers)
+	for idx, names in enumerate(partitions, start=1):
+		frappe.enqueue(
+			repost_partition,
+			queue="long",
+			job_name=f"{PARALLEL_REPOST_JOB}_{idx}",
+			names=names,
+			worker=idx,
+			workers=len(partitions),
+		)
+
+
+def is_parallel_reposting_in_progress():
+	site = frappe.local.site
+	job_names = get_jobs(site=site, queue="long", key="job_name").get(site) or []
+	return any(cstr(job_name).startswith(PARALLEL_REPOST_JOB) for job_name in job_names)
+
+
+def repost_partition(names, worker, workers):
+	"""Repost the entries of one partition in order, runs as one of the parallel workers."""
+	for position, name in enumerate(names, start=1):
+		if not in_configured_timeslot():
+			return
+
+		doc = frappe.get_doc("Repost Item Valuation", name)
+		if doc.status not in ("Queued", "In Progress"):
+			continue
+
+		doc.db_set(
+			{
+				"repost_worker": f"{worker} / {workers}",
+				"worker_progress": f"{position} / {len(names)}",
+			},
+			update_modified=False,
+		)
+		repost(doc)
+		doc.deduplicate_similar_repost()
+
+
+def get_repost_partitions(riv_entries, workers):
+	"""Group pending reposts which can affect each other and spread the groups over workers.
+
+	Two reposts are related when they share an item, or when their items are linked by a
+	chain of vouchers posted after the earliest pending repost, each sharing an item with the
+	next. Revaluing one item changes the valuation of the others in the same voucher
+	(eg: manufacture, repack) and the GL entries of such vouchers are reposted for all of them
+	(see `_get_directly_dependent_vouchers`), which cascades further through their vouchers.
+	Related reposts are kept in one partition and processed in their original order.
+
+	returns: list of partitions, each a list of Repost Item Valuation names
+	"""
+	names = [row.name for row in riv_entries]
+	docs = frappe.get_all(
+		"Repost Item Valuation",
+		filters={"name": ("in", names)},
+		fields=["name", "based_on", "voucher_type", "voucher_no", "item_code", "posting_date"],
+	)
+
+	items_by_voucher = get_items_by_voucher(
+		[(doc.voucher_type, doc.voucher_no) for doc in docs if doc.based_on == "Transaction"]
+	)
+
+	parent = {}
+
+	def find(item):
+		parent.setdefault(item, item)
+		while parent[item] != item:
+			parent[item] = parent[parent[item]]
+			item = parent[item]
+		return item
+
+	def union(items):
+		items = list(items)
+		for item in items[1:]:
+			parent[find(item)] = find(items[0])
+
+	repost_items = {}
+	for doc in docs:
+		if doc.based_on == "Transaction":
+			repost_items[doc.name] = items_by_voucher.get((doc.voucher_type, doc.voucher_no)) or set()
+		else:
+			repost_items[doc.name] = {doc.item_code}
+		union(repost_items[doc.name])
+
+	from_date = min((doc.posting_date for doc in docs), default=None)
+	for items in get_items_transacted_together(set().union(*repost_items.values()), from_date):
+		union(items)
+
+	groups = {}
+	for name in names:
+		items = repost_items.get(name)
+		key = find(next(iter(items))) if items else name
+		groups.setdefault(key, []).append(name)
+
+	# longest partitions first, each to the least loaded worker
+	partitions = [[] for _ in range(min(workers, len(groups)))]
+	for group in sorted(groups.values(), key=len, reverse=True):
+		min(partitions, key=len).extend(group)
+
+	position = {name: idx for idx, name in enumerate(names)}
+	return [sorted(partition, key=position.get) for partition in partitions]
+
+
+def get_items_by_voucher(vouchers):
+	items_by_voucher = {}
+	if not vouchers:
+		return items_by_voucher
+
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+	rows = (
+		frappe.qb.from_(sle)
+		.select(sle.voucher_type, sle.voucher_no, sle.item_code)
+		.distinct()
+		.where(sle.voucher_no.isin([voucher_no for _voucher_type, voucher_no in vouchers]))
+		.run(as_dict=True)
+	)
+
+	for row in rows:
+		items_by_voucher.setdefault((row.voucher_type, row.voucher_no), set()).add(row.item_code)
+
+	return items_by_voucher
+
+
+def get_items_transacted_together(items, from_date):
+	"""Item sets of stock vouchers with more than one item posted on or after `from_date`,
+	reachable from `items` through vouchers sharing an item"""
+	if not (items and from_date):
+		return []
+
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+	filters = (sle.posting_date >= from_date) & (sle.is_cancelled == 0)
+
+	items_by_voucher = {}
+	seen_items, new_items = set(items), set(items)
+	while new_items:
+		# vouchers with an item reached in the last pass, all others are fetched already
+		vouchers = (
+			frappe.qb.from_(sle)
+			.select(sle.voucher_no)
+			.distinct()
+			.where(filters & sle.item_code.isin(list(new_items)))
+		)
+		rows = (
+			frappe.qb.from_(sle)
+			.select(sle.voucher_type, sle.voucher_no, sle.item_code)
+			.distinct()
+			.where(filters & sle.voucher_no.isin(vouchers))
+			.run()
+		)
+
+		for voucher_type, voucher_no, item_code in rows:
+			items_by_voucher.setdefault((voucher_type, voucher_no), set()).add(item_code)
+
+		new_items = {item_code for _voucher_type, _voucher_no, item_code in rows} - seen_items
+		seen_items |= new_items
+
+	return [items for items in items_by_voucher.values() if len(items) > 1]
+
+
 def get_repost_item_valuation_entries():
 	return frappe.db.sql(
 		""" SELECT name from `tabRepost Item Valuation`
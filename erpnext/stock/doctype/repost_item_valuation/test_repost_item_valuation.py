@@ -14,7 +14,9 @@ from erpnext.controllers.stock_controller import create_item_wise_repost_entries
 from erpnext.stock.doctype.item.test_item import make_item
 from erpnext.stock.doctype.purchase_receipt.test_purchase_receipt import make_purchase_receipt
 from erpnext.stock.doctype.repost_item_valuation.repost_item_valuation import (
+	get_repost_partitions,
 	in_configured_timeslot,
+	repost_partition,
 )
 from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
 from erpnext.stock.tests.test_utils import StockTestMixin
@@ -376,3 +378,111 @@ class TestRepostItemValuation(FrappeTestCase, StockTestMixin):
 
 		accounts_settings.acc_frozen_upto = ""
 		accounts_settings.save()
+
+	def test_parallel_repost_partitions(self):
+		warehouse = "_Test Warehouse - _TC"
+		posting_date = add_days(today(), -10)
+		items = [make_item(properties={"is_stock_item": 1}).name for _ in range(3)]
+
+		for item in items:
+			make_stock_entry(item_code=item, target=warehouse, qty=5, rate=10, posting_date=posting_date)
+
+		# first two items are received together later, their reposts are related
+		receipt = make_stock_entry(
+			item_code=items[0], target=warehouse, qty=1, rate=10, do_not_save=True
+		)
+		row = frappe.copy_doc(receipt.items[0])
+		row.item_code = items[1]
+		receipt.append("items", row)
+		receipt.submit()
+
+		rivs = []
+		for item in items:
+			riv = frappe.get_doc(
+				doctype="Repost Item Valuation",
+				item_code=item,
+				warehouse=warehouse,
+				based_on="Item and Warehouse",
+				posting_date=posting_date,
+				posting_time="00:01:00",
+			)
+			riv.flags.dont_run_in_test = True
+			riv.submit()
+			rivs.append(riv)
+
+		riv_entries = [frappe._dict(name=riv.name) for riv in rivs]
+		partitions = get_repost_partitions(riv_entries, workers=4)
+		self.assertEqual(len(partitions), 2)
+		self.assertIn([rivs[0].name, rivs[1].name], partitions)
+		self.assertIn([rivs[2].name], partitions)
+
+		self.assertEqual(get_repost_partitions(riv_entries, workers=1), [[riv.name for riv in rivs]])
+
+		repost_partition([rivs[2].name], worker=2, workers=2)
+		rivs[2].load_from_db()
+		self.assertEqual(rivs[2].status, "Completed")
+		self.assertEqual(rivs[2].repost_worker, "2 / 2")
+		self.assertEqual(rivs[2].worker_progress, "1 / 1")
+		self.assertEqual(rivs[2].items_reposted, 1)
+		self.assertTrue(rivs[2].reposting_completed_at)
+
+		for riv in rivs[:2]:
+			riv.set_status("Skipped")
+
+	def test_parallel_repost_partitions_on_busy_ledger(self):
+		warehouse = "_Test Warehouse - _TC"
+		posting_date = add_days(today(), -10)
+		items = [make_item(properties={"is_stock_item": 1}).name for _ in range(8)]
+		pending_items, other_items = items[:4], items[4:]
+
+		def make_receipt(item_codes, posting_date=None):
+			receipt = make_stock_entry(
+				item_code=item_codes[0],
+				target=warehouse,
+				qty=5,
+				rate=10,
+				posting_date=posting_date,
+				do_not_save=True,
+			)
+			for item_code in item_codes[1:]:
+				row = frappe.copy_doc(receipt.items[0])
+				row.item_code = item_code
+				receipt.append("items", row)
+			receipt.submit()
+
+		for item in items:
+			make_receipt([item], posting_date=posting_date)
+
+		# pending reposts of items transacted together stay together
+		make_receipt(pending_items[:2])
+
+		# a repost cascades through vouchers of items without pending reposts, so a chain of
+		# such vouchers relates the reposts at its ends
+		make_receipt([pending_items[0], other_items[0]])
+		make_receipt(other_items[:2])
+		make_receipt([other_items[1], pending_items[2]])
+
+		# vouchers of other items only do not relate any pending repost
+		make_receipt(other_items[2:])
+
+		rivs = []
+		for item in pending_items:
+			riv = frappe.get_doc(
+				doctype="Repost Item Valuation",
+				item_code=item,
+				warehouse=warehouse,
+				based_on="Item and Warehouse",
+				posting_date=posting_date,
+				posting_time="00:01:00",
+			)
+			riv.flags.dont_run_in_test = True
+			riv.submit()
+			rivs.append(riv)
+
+		partitions = get_repost_partitions([frappe._dict(name=riv.name) for riv in rivs], workers=4)
+		self.assertEqual(len(partitions), 2)
+		self.assertIn([rivs[0].name, rivs[1].name, rivs[2].name], partitions)
+		self.assertIn([rivs[3].name], partitions)
+
+		for riv in rivs:
+			riv.set_status("Skipped")
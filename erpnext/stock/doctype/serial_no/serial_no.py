@@ -208,53 +208,39 @@ class SerialNo(StockController):
 
 		for sle in frappe.db.sql(
 			"""
-			SELECT voucher_type, voucher_no,
-				posting_date, posting_time, incoming_rate, actual_qty, serial_no
+			SELECT sle.voucher_type, sle.voucher_no,
+				sle.posting_date, sle.posting_time, sle.incoming_rate, sle.actual_qty, sle.serial_no
 			FROM
-				`tabStock Ledger Entry`
+				`tabSerial No Ledger Entry` serial_ledger
+			INNER JOIN `tabStock Ledger Entry` sle
+				ON sle.name = serial_ledger.stock_ledger_entry
 			WHERE
-				item_code=%s AND company = %s
-				AND is_cancelled = 0
-				AND (serial_no = %s
-					OR serial_no like %s
-					OR serial_no like %s
-					OR serial_no like %s
-				)
+				serial_ledger.serial_no = %s
+				AND serial_ledger.item_code = %s
+				AND serial_ledger.company = %s
+				AND sle.is_cancelled = 0
 			ORDER BY
-				posting_date desc, posting_time desc, creation desc""",
-			(
-				self.item_code,
-				self.company,
-				serial_no,
-				serial_no + "\n%",
-				"%\n" + serial_no,
-				"%\n" + serial_no + "\n%",
-			),
+				sle.posting_datetime desc, sle.creation desc""",
+			(serial_no, self.item_code, self.company),
 			as_dict=1,
 		):
-			if serial_no.upper() in get_serial_nos(sle.serial_no):
-				if cint(sle.actual_qty) > 0:
-					sle_dict.setdefault("incoming", []).append(sle)
-				else:
-					sle_dict.setdefault("outgoing", []).append(sle)
+			if cint(sle.actual_qty) > 0:
+				sle_dict.setdefault("incoming", []).append(sle)
+			else:
+				sle_dict.setdefault("outgoing", []).append(sle)
 
 		return sle_dict
 
 	def on_trash(self):
-		sl_entries = frappe.db.sql(
-			"""select serial_no from `tabStock Ledger Entry`
-			where serial_no like %s and item_code=%s and is_cancelled=0""",
-			("%%%s%%" % self.name, self.item_code),
-			as_dict=True,
+		sle_exists = frappe.db.sql(
+			"""select serial_ledger.name
+			from `tabSerial No Ledger Entry` serial_ledger
+			inner join `tabStock Ledger Entry` sle on sle.name = serial_ledger.stock_ledger_entry
+			where serial_ledger.serial_no = %s and serial_ledger.item_code = %s and sle.is_cancelled = 0
+			limit 1""",
+			(self.name, self.item_code),
 		)
 
-		# Find the exact match
-		sle_exists = False
-		for d in sl_entries:
-			if self.name.upper() in get_serial_nos(d.serial_no):
-				sle_exists = True
-				break
-
 		if sle_exists:
 			frappe.throw(
 				_("Cannot delete Serial No {0}, as it is used in stock transactions").format(self.name)
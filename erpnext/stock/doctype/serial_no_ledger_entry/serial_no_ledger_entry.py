@@ -0,0 +1,91 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import now
+
+
+class SerialNoLedgerEntry(Document):
+	pass
+
+
+def make_serial_no_ledger_entries(sle):
+	"""Index the serial nos of a submitted Stock Ledger Entry, one row per serial no"""
+	from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
+
+	serial_nos = get_serial_nos(sle.serial_no)
+	if not serial_nos:
+		return
+
+	fields = [
+		"name",
+		"serial_no",
+		"stock_ledger_entry",
+		"item_code",
+		"warehouse",
+		"company",
+		"posting_datetime",
+		"voucher_type",
+		"voucher_no",
+		"creation",
+		"modified",
+		"owner",
+		"modified_by",
+	]
+
+	timestamp = now()
+	values = [
+		(
+			frappe.generate_hash(length=10),
+			serial_no,
+			sle.name,
+			sle.item_code,
+			sle.warehouse,
+			sle.company,
+			sle.posting_datetime,
+			sle.voucher_type,
+			sle.voucher_no,
+			timestamp,
+			timestamp,
+			frappe.session.user,
+			frappe.session.user,
+		)
+		for serial_no in serial_nos
+	]
+
+	frappe.db.bulk_insert("Serial No Ledger Entry", fields, values)
+
+
+def get_serial_no_condition(serial_no, item_code=None, sle_alias=None):
+	"""SQL condition matching SLEs which contain any of the serial nos.
+
+	:param serial_no: serial no or newline separated serial nos
+	:param item_code: restrict the index lookup to an item
+	:param sle_alias: alias of `tabStock Ledger Entry` in the query
+	"""
+	from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
+
+	serial_nos = get_serial_nos(serial_no)
+	item_condition = f"and item_code = {frappe.db.escape(item_code)}" if item_code else ""
+	sle_name = f"{sle_alias}.name" if sle_alias else "name"
+
+	return f"""{sle_name} in (
+			select stock_ledger_entry from `tabSerial No Ledger Entry`
+			where serial_no in ({", ".join(frappe.db.escape(sn) for sn in serial_nos)})
+			{item_condition}
+		)"""
+
+
+def rename_stock_ledger_entry(oldname, newname):
+	frappe.db.set_value(
+		"Serial No Ledger Entry",
+		{"stock_ledger_entry": oldname},
+		"stock_ledger_entry",
+		newname,
+		update_modified=False,
+	)
+
+
+def on_doctype_update():
+	frappe.db.add_index("Serial No Ledger Entry", ["serial_no", "item_code", "posting_datetime"])
@@ -0,0 +1,34 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+
+
+class TestSerialNoLedgerEntry(FrappeTestCase):
+	def test_serial_no_ledger_entries(self):
+		item_code = make_item(properties={"has_serial_no": 1, "serial_no_series": "TSNLE-.#####"}).name
+		warehouse = "_Test Warehouse - _TC"
+
+		receipt = make_stock_entry(item_code=item_code, target=warehouse, qty=2, rate=100)
+		serial_nos = get_serial_nos(receipt.items[0].serial_no)
+
+		# auto created serial nos are indexed too
+		sle = frappe.db.get_value("Stock Ledger Entry", {"voucher_no": receipt.name, "is_cancelled": 0})
+		indexed_serial_nos = frappe.get_all(
+			"Serial No Ledger Entry", {"stock_ledger_entry": sle}, pluck="serial_no"
+		)
+		self.assertEqual(sorted(indexed_serial_nos), sorted(serial_nos))
+
+		issue = make_stock_entry(item_code=item_code, source=warehouse, qty=1, serial_no=serial_nos[0])
+		vouchers = frappe.get_all("Serial No Ledger Entry", {"serial_no": serial_nos[0]}, pluck="voucher_no")
+		self.assertEqual(sorted(vouchers), sorted([receipt.name, issue.name]))
+
+		# reversed entries of cancelled voucher are indexed as well
+		issue.cancel()
+		self.assertEqual(frappe.db.get_value("Serial No", serial_nos[0], "warehouse"), warehouse)
+		self.assertEqual(frappe.db.count("Serial No Ledger Entry", {"voucher_no": issue.name}), 2)
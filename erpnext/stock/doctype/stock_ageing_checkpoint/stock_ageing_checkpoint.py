@@ -0,0 +1,108 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import json
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_months, get_last_day, getdate, now, today
+
+LAST_CHECKPOINT_DATE_KEY = "last_stock_ageing_checkpoint_date"
+
+
+class StockAgeingCheckpoint(Document):
+	pass
+
+
+def make_stock_ageing_checkpoints(posting_date=None, company=None):
+	"""Save the FIFO slots of every item-warehouse as on `posting_date` (default: last month-end).
+
+	Stock Ageing reports start from the nearest checkpoint and only replay the SLEs posted after it.
+	Serialized items are skipped as their slots depend on the purchase date of every serial no.
+	"""
+	from erpnext.stock.report.stock_ageing.stock_ageing import FIFOSlots
+
+	posting_date = getdate(posting_date or get_last_day(add_months(today(), -1)))
+	companies = [company] if company else frappe.get_all("Company", pluck="name")
+
+	fields = [
+		"name",
+		"item_code",
+		"warehouse",
+		"company",
+		"posting_date",
+		"qty_after_transaction",
+		"total_qty",
+		"fifo_queue",
+		"creation",
+		"modified",
+		"owner",
+		"modified_by",
+	]
+
+	for company in companies:
+		filters = frappe._dict(
+			{"company": company, "to_date": posting_date, "show_warehouse_wise_stock": True}
+		)
+		item_details = FIFOSlots(filters).generate()
+
+		frappe.db.delete("Stock Ageing Checkpoint", {"company": company, "posting_date": posting_date})
+
+		timestamp = now()
+		values = [
+			(
+				frappe.generate_hash(length=10),
+				item_code,
+				warehouse,
+				company,
+				posting_date,
+				row.get("qty_after_transaction"),
+				row.get("total_qty"),
+				json.dumps(row["fifo_queue"], default=str),
+				timestamp,
+				timestamp,
+				frappe.session.user,
+				frappe.session.user,
+			)
+			for (item_code, warehouse), row in item_details.items()
+			if not row.get("has_serial_no")
+		]
+
+		frappe.db.bulk_insert("Stock Ageing Checkpoint", fields, values)
+
+	frappe.cache().delete_value(LAST_CHECKPOINT_DATE_KEY)
+
+
+def invalidate_stock_ageing_checkpoints(item_code, warehouse, posting_date):
+	"""Drop checkpoints which include or follow a (backdated) change at `posting_date`"""
+	if not posting_date:
+		return
+
+	last_checkpoint_date = get_last_checkpoint_date()
+	if not last_checkpoint_date or getdate(posting_date) > getdate(last_checkpoint_date):
+		return
+
+	frappe.db.delete(
+		"Stock Ageing Checkpoint",
+		{"item_code": item_code, "warehouse": warehouse, "posting_date": (">=", posting_date)},
+	)
+
+
+def get_last_checkpoint_date():
+	def get_max_posting_date():
+		date = frappe.db.sql("select max(posting_date) from `tabStock Ageing Checkpoint`")
+		return date[0][0] if date and date[0][0] else ""
+
+	return frappe.cache().get_value(LAST_CHECKPOINT_DATE_KEY, generator=get_max_posting_date)
+
+
+def parse_fifo_queue(fifo_queue):
+	"Load a saved FIFO queue, restoring slot dates."
+	return [
+		[qty, getdate(posting_date) if posting_date else posting_date]
+		for qty, posting_date in json.loads(fifo_queue or "[]")
+	]
+
+
+def on_doctype_update():
+	frappe.db.add_index("Stock Ageing Checkpoint", ["item_code", "warehouse", "posting_date"])
@@ -0,0 +1,60 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.stock_ageing_checkpoint.stock_ageing_checkpoint import (
+	make_stock_ageing_checkpoints,
+)
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+from erpnext.stock.report.stock_ageing.stock_ageing import FIFOSlots
+
+
+class TestStockAgeingCheckpoint(FrappeTestCase):
+	def test_fifo_slots_from_checkpoint(self):
+		item_code = make_item("_Test Stock Ageing Checkpoint Item", {"is_stock_item": 1}).name
+		warehouse = "_Test Warehouse - _TC"
+		key = (item_code, warehouse)
+
+		make_stock_entry(
+			item_code=item_code, target=warehouse, qty=10, rate=100, posting_date="2026-01-05"
+		)
+		make_stock_entry(item_code=item_code, source=warehouse, qty=3, posting_date="2026-01-20")
+		make_stock_entry(
+			item_code=item_code, target=warehouse, qty=5, rate=100, posting_date="2026-02-10"
+		)
+
+		filters = frappe._dict(
+			company="_Test Company",
+			to_date="2026-02-28",
+			item_code=item_code,
+			show_warehouse_wise_stock=True,
+		)
+		expected = FIFOSlots(filters).generate()[key]
+
+		make_stock_ageing_checkpoints("2026-01-31", company="_Test Company")
+		checkpoint = frappe.get_all(
+			"Stock Ageing Checkpoint",
+			filters={"item_code": item_code, "warehouse": warehouse},
+			fields=["posting_date", "qty_after_transaction"],
+		)
+		self.assertEqual(len(checkpoint), 1)
+		self.assertEqual(checkpoint[0].qty_after_transaction, 7)
+
+		# only entries after the checkpoint are replayed
+		slots = FIFOSlots(filters).generate()[key]
+		for field in ("fifo_queue", "qty_after_transaction", "total_qty"):
+			self.assertEqual(slots[field], expected[field])
+
+		# backdated entry invalidates the checkpoint
+		make_stock_entry(
+			item_code=item_code, target=warehouse, qty=2, rate=100, posting_date="2026-01-25"
+		)
+		self.assertFalse(
+			frappe.db.exists("Stock Ageing Checkpoint", {"item_code": item_code, "warehouse": warehouse})
+		)
+
+		slots = FIFOSlots(filters).generate()[key]
+		self.assertEqual(slots["qty_after_transaction"], 14)
@@ -44,6 +44,7 @@ class StockLedgerEntry(Document):
 		validate_disabled_warehouse(self.warehouse)
 		validate_warehouse_company(self.warehouse, self.company)
 		self.scrub_posting_time()
+		self.set_posting_datetime()
 		self.validate_and_set_fiscal_year()
 		self.block_transactions_against_group_warehouse()
 		self.validate_with_last_transaction_posting_time()
@@ -57,6 +58,13 @@ class StockLedgerEntry(Document):
 
 			process_serial_no(self)
 
+		if self.serial_no:
+			from erpnext.stock.doctype.serial_no_ledger_entry.serial_no_ledger_entry import (
+				make_serial_no_ledger_entries,
+			)
+
+			make_serial_no_ledger_entries(self)
+
 	def calculate_batch_qty(self):
 		if self.batch_no:
 			batch_qty = (
@@ -150,6 +158,11 @@ class StockLedgerEntry(Document):
 		if not self.posting_time or self.posting_time == "00:0":
 			self.posting_time = "00:00"
 
+	def set_posting_datetime(self):
+		from erpnext.stock.utils import get_combine_datetime
+
+		self.posting_datetime = get_combine_datetime(self.posting_date, self.posting_time)
+
 	def validate_batch(self):
 		if self.batch_no and self.voucher_type != "Stock Entry":
 			if (self.voucher_type in ["Purchase Receipt", "Purchase Invoice"] and self.actual_qty < 0) or (
@@ -226,3 +239,8 @@ def on_doctype_update():
 	frappe.db.add_index("Stock Ledger Entry", ["voucher_no", "voucher_type"])
 	frappe.db.add_index("Stock Ledger Entry", ["batch_no", "item_code", "warehouse"])
 	frappe.db.add_index("Stock Ledger Entry", ["warehouse", "item_code"], "item_warehouse")
+	frappe.db.add_index(
+		"Stock Ledger Entry",
+		["item_code", "warehouse", "posting_datetime", "creation"],
+		"item_warehouse_posting_datetime",
+	)
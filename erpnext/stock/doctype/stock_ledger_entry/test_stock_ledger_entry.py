@@ -9,7 +9,7 @@ from frappe.core.page.permission_manager.permission_manager import reset
 from frappe.custom.doctype.property_setter.property_setter import make_property_setter
 from frappe.query_builder.functions import CombineDatetime
 from frappe.tests.utils import FrappeTestCase, change_settings
-from frappe.utils import add_days, add_to_date, flt, today
+from frappe.utils import add_days, add_to_date, flt, get_datetime, today
 
 from erpnext.accounts.doctype.gl_entry.gl_entry import rename_gle_sle_docs
 from erpnext.stock.doctype.delivery_note.test_delivery_note import create_delivery_note
@@ -1265,6 +1265,235 @@ class TestStockLedgerEntry(FrappeTestCase, StockTestMixin):
 			item_code=item_code, source=warehouse, qty=470.84, rate=100, posting_date=add_days(today(), -1)
 		)
 
+	def test_bulk_reposting(self):
+		"""Bulk reposting should revaluate SLEs and Bins same as item-warehouse wise reposting."""
+		items = [
+			make_item(properties={"valuation_method": method}).name
+			for method in ("FIFO", "LIFO", "Moving Average")
+		]
+		args = create_entries_for_reposting_benchmark(items, "_Test Warehouse - _TC")
+
+		item_wise_ledger, _time_taken = repost_and_get_ledger(items, args, bulk_reposting=False)
+		bulk_ledger, _time_taken = repost_and_get_ledger(items, args, bulk_reposting=True)
+
+		self.assertEqual(item_wise_ledger, bulk_ledger)
+
+	def test_posting_datetime(self):
+		item_code = make_item(properties={"is_stock_item": 1}).name
+		se = make_stock_entry(
+			item_code=item_code,
+			target="_Test Warehouse - _TC",
+			qty=1,
+			rate=10,
+			posting_date="2021-01-21",
+			posting_time="02:02:02.1234",  # microseconds are not stored in posting_datetime
+		)
+
+		posting_datetime = frappe.db.get_value(
+			"Stock Ledger Entry", {"voucher_no": se.name, "is_cancelled": 0}, "posting_datetime"
+		)
+		self.assertEqual(posting_datetime, get_datetime("2021-01-21 02:02:02"))
+
+		previous_sle = get_previous_sle(
+			{
+				"item_code": item_code,
+				"warehouse": "_Test Warehouse - _TC",
+				"posting_date": "2021-01-21",
+				"posting_time": "02:02:03",
+			}
+		)
+		self.assertEqual(previous_sle.voucher_no, se.name)
+
+
+def create_entries_for_reposting_benchmark(items, warehouse, transactions_per_item=3):
+	"""Create receipts and issues for items, returns repost args from the first receipt"""
+
+	posting_date = add_days(today(), -transactions_per_item * 2)
+	for item_code in items:
+		for day in range(transactions_per_item):
+			make_stock_entry(
+				item_code=item_code,
+				target=warehouse,
+				qty=10,
+				rate=10 * (day + 1),
+				posting_date=add_days(posting_date, day * 2),
+			)
+			make_stock_entry(
+				item_code=item_code,
+				source=warehouse,
+				qty=5,
+				posting_date=add_days(posting_date, day * 2 + 1),
+			)
+
+	return [
+		frappe._dict(
+			item_code=item_code, warehouse=warehouse, posting_date=posting_date, posting_time="00:00:00"
+		)
+		for item_code in items
+	]
+
+
+def repost_and_get_ledger(items, args, bulk_reposting=False):
+	"""Reset valuation of future SLEs, repost them and return the revaluated ledger with time taken"""
+	from time import perf_counter
+
+	from erpnext.stock.stock_ledger import repost_future_sle
+
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+	(
+		frappe.qb.update(sle)
+		.set(sle.valuation_rate, 0)
+		.set(sle.stock_value, 0)
+		.set(sle.stock_value_difference, 0)
+		.set(sle.stock_queue, "[]")
+		.where(sle.item_code.isin(items))
+	).run()
+
+	start = perf_counter()
+	repost_future_sle(
+		args=[frappe._dict(row) for row in args], allow_negative_stock=True, bulk_reposting=bulk_reposting
+	)
+	time_taken = perf_counter() - start
+
+	ledger = frappe.get_all(
+		"Stock Ledger Entry",
+		fields=[
+			"name",
+			"qty_after_transaction",
+			"valuation_rate",
+			"stock_value",
+			"stock_value_difference",
+			"stock_queue",
+		],
+		filters={"item_code": ("in", items), "is_cancelled": 0},
+		order_by="name",
+		as_list=True,
+	)
+	bins = frappe.get_all(
+		"Bin",
+		fields=["name", "actual_qty", "valuation_rate", "stock_value"],
+		filters={"item_code": ("in", items)},
+		order_by="name",
+		as_list=True,
+	)
+
+	return ledger + bins, time_taken
+
+
+def run_bulk_reposting_benchmark(item_count=300, transactions_per_item=10):
+	"""Compare item-warehouse wise and bulk reposting of a backdated multi-item repost.
+
+	Usage: bench --site test_site execute
+	erpnext.stock.doctype.stock_ledger_entry.test_stock_ledger_entry.run_bulk_reposting_benchmark
+	"""
+	try:
+		items = [make_item(properties={"valuation_method": "FIFO"}).name for _ in range(item_count)]
+		args = create_entries_for_reposting_benchmark(
+			items, "_Test Warehouse - _TC", transactions_per_item=transactions_per_item
+		)
+
+		item_wise_ledger, item_wise_time = repost_and_get_ledger(items, args, bulk_reposting=False)
+		bulk_ledger, bulk_time = repost_and_get_ledger(items, args, bulk_reposting=True)
+
+		return {
+			"item_warehouses": len(args),
+			"item_wise_seconds": item_wise_time,
+			"bulk_seconds": bulk_time,
+			"identical": item_wise_ledger == bulk_ledger,
+		}
+	finally:
+		frappe.db.rollback()
+
+
+def run_previous_sle_lookup_benchmark(ledger_sizes=(1_000, 10_000, 100_000), lookups=200):
+	"""Time previous SLE lookups of an item-warehouse as its ledger grows.
+
+	With the (item_code, warehouse, posting_datetime, creation) index the time per
+	lookup should stay flat irrespective of the ledger size.
+
+	Usage: bench --site test_site execute
+	erpnext.stock.doctype.stock_ledger_entry.test_stock_ledger_entry.run_previous_sle_lookup_benchmark
+	"""
+	from random import randrange
+	from time import perf_counter
+
+	from erpnext.stock.stock_ledger import get_previous_sle_of_current_voucher
+
+	item_code = make_item(properties={"is_stock_item": 1}).name
+	warehouse = "_Test Warehouse - _TC"
+	start_datetime = get_datetime("2000-01-01 00:00:00")
+
+	results = {}
+	ledger_size = 0
+	try:
+		for size in ledger_sizes:
+			insert_ledger_for_benchmark(item_code, warehouse, start_datetime, ledger_size, size)
+			ledger_size = size
+
+			start = perf_counter()
+			for _i in range(lookups):
+				posting_datetime = add_to_date(start_datetime, minutes=randrange(size))
+				get_previous_sle_of_current_voucher(
+					frappe._dict(
+						item_code=item_code,
+						warehouse=warehouse,
+						posting_date=posting_datetime.date(),
+						posting_time=posting_datetime.time(),
+					)
+				)
+			results[size] = (perf_counter() - start) / lookups
+	finally:
+		frappe.db.rollback()
+
+	return results
+
+
+def insert_ledger_for_benchmark(item_code, warehouse, start_datetime, start, end):
+	"""Insert SLEs posted a minute apart, without running the valuation"""
+
+	fields = [
+		"name",
+		"item_code",
+		"warehouse",
+		"company",
+		"posting_date",
+		"posting_time",
+		"posting_datetime",
+		"voucher_type",
+		"voucher_no",
+		"actual_qty",
+		"qty_after_transaction",
+		"is_cancelled",
+		"docstatus",
+		"creation",
+		"modified",
+	]
+
+	values = []
+	for idx in range(start, end):
+		posting_datetime = add_to_date(start_datetime, minutes=idx)
+		values.append(
+			(
+				frappe.generate_hash(length=10),
+				item_code,
+				warehouse,
+				"_Test Company",
+				posting_datetime.date(),
+				posting_datetime.time(),
+				posting_datetime,
+				"Stock Entry",
+				f"BENCH-{idx}",
+				1,
+				idx + 1,
+				0,
+				1,
+				posting_datetime,
+				posting_datetime,
+			)
+		)
+
+	frappe.db.bulk_insert("Stock Ledger Entry", fields, values)
+
 
 def create_repack_entry(**args):
 	args = frappe._dict(args)
@@ -2,6 +2,7 @@
 # License: GNU General Public License v3. See license.txt
 
 
+import copy
 import json
 
 import frappe
@@ -61,7 +62,7 @@ def get_item_details(args, doc=None, for_validate=False, overwrite_warehouse=Tru
 	args = process_args(args)
 	for_validate = process_string_args(for_validate)
 	overwrite_warehouse = process_string_args(overwrite_warehouse)
-	item = frappe.get_cached_doc("Item", args.item_code)
+	item = get_item_doc(args.item_code)
 	validate_item_details(args, item)
 
 	if isinstance(doc, str):
@@ -146,6 +147,117 @@ def get_item_details(args, doc=None, for_validate=False, overwrite_warehouse=Tru
 	return out
 
 
+@frappe.whitelist()
+def get_items_details(args, items, doc=None, for_validate=False, overwrite_warehouse=True):
+	"""
+	`get_item_details` for many rows of the same transaction, in the order of `items`.
+
+	args = {...} arguments common to all rows, as for `get_item_details`
+	items = [{"item_code": "", "qty": 1, "uom": "", "warehouse": "", ...}, ...]
+
+	Item, Item Price, UOM Conversion Detail and Bin records of all rows are read up-front
+	with one query per table instead of a few queries per row.
+	"""
+	args = process_string_args(args)
+	items = process_string_args(items)
+
+	if isinstance(doc, str):
+		doc = json.loads(doc)
+
+	rows = [process_args({**args, **item}) for item in items]
+
+	frappe.flags.item_details_batch = get_item_details_batch(rows)
+	try:
+		return [get_item_details(row, doc, for_validate, overwrite_warehouse) for row in rows]
+	finally:
+		frappe.flags.item_details_batch = None
+
+
+def get_item_details_batch(rows):
+	item_codes = list({row.item_code for row in rows if row.item_code})
+	items = get_item_dicts(item_codes)
+	templates = {d.variant_of for d in items.values() if d.variant_of} - set(items)
+	items.update(get_item_dicts(list(templates)))
+	item_codes = list(items)
+
+	batch = frappe._dict(
+		items=items, item_prices={}, price_lists=set(), packing_units={}, bins={}, child_warehouses={}
+	)
+	if not item_codes:
+		return batch
+
+	batch.price_lists = {row.price_list for row in rows if row.price_list}
+	if batch.price_lists:
+		for price in frappe.get_all(
+			"Item Price",
+			filters={"item_code": ("in", item_codes), "price_list": ("in", list(batch.price_lists))},
+			fields=[
+				"name",
+				"item_code",
+				"price_list",
+				"price_list_rate",
+				"uom",
+				"batch_no",
+				"customer",
+				"supplier",
+				"valid_from",
+				"valid_upto",
+				"packing_unit",
+			],
+		):
+			batch.item_prices.setdefault((price.item_code, price.price_list), []).append(price)
+			batch.packing_units[price.name] = price.packing_unit
+
+	bin = frappe.qb.DocType("Bin")
+	wh = frappe.qb.DocType("Warehouse")
+	for row in (
+		frappe.qb.from_(bin)
+		.left_join(wh)
+		.on(bin.warehouse == wh.name)
+		.select(
+			bin.item_code, bin.warehouse, bin.projected_qty, bin.actual_qty, bin.reserved_qty, wh.company
+		)
+		.where(bin.item_code.isin(item_codes))
+	).run(as_dict=True):
+		batch.bins.setdefault(row.item_code, []).append(row)
+
+	return batch
+
+
+def get_item_dicts(item_codes):
+	"""Item records with their child tables, as loaded by `frappe.get_doc`"""
+	if not item_codes:
+		return {}
+
+	items = {
+		item.name: item
+		for item in frappe.get_all("Item", filters={"name": ("in", item_codes)}, fields=["*"])
+	}
+
+	for df in frappe.get_meta("Item").get_table_fields():
+		for item in items.values():
+			item[df.fieldname] = []
+
+		for row in frappe.get_all(
+			df.options,
+			filters={"parent": ("in", list(items)), "parenttype": "Item", "parentfield": df.fieldname},
+			fields=["*"],
+			order_by="idx",
+		):
+			items[row.parent][df.fieldname].append(row)
+
+	return items
+
+
+def get_item_doc(item_code):
+	batch = frappe.flags.item_details_batch
+	if batch and item_code in batch.items:
+		# a fresh copy as `get_basic_details` updates the tables of variants
+		return frappe.get_doc(dict(copy.deepcopy(batch.items[item_code]), doctype="Item"))
+
+	return frappe.get_cached_doc("Item", item_code)
+
+
 def remove_standard_fields(details):
 	for key in child_table_fields + default_fields:
 		details.pop(key, None)
@@ -305,9 +417,9 @@ def get_basic_details(args, item, overwrite_warehouse=True):
 	if item.variant_of:
 		item.update_template_tables()
 
-	item_defaults = get_item_defaults(item.name, args.company)
-	item_group_defaults = get_item_group_defaults(item.name, args.company)
-	brand_defaults = get_brand_defaults(item.name, args.company)
+	item_defaults = get_item_defaults(item, args.company)
+	item_group_defaults = get_item_group_defaults(item, args.company)
+	brand_defaults = get_brand_defaults(item, args.company)
 
 	defaults = frappe._dict(
 		{
@@ -892,6 +1004,12 @@ def get_item_price(args, item_code, ignore_party=False):
 	:param item_code: str, Item Doctype field item_code
 	"""
 
+	batch = frappe.flags.item_details_batch
+	if batch and item_code in batch.items and args.get("price_list") in batch.price_lists:
+		return get_batched_item_price(
+			batch.item_prices.get((item_code, args.get("price_list")), []), args, ignore_party
+		)
+
 	ip = frappe.qb.DocType("Item Price")
 	query = (
 		frappe.qb.from_(ip)
@@ -924,6 +1042,42 @@ def get_item_price(args, item_code, ignore_party=False):
 	return query.run()
 
 
+def get_batched_item_price(item_prices, args, ignore_party=False):
+	"""`get_item_price` on Item Prices prefetched by `get_items_details`"""
+	transaction_date = getdate(args["transaction_date"]) if args.get("transaction_date") else None
+
+	def matches(price):
+		if (price.uom or "") not in ("", args.get("uom")):
+			return False
+		if (price.batch_no or "") not in ("", args.get("batch_no")):
+			return False
+
+		if not ignore_party:
+			if args.get("customer"):
+				if price.customer != args.get("customer"):
+					return False
+			elif args.get("supplier"):
+				if price.supplier != args.get("supplier"):
+					return False
+			elif price.customer or price.supplier:
+				return False
+
+		if transaction_date:
+			if getdate(price.valid_from or "2000-01-01") > transaction_date:
+				return False
+			if getdate(price.valid_upto or "2500-12-31") < transaction_date:
+				return False
+
+		return True
+
+	prices = sorted(
+		filter(matches, item_prices),
+		key=lambda d: (getdate(d.valid_from or "0001-01-01"), d.batch_no or "", d.uom or ""),
+		reverse=True,
+	)
+	return [(d.name, d.price_list_rate, d.uom) for d in prices]
+
+
 def get_price_list_rate_for(args, item_code):
 	"""
 	:param customer: link to Customer DocType
@@ -985,9 +1139,14 @@ def check_packing_list(price_list_rate_name, desired_qty, item_code):
 	"""
 
 	flag = True
-	item_price = frappe.get_doc("Item Price", price_list_rate_name)
-	if item_price.packing_unit:
-		packing_increment = desired_qty % item_price.packing_unit
+	batch = frappe.flags.item_details_batch
+	if batch and price_list_rate_name in batch.packing_units:
+		packing_unit = batch.packing_units[price_list_rate_name]
+	else:
+		packing_unit = frappe.db.get_value("Item Price", price_list_rate_name, "packing_unit")
+
+	if packing_unit:
+		packing_increment = desired_qty % packing_unit
 
 		if packing_increment != 0:
 			flag = False
@@ -1146,6 +1305,10 @@ def get_serial_nos_by_fifo(args, sales_order=None):
 
 @frappe.whitelist()
 def get_conversion_factor(item_code, uom):
+	batch = frappe.flags.item_details_batch
+	if batch and item_code in batch.items:
+		return get_batched_conversion_factor(batch.items, item_code, uom)
+
 	variant_of = frappe.db.get_value("Item", item_code, "variant_of", cache=True)
 	filters = {"parent": item_code, "uom": uom}
 
@@ -1159,6 +1322,24 @@ def get_conversion_factor(item_code, uom):
 	return {"conversion_factor": conversion_factor or 1.0}
 
 
+def get_batched_conversion_factor(items, item_code, uom):
+	item = items[item_code]
+	conversion_factor = None
+	for parent in (item, items.get(item.variant_of) or {}):
+		for d in parent.get("uoms") or []:
+			if d.uom == uom:
+				conversion_factor = d.conversion_factor
+				break
+
+		if conversion_factor:
+			break
+
+	if not conversion_factor:
+		conversion_factor = get_uom_conv_factor(uom, item.stock_uom)
+
+	return {"conversion_factor": conversion_factor or 1.0}
+
+
 @frappe.whitelist()
 def get_projected_qty(item_code, warehouse):
 	return {
@@ -1172,6 +1353,10 @@ def get_projected_qty(item_code, warehouse):
 def get_bin_details(item_code, warehouse, company=None, include_child_warehouses=False):
 	bin_details = {"projected_qty": 0, "actual_qty": 0, "reserved_qty": 0}
 
+	batch = frappe.flags.item_details_batch
+	if batch and item_code in batch.items:
+		return get_batched_bin_details(batch, item_code, warehouse, company, include_child_warehouses)
+
 	if warehouse:
 		from frappe.query_builder.functions import Coalesce, Sum
 
@@ -1196,6 +1381,37 @@ def get_bin_details(item_code, warehouse, company=None, include_child_warehouses
 	return bin_details
 
 
+def get_batched_bin_details(
+	batch, item_code, warehouse, company=None, include_child_warehouses=False
+):
+	"""`get_bin_details` on Bins prefetched by `get_items_details`"""
+	from erpnext.stock.doctype.warehouse.warehouse import get_child_warehouses
+
+	bins = batch.bins.get(item_code, [])
+	bin_details = {"projected_qty": 0, "actual_qty": 0, "reserved_qty": 0}
+
+	if warehouse:
+		if include_child_warehouses:
+			if warehouse not in batch.child_warehouses:
+				batch.child_warehouses[warehouse] = get_child_warehouses(warehouse)
+			warehouses = batch.child_warehouses[warehouse]
+		else:
+			warehouses = [warehouse]
+
+		for d in bins:
+			if d.warehouse in warehouses:
+				for field in bin_details:
+					bin_details[field] += flt(d.get(field))
+
+	if company:
+		company_bins = [d for d in bins if d.company == company]
+		bin_details["company_total_stock"] = (
+			sum(flt(d.actual_qty) for d in company_bins) if company_bins else None
+		)
+
+	return bin_details
+
+
 def get_company_total_stock(item_code, company):
 	bin = frappe.qb.DocType("Bin")
 	wh = frappe.qb.DocType("Warehouse")
@@ -3,7 +3,9 @@
 
 
 import json
+from contextlib import contextmanager
 from math import ceil
+from time import perf_counter
 
 import frappe
 from frappe import _
@@ -23,6 +25,9 @@ def reorder_item():
 
 
 def _reorder_item():
+	# time taken by each phase, in seconds
+	timings = frappe.flags.reorder_timings = {}
+
 	material_requests = {"Purchase": {}, "Transfer": {}, "Material Issue": {}, "Manufacture": {}}
 	warehouse_company = frappe._dict(
 		frappe.db.sql(
@@ -34,22 +39,29 @@ def _reorder_item():
 		erpnext.get_default_company() or frappe.db.sql("""select name from tabCompany limit 1""")[0][0]
 	)
 
-	items_to_consider = frappe.db.sql_list(
-		"""select name from `tabItem` item
-		where is_stock_item=1 and has_variants=0
-			and disabled=0
-			and (end_of_life is null or end_of_life='0000-00-00' or end_of_life > %(today)s)
-			and (exists (select name from `tabItem Reorder` ir where ir.parent=item.name)
-				or (variant_of is not null and variant_of != ''
-				and exists (select name from `tabItem Reorder` ir where ir.parent=item.variant_of))
-			)""",
-		{"today": nowdate()},
-	)
+	with record_timing(timings, "reorder_levels"):
+		items_to_consider = frappe.db.sql(
+			"""select name, variant_of from `tabItem` item
+			where is_stock_item=1 and has_variants=0
+				and disabled=0
+				and (end_of_life is null or end_of_life='0000-00-00' or end_of_life > %(today)s)
+				and (exists (select name from `tabItem Reorder` ir where ir.parent=item.name)
+					or (variant_of is not null and variant_of != ''
+					and exists (select name from `tabItem Reorder` ir where ir.parent=item.variant_of))
+				)""",
+			{"today": nowdate()},
+			as_dict=True,
+		)
 
-	if not items_to_consider:
-		return
+		if not items_to_consider:
+			return
 
-	item_warehouse_projected_qty = get_item_warehouse_projected_qty(items_to_consider)
+		item_reorder_levels = get_item_reorder_levels(items_to_consider)
+
+	with record_timing(timings, "projected_qty"):
+		item_warehouse_projected_qty = get_item_warehouse_projected_qty(
+			[d.name for d in items_to_consider]
+		)
 
 	def add_to_material_request(
 		item_code, warehouse, reorder_level, reorder_qty, material_request_type, warehouse_group=None
@@ -78,16 +90,11 @@ def _reorder_item():
 				{"item_code": item_code, "warehouse": warehouse, "reorder_qty": reorder_qty}
 			)
 
-	for item_code in items_to_consider:
-		item = frappe.get_doc("Item", item_code)
-
-		if item.variant_of and not item.get("reorder_levels"):
-			item.update_template_tables()
-
-		if item.get("reorder_levels"):
-			for d in item.get("reorder_levels"):
+	with record_timing(timings, "reorder_qty"):
+		for item in items_to_consider:
+			for d in item_reorder_levels.get(item.name, []):
 				add_to_material_request(
-					item_code,
+					item.name,
 					d.warehouse,
 					d.warehouse_reorder_level,
 					d.warehouse_reorder_qty,
@@ -96,11 +103,58 @@ def _reorder_item():
 				)
 
 	if material_requests:
-		return create_material_request(material_requests)
+		with record_timing(timings, "material_requests"):
+			mr_list = create_material_request(material_requests)
+
+		frappe.logger("reorder_item").info({"timings": timings, "material_requests": len(mr_list)})
+		return mr_list
+
+
+@contextmanager
+def record_timing(timings, phase):
+	start = perf_counter()
+	try:
+		yield
+	finally:
+		timings[phase] = perf_counter() - start
+
+
+def get_item_reorder_levels(items):
+	"""
+	Returns {item_code: [reorder levels]} from one query on Item Reorder. Variants without
+	reorder levels of their own get the levels of their template (without the warehouse group),
+	as copied by `Item.update_template_tables`.
+	"""
+	reorder_levels = {}
+	for d in frappe.db.sql(
+		"""select parent, warehouse, warehouse_group, warehouse_reorder_level,
+			warehouse_reorder_qty, material_request_type
+		from `tabItem Reorder`
+		where parenttype = 'Item'
+		order by parent, idx""",
+		as_dict=True,
+	):
+		reorder_levels.setdefault(d.pop("parent"), []).append(d)
+
+	item_reorder_levels = {}
+	for item in items:
+		if item.name in reorder_levels:
+			item_reorder_levels[item.name] = reorder_levels[item.name]
+		elif item.variant_of:
+			item_reorder_levels[item.name] = [
+				frappe._dict(d, warehouse_group=None) for d in reorder_levels.get(item.variant_of, [])
+			]
+
+	return item_reorder_levels
 
 
 def get_item_warehouse_projected_qty(items_to_consider):
+	"""
+	Returns {item_code: {warehouse: projected_qty}}, where the projected qty of each Bin is also
+	added to all parent warehouses of its warehouse
+	"""
 	item_warehouse_projected_qty = {}
+	warehouse_ancestors = get_warehouse_ancestors()
 
 	for item_code, warehouse, projected_qty in frappe.db.sql(
 		"""select item_code, warehouse, projected_qty
@@ -110,31 +164,76 @@ def get_item_warehouse_projected_qty(items_to_consider):
 		),
 		items_to_consider,
 	):
+		warehouse_projected_qty = item_warehouse_projected_qty.setdefault(item_code, {})
+		for d in warehouse_ancestors.get(warehouse) or [warehouse]:
+			warehouse_projected_qty[d] = warehouse_projected_qty.get(d, 0.0) + flt(projected_qty)
 
-		if item_code not in item_warehouse_projected_qty:
-			item_warehouse_projected_qty.setdefault(item_code, {})
+	return item_warehouse_projected_qty
 
-		if warehouse not in item_warehouse_projected_qty.get(item_code):
-			item_warehouse_projected_qty[item_code][warehouse] = flt(projected_qty)
 
-		warehouse_doc = frappe.get_doc("Warehouse", warehouse)
+def get_warehouse_ancestors():
+	"""Returns {warehouse: [warehouse and all its parent warehouses]} from the nested set bounds"""
+	warehouse_ancestors = {}
+	ancestors = []
 
-		while warehouse_doc.parent_warehouse:
-			if not item_warehouse_projected_qty.get(item_code, {}).get(warehouse_doc.parent_warehouse):
-				item_warehouse_projected_qty.setdefault(item_code, {})[warehouse_doc.parent_warehouse] = flt(
-					projected_qty
-				)
-			else:
-				item_warehouse_projected_qty[item_code][warehouse_doc.parent_warehouse] += flt(projected_qty)
-			warehouse_doc = frappe.get_doc("Warehouse", warehouse_doc.parent_warehouse)
+	for name, lft, rgt in frappe.db.sql(
+		"""select name, lft, rgt from `tabWarehouse`
+		where lft is not null and rgt is not null
+		order by lft"""
+	):
+		# drop the warehouses which end before this one starts
+		while ancestors and ancestors[-1][1] < lft:
+			ancestors.pop()
+
+		ancestors.append((name, rgt))
+		warehouse_ancestors[name] = [d[0] for d in ancestors]
+
+	return warehouse_ancestors
+
+
+def get_item_details(item_codes):
+	"""Item fields and purchase UOM conversion factors used in the Material Requests"""
+	item_details = {
+		d.name: d
+		for d in frappe.get_all(
+			"Item",
+			filters={"name": ("in", list(item_codes))},
+			fields=[
+				"name",
+				"item_name",
+				"description",
+				"item_group",
+				"brand",
+				"stock_uom",
+				"purchase_uom",
+				"lead_time_days",
+			],
+		)
+	}
 
-	return item_warehouse_projected_qty
+	for d in frappe.get_all(
+		"UOM Conversion Detail",
+		filters={"parenttype": "Item", "parent": ("in", list(item_codes))},
+		fields=["parent", "uom", "conversion_factor"],
+	):
+		if d.parent in item_details:
+			item_details[d.parent].setdefault("conversion_factors", {})[d.uom] = d.conversion_factor
+
+	return item_details
 
 
 def create_material_request(material_requests):
 	"""Create indent on reaching reorder level"""
 	mr_list = []
 	exceptions_list = []
+	item_details = get_item_details(
+		{
+			d["item_code"]
+			for requests_by_company in material_requests.values()
+			for items in requests_by_company.values()
+			for d in items
+		}
+	)
 
 	def _log_exception(mr):
 		if frappe.local.message_log:
@@ -163,19 +262,14 @@ def create_material_request(material_requests):
 
 				for d in items:
 					d = frappe._dict(d)
-					item = frappe.get_doc("Item", d.item_code)
+					item = item_details[d.item_code]
 					uom = item.stock_uom
 					conversion_factor = 1.0
 
 					if request_type == "Purchase":
 						uom = item.purchase_uom or item.stock_uom
 						if uom != item.stock_uom:
-							conversion_factor = (
-								frappe.db.get_value(
-									"UOM Conversion Detail", {"parent": item.name, "uom": uom}, "conversion_factor"
-								)
-								or 1.0
-							)
+							conversion_factor = item.get("conversion_factors", {}).get(uom) or 1.0
 
 					must_be_whole_number = frappe.db.get_value("UOM", uom, "must_be_whole_number", cache=True)
 					qty = d.reorder_qty / conversion_factor
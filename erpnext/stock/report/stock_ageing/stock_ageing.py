@@ -7,9 +7,13 @@ from typing import Dict, List, Tuple, Union
 
 import frappe
 from frappe import _
+from frappe.query_builder.functions import Max
 from frappe.utils import cint, date_diff, flt
 
 from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
+from erpnext.stock.doctype.stock_ageing_checkpoint.stock_ageing_checkpoint import (
+	parse_fifo_queue,
+)
 
 Filters = frappe._dict
 
@@ -230,6 +234,7 @@ class FIFOSlots:
 		}
 		"""
 		if self.sle is None:
+			self.__init_from_checkpoints()
 			self.sle = self.__get_stock_ledger_entries()
 
 		for d in self.sle:
@@ -379,13 +384,82 @@ class FIFOSlots:
 
 		return item_aggregated_data
 
+	def __init_from_checkpoints(self):
+		"Seed FIFO Queues from the latest Stock Ageing Checkpoint of each item-warehouse."
+		checkpoint = frappe.qb.DocType("Stock Ageing Checkpoint")
+		latest_checkpoint = self.__get_latest_checkpoint_query()
+		item = self.__get_item_query()
+
+		query = (
+			frappe.qb.from_(checkpoint)
+			.join(latest_checkpoint)
+			.on(
+				(checkpoint.item_code == latest_checkpoint.item_code)
+				& (checkpoint.warehouse == latest_checkpoint.warehouse)
+				& (checkpoint.posting_date == latest_checkpoint.posting_date)
+			)
+			.join(item)
+			.on(checkpoint.item_code == item.name)
+			.select(
+				item.name,
+				item.item_name,
+				item.item_group,
+				item.brand,
+				item.description,
+				item.stock_uom,
+				item.has_serial_no,
+				checkpoint.warehouse,
+				checkpoint.qty_after_transaction,
+				checkpoint.total_qty,
+				checkpoint.fifo_queue,
+			)
+			.where(checkpoint.company == self.filters.get("company"))
+		)
+
+		if self.filters.get("warehouse"):
+			query = self.__get_warehouse_conditions(checkpoint, query)
+
+		for row in query.run(as_dict=True):
+			self.item_details[(row.name, row.warehouse)] = {
+				"details": row,
+				"fifo_queue": parse_fifo_queue(row.pop("fifo_queue")),
+				"qty_after_transaction": flt(row.pop("qty_after_transaction")),
+				"total_qty": flt(row.pop("total_qty")),
+				"has_serial_no": row.has_serial_no,
+			}
+
+	def __get_latest_checkpoint_query(self):
+		checkpoint = frappe.qb.DocType("Stock Ageing Checkpoint")
+
+		return (
+			frappe.qb.from_(checkpoint)
+			.select(
+				checkpoint.item_code,
+				checkpoint.warehouse,
+				Max(checkpoint.posting_date).as_("posting_date"),
+			)
+			.where(
+				(checkpoint.company == self.filters.get("company"))
+				& (checkpoint.posting_date <= self.filters.get("to_date"))
+			)
+			.groupby(checkpoint.item_code, checkpoint.warehouse)
+		)
+
 	def __get_stock_ledger_entries(self) -> List[Dict]:
 		sle = frappe.qb.DocType("Stock Ledger Entry")
 		item = self.__get_item_query()  # used as derived table in sle query
+		# entries upto the latest checkpoint are already part of the seeded FIFO Queues
+		latest_checkpoint = self.__get_latest_checkpoint_query()
 
 		sle_query = (
 			frappe.qb.from_(sle)
-			.from_(item)
+			.join(item)
+			.on(sle.item_code == item.name)
+			.left_join(latest_checkpoint)
+			.on(
+				(sle.item_code == latest_checkpoint.item_code)
+				& (sle.warehouse == latest_checkpoint.warehouse)
+			)
 			.select(
 				item.name,
 				item.item_name,
@@ -404,10 +478,13 @@ class FIFOSlots:
 				sle.warehouse,
 			)
 			.where(
-				(sle.item_code == item.name)
-				& (sle.company == self.filters.get("company"))
+				(sle.company == self.filters.get("company"))
 				& (sle.posting_date <= self.filters.get("to_date"))
 				& (sle.is_cancelled != 1)
+				& (
+					latest_checkpoint.posting_date.isnull()
+					| (sle.posting_date > latest_checkpoint.posting_date)
+				)
 			)
 		)
 
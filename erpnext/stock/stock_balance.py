@@ -6,14 +6,27 @@ import frappe
 from frappe.utils import cstr, flt, now, nowdate, nowtime
 
 from erpnext.controllers.stock_controller import create_repost_item_valuation_entry
+from erpnext.stock.stock_ledger import bulk_update_values
 from erpnext.stock.utils import update_bin
 
+BIN_QTY_FIELDS = ("actual_qty", "reserved_qty", "indented_qty", "ordered_qty", "planned_qty")
 
 
-def repost(only_actual=False, allow_negative_stock=False, allow_zero_rate=False, only_bin=False):
+def repost(
+	only_actual=False,
+	allow_negative_stock=False,
+	allow_zero_rate=False,
+	only_bin=False,
+	bulk=False,
+):
 	"""
 	Repost everything!
+
+	With `only_bin` and `bulk`, all Bins are rebuilt with set-based queries (see `rebuild_bins`).
 	"""
+	if only_bin and bulk:
+		return rebuild_bins()
+
 	frappe.db.auto_commit_on_many_writes = 1
 
 	if allow_negative_stock:
@@ -221,6 +234,295 @@ def update_bin_qty(item_code, warehouse, qty_dict=None):
 		bin.clear_cache()
 
 
+def rebuild_bins(company=None, warehouse=None, items=None, update=True, chunk_size=500):
+	"""
+	Recompute the actual, reserved, indented, ordered and planned qty of all Bins with one grouped
+	query per quantity (instead of five queries per item-warehouse as `repost_stock` does), update
+	the Bins that differ and return the differences as
+	[{item_code, warehouse, field, old_value, new_value}].
+
+	Can be limited to the warehouses of a `company`, a `warehouse` and its children and / or a
+	list of `items`. With `update=False` only the differences are returned.
+
+	Usage: bench --site <site> execute erpnext.stock.stock_balance.rebuild_bins --kwargs "{'company': 'Company'}"
+	"""
+	scope = get_rebuild_scope(company, warehouse, items)
+	if scope is None:
+		return []
+
+	bins = {(d.item_code, d.warehouse): d for d in get_bins(scope)}
+	item_warehouses = set(bins) | set(get_sle_item_warehouses(scope))
+
+	quantities = {
+		"actual_qty": get_balance_qty_map(scope),
+		"reserved_qty": get_reserved_qty_map(scope),
+		"indented_qty": get_indented_qty_map(scope),
+		"ordered_qty": get_ordered_qty_map(scope),
+		"planned_qty": get_planned_qty_map(scope),
+	}
+
+	differences = []
+	bin_updates = {}
+	new_bins = []
+	for key in item_warehouses:
+		bin = bins.get(key) or frappe._dict()
+		new_values = {field: flt(quantities[field].get(key)) for field in BIN_QTY_FIELDS}
+
+		mismatch = False
+		for field in BIN_QTY_FIELDS:
+			if flt(bin.get(field)) != new_values[field]:
+				mismatch = True
+				differences.append(
+					frappe._dict(
+						item_code=key[0],
+						warehouse=key[1],
+						field=field,
+						old_value=flt(bin.get(field)),
+						new_value=new_values[field],
+					)
+				)
+
+		if not bin.name:
+			new_bins.append(key)
+		elif mismatch:
+			bin.update(new_values)
+			bin_updates[bin.name] = dict(new_values, projected_qty=get_projected_qty(bin))
+
+	if update:
+		bulk_update_values("Bin", bin_updates, update_modified=True, chunk_size=chunk_size)
+		if new_bins:
+			insert_bins(new_bins, quantities)
+
+	return differences
+
+
+def get_rebuild_scope(company=None, warehouse=None, items=None):
+	"""Filters for `rebuild_bins`, None if the company or warehouse has no (leaf) warehouses"""
+	scope = frappe._dict()
+
+	if company or warehouse:
+		filters = {"is_group": 0}
+		if company:
+			filters["company"] = company
+		if warehouse:
+			lft, rgt = frappe.db.get_value("Warehouse", warehouse, ["lft", "rgt"])
+			filters["lft"] = (">=", lft)
+			filters["rgt"] = ("<=", rgt)
+
+		scope.warehouses = tuple(frappe.get_all("Warehouse", filters=filters, pluck="name"))
+		if not scope.warehouses:
+			return
+
+	if items:
+		scope.items = tuple([items] if isinstance(items, str) else items)
+
+	return scope
+
+
+def get_scope_condition(scope, item_field="item_code", warehouse_field="warehouse"):
+	conditions = ""
+	if scope.get("items"):
+		conditions += f" and {item_field} in %(items)s"
+	if scope.get("warehouses"):
+		conditions += f" and {warehouse_field} in %(warehouses)s"
+
+	return conditions
+
+
+def get_bins(scope):
+	return frappe.db.sql(
+		"""select name, item_code, warehouse, {fields},
+			reserved_qty_for_production, reserved_qty_for_sub_contract
+		from `tabBin`
+		where item_code is not null and warehouse is not null {conditions}""".format(
+			fields=", ".join(BIN_QTY_FIELDS), conditions=get_scope_condition(scope)
+		),
+		scope,
+		as_dict=True,
+	)
+
+
+def get_sle_item_warehouses(scope):
+	return frappe.db.sql(
+		"""select distinct item_code, warehouse
+		from `tabStock Ledger Entry`
+		where item_code is not null and warehouse is not null {conditions}""".format(
+			conditions=get_scope_condition(scope)
+		),
+		scope,
+	)
+
+
+def get_projected_qty(bin):
+	"""Same as `Bin.set_projected_qty`"""
+	return (
+		flt(bin.actual_qty)
+		+ flt(bin.ordered_qty)
+		+ flt(bin.indented_qty)
+		+ flt(bin.planned_qty)
+		- flt(bin.reserved_qty)
+		- flt(bin.reserved_qty_for_production)
+		- flt(bin.reserved_qty_for_sub_contract)
+	)
+
+
+def get_qty_map(query, scope):
+	return {(d[0], d[1]): flt(d[2]) for d in frappe.db.sql(query, scope)}
+
+
+def get_balance_qty_map(scope):
+	"""Bulk version of `get_balance_qty_from_sle`"""
+	return get_qty_map(
+		"""
+		select item_code, warehouse, qty_after_transaction
+		from (
+			select item_code, warehouse, qty_after_transaction,
+				row_number() over (
+					partition by item_code, warehouse
+					order by posting_date desc, posting_time desc, creation desc
+				) as row_no
+			from `tabStock Ledger Entry`
+			where is_cancelled = 0 {conditions}
+		) sle
+		where row_no = 1""".format(
+			conditions=get_scope_condition(scope)
+		),
+		scope,
+	)
+
+
+def get_reserved_qty_map(scope):
+	"""Bulk version of `get_reserved_qty`"""
+	return get_qty_map(
+		"""
+		select item_code, warehouse,
+			sum(dnpi_qty * ((so_item_qty - so_item_delivered_qty) / so_item_qty))
+		from
+			(
+				(select
+					item_code, warehouse,
+					qty as dnpi_qty,
+					(
+						select qty from `tabSales Order Item`
+						where name = dnpi.parent_detail_docname
+						and (delivered_by_supplier is null or delivered_by_supplier = 0)
+					) as so_item_qty,
+					(
+						select delivered_qty from `tabSales Order Item`
+						where name = dnpi.parent_detail_docname
+						and delivered_by_supplier = 0
+					) as so_item_delivered_qty,
+					parent, name
+				from `tabPacked Item` dnpi
+				where parenttype='Sales Order'
+					and item_code != parent_item
+					and exists (select * from `tabSales Order` so
+					where name = dnpi.parent and docstatus = 1 and status not in ('On Hold', 'Closed'))
+					{conditions})
+			union
+				(select item_code, warehouse, stock_qty as dnpi_qty, qty as so_item_qty,
+					delivered_qty as so_item_delivered_qty, parent, name
+				from `tabSales Order Item` so_item
+				where (so_item.delivered_by_supplier is null or so_item.delivered_by_supplier = 0)
+				and exists(select * from `tabSales Order` so
+					where so.name = so_item.parent and so.docstatus = 1
+					and so.status not in ('On Hold', 'Closed'))
+				{conditions})
+			) tab
+		where
+			so_item_qty >= so_item_delivered_qty
+		group by item_code, warehouse
+	""".format(
+			conditions=get_scope_condition(scope)
+		),
+		scope,
+	)
+
+
+def get_indented_qty_map(scope):
+	"""Bulk version of `get_indented_qty`"""
+	return get_qty_map(
+		"""
+		select mr_item.item_code, mr_item.warehouse,
+			sum(
+				case when mr.material_request_type = 'Material Issue' then -1 else 1 end
+				* (mr_item.stock_qty - mr_item.ordered_qty)
+			)
+		from `tabMaterial Request Item` mr_item, `tabMaterial Request` mr
+		where mr.material_request_type in
+				('Purchase', 'Manufacture', 'Customer Provided', 'Material Transfer', 'Material Issue')
+			and mr_item.stock_qty > mr_item.ordered_qty and mr_item.parent=mr.name
+			and mr.status!='Stopped' and mr.docstatus=1 {conditions}
+		group by mr_item.item_code, mr_item.warehouse
+	""".format(
+			conditions=get_scope_condition(scope, "mr_item.item_code", "mr_item.warehouse")
+		),
+		scope,
+	)
+
+
+def get_ordered_qty_map(scope):
+	"""Bulk version of `get_ordered_qty`"""
+	return get_qty_map(
+		"""
+		select po_item.item_code, po_item.warehouse,
+			sum((po_item.qty - po_item.received_qty)*po_item.conversion_factor)
+		from `tabPurchase Order Item` po_item, `tabPurchase Order` po
+		where po_item.qty > po_item.received_qty and po_item.parent=po.name
+		and po.status not in ('Closed', 'Delivered') and po.docstatus=1
+		and po_item.delivered_by_supplier = 0 {conditions}
+		group by po_item.item_code, po_item.warehouse""".format(
+			conditions=get_scope_condition(scope, "po_item.item_code", "po_item.warehouse")
+		),
+		scope,
+	)
+
+
+def get_planned_qty_map(scope):
+	"""Bulk version of `get_planned_qty`"""
+	return get_qty_map(
+		"""
+		select production_item, fg_warehouse, sum(qty - produced_qty) from `tabWork Order`
+		where status not in ('Stopped', 'Completed', 'Closed')
+		and docstatus=1 and qty > produced_qty {conditions}
+		group by production_item, fg_warehouse""".format(
+			conditions=get_scope_condition(scope, "production_item", "fg_warehouse")
+		),
+		scope,
+	)
+
+
+def insert_bins(item_warehouses, quantities):
+	stock_uoms = dict(
+		frappe.get_all(
+			"Item",
+			filters={"name": ("in", list({item_code for item_code, _warehouse in item_warehouses}))},
+			fields=["name", "stock_uom"],
+			as_list=True,
+		)
+	)
+
+	timestamp = now()
+	rows = []
+	for item_code, warehouse in item_warehouses:
+		bin = frappe._dict(
+			{field: flt(quantities[field].get((item_code, warehouse))) for field in BIN_QTY_FIELDS}
+		)
+		rows.append(
+			(frappe.generate_hash(length=10), item_code, warehouse, stock_uoms.get(item_code))
+			+ tuple(bin[field] for field in BIN_QTY_FIELDS)
+			+ (get_projected_qty(bin), timestamp, timestamp, frappe.session.user, frappe.session.user)
+		)
+
+	frappe.db.bulk_insert(
+		"Bin",
+		("name", "item_code", "warehouse", "stock_uom")
+		+ BIN_QTY_FIELDS
+		+ ("projected_qty", "creation", "modified", "owner", "modified_by"),
+		rows,
+	)
+
+
 def set_stock_balance_as_per_serial_no(
 	item_code=None, posting_date=None, posting_time=None, fiscal_year=None
 ):
@@ -8,17 +8,29 @@ from typing import Optional, Set, Tuple
 import frappe
 from frappe import _
 from frappe.model.meta import get_field_precision
-from frappe.query_builder.functions import CombineDatetime, Sum
-from frappe.utils import cint, cstr, flt, get_link_to_form, getdate, now, nowdate
+from frappe.query_builder.functions import Sum
+from frappe.utils import cint, cstr, flt, get_datetime, get_link_to_form, getdate, now, nowdate
 
 import erpnext
 from erpnext.stock.doctype.bin.bin import update_qty as update_bin_qty
+from erpnext.stock.doctype.serial_no_ledger_entry.serial_no_ledger_entry import (
+	get_serial_no_condition,
+)
+from erpnext.stock.doctype.stock_ageing_checkpoint.stock_ageing_checkpoint import (
+	invalidate_stock_ageing_checkpoints,
+)
 from erpnext.stock.utils import (
+	get_combine_datetime,
 	get_incoming_outgoing_rate_for_cancel,
 	get_or_make_bin,
 	get_valuation_method,
 )
-from erpnext.stock.valuation import FIFOValuation, LIFOValuation, round_off_if_near_zero
+from erpnext.stock.valuation import (
+	FIFOValuation,
+	LIFOValuation,
+	round_off_if_near_zero,
+	serialize_stock_queue,
+)
 
 
 class NegativeStockError(frappe.ValidationError):
@@ -93,6 +105,9 @@ def make_sl_entries(sl_entries, allow_negative_stock=False, via_landed_cost_vouc
 
 			is_stock_item = frappe.get_cached_value("Item", args.get("item_code"), "is_stock_item")
 			if is_stock_item:
+				invalidate_stock_ageing_checkpoints(
+					args.get("item_code"), args.get("warehouse"), args.get("posting_date")
+				)
 				bin_name = get_or_make_bin(args.get("item_code"), args.get("warehouse"))
 				repost_current_voucher(args, allow_negative_stock, via_landed_cost_voucher)
 				update_bin_qty(bin_name, args)
@@ -219,10 +234,17 @@ def repost_future_sle(
 	allow_negative_stock=None,
 	via_landed_cost_voucher=False,
 	doc=None,
+	bulk_reposting=None,
 ):
 	if not args:
 		args = []  # set args to empty list if None to avoid enumerate error
 
+	if bulk_reposting is None:
+		bulk_reposting = cint(
+			frappe.db.get_single_value("Stock Reposting Settings", "bulk_reposting", cache=True)
+		)
+	repost_buffer = BulkRepostBuffer() if bulk_reposting else None
+
 	items_to_be_repost = get_items_to_be_repost(
 		voucher_type=voucher_type, voucher_no=voucher_no, doc=doc
 	)
@@ -235,19 +257,33 @@ def repost_future_sle(
 	i = get_current_index(doc) or 0
 	while i < len(args):
 		validate_item_warehouse(args[i])
-
-		obj = update_entries_after(
-			{
-				"item_code": args[i].get("item_code"),
-				"warehouse": args[i].get("warehouse"),
-				"posting_date": args[i].get("posting_date"),
-				"posting_time": args[i].get("posting_time"),
-				"creation": args[i].get("creation"),
-				"distinct_item_warehouses": distinct_item_warehouses,
-			},
-			allow_negative_stock=allow_negative_stock,
-			via_landed_cost_voucher=via_landed_cost_voucher,
+		invalidate_stock_ageing_checkpoints(
+			args[i].get("item_code"), args[i].get("warehouse"), args[i].get("posting_date")
 		)
+
+		sle_args = {
+			"item_code": args[i].get("item_code"),
+			"warehouse": args[i].get("warehouse"),
+			"posting_date": args[i].get("posting_date"),
+			"posting_time": args[i].get("posting_time"),
+			"creation": args[i].get("creation"),
+			"distinct_item_warehouses": distinct_item_warehouses,
+		}
+
+		if repost_buffer:
+			repost_buffer.prefetch(args, i)
+			obj = bulk_update_entries_after(
+				sle_args,
+				repost_buffer,
+				allow_negative_stock=allow_negative_stock,
+				via_landed_cost_voucher=via_landed_cost_voucher,
+			)
+		else:
+			obj = update_entries_after(
+				sle_args,
+				allow_negative_stock=allow_negative_stock,
+				via_landed_cost_voucher=via_landed_cost_voucher,
+			)
 		affected_transactions.update(obj.affected_transactions)
 
 		distinct_item_warehouses[
@@ -267,6 +303,13 @@ def repost_future_sle(
 				data.sle_changed = False
 		i += 1
 
+		if repost_buffer:
+			if i % repost_buffer.chunk_size and i < len(args):
+				continue
+
+			# ledger writes are buffered, persist them before saving the progress
+			repost_buffer.flush()
+
 		if doc:
 			update_args_in_repost_item_valuation(
 				doc, i, args, distinct_item_warehouses, affected_transactions
@@ -337,7 +380,7 @@ def get_distinct_item_warehouse(args=None, doc=None):
 
 
 def get_affected_transactions(doc) -> Set[Tuple[str, str]]:
-	if not doc.affected_transactions:
+	if not doc or not doc.affected_transactions:
 		return set()
 
 	transactions = frappe.parse_json(doc.affected_transactions)
@@ -425,7 +468,7 @@ class update_entries_after(object):
 		"""
 		self.data.setdefault(args.warehouse, frappe._dict())
 		warehouse_dict = self.data[args.warehouse]
-		previous_sle = get_previous_sle_of_current_voucher(args)
+		previous_sle = self.get_previous_sle_of_current_voucher(args)
 		warehouse_dict.previous_sle = previous_sle
 
 		for key in ("qty_after_transaction", "valuation_rate", "stock_value"):
@@ -439,6 +482,9 @@ class update_entries_after(object):
 			}
 		)
 
+	def get_previous_sle_of_current_voucher(self, args):
+		return get_previous_sle_of_current_voucher(args)
+
 	def build(self):
 		from erpnext.controllers.stock_controller import future_sle_exists
 
@@ -470,22 +516,21 @@ class update_entries_after(object):
 			self.process_sle(sle)
 
 	def get_sle_against_current_voucher(self):
-		self.args["time_format"] = "%H:%i:%s"
+		self.args["posting_datetime"] = get_combine_datetime(
+			self.args.posting_date, self.args.posting_time
+		)
 
 		return frappe.db.sql(
 			"""
 			select
-				*, timestamp(posting_date, posting_time) as "timestamp"
+				*, posting_datetime as "timestamp"
 			from
 				`tabStock Ledger Entry`
 			where
 				item_code = %(item_code)s
 				and warehouse = %(warehouse)s
 				and is_cancelled = 0
-				and (
-					posting_date = %(posting_date)s and
-					time_format(posting_time, %(time_format)s) = time_format(%(posting_time)s, %(time_format)s)
-				)
+				and posting_datetime = %(posting_datetime)s
 			order by
 				creation ASC
 			for update
@@ -616,15 +661,18 @@ class update_entries_after(object):
 		sle.qty_after_transaction = self.wh_data.qty_after_transaction
 		sle.valuation_rate = self.wh_data.valuation_rate
 		sle.stock_value = self.wh_data.stock_value
-		sle.stock_queue = json.dumps(self.wh_data.stock_queue)
+		sle.stock_queue = serialize_stock_queue(self.wh_data.stock_queue)
 		sle.stock_value_difference = stock_value_difference
 		sle.doctype = "Stock Ledger Entry"
 
-		frappe.get_doc(sle).db_update()
+		self.update_sle(sle)
 
 		if not self.args.get("sle_id"):
 			self.update_outgoing_rate_on_transaction(sle)
 
+	def update_sle(self, sle):
+		frappe.get_doc(sle).db_update()
+
 	def reset_actual_qty_for_stock_reco(self, sle):
 		current_qty = frappe.get_cached_value(
 			"Stock Reconciliation Item", sle.voucher_detail_no, "current_qty"
@@ -849,27 +897,29 @@ class update_entries_after(object):
 
 		# Get rate for serial nos which has been transferred to other company
 		invalid_serial_nos = [d.name for d in all_serial_nos if d.company != sle.company]
-		for serial_no in invalid_serial_nos:
-			incoming_rate = frappe.db.sql(
+		if invalid_serial_nos:
+			incoming_rates = {}
+			for serial_no, incoming_rate in frappe.db.sql(
 				"""
-				select incoming_rate
-				from `tabStock Ledger Entry`
+				select serial_ledger.serial_no, sle.incoming_rate
+				from `tabSerial No Ledger Entry` serial_ledger
+				inner join `tabStock Ledger Entry` sle
+					on sle.name = serial_ledger.stock_ledger_entry
 				where
-					company = %s
-					and actual_qty > 0
-					and is_cancelled = 0
-					and (serial_no = %s
-						or serial_no like %s
-						or serial_no like %s
-						or serial_no like %s
-					)
-				order by posting_date desc
-				limit 1
+					serial_ledger.serial_no in %(serial_nos)s
+					and serial_ledger.company = %(company)s
+					and sle.actual_qty > 0
+					and sle.is_cancelled = 0
+				order by sle.posting_date desc
 			""",
-				(sle.company, serial_no, serial_no + "\n%", "%\n" + serial_no, "%\n" + serial_no + "\n%"),
-			)
+				{"serial_nos": tuple(invalid_serial_nos), "company": sle.company},
+			):
+				# latest incoming rate of each serial no
+				incoming_rates.setdefault(serial_no.upper(), incoming_rate)
 
-			incoming_values += flt(incoming_rate[0][0]) if incoming_rate else 0
+			incoming_values += sum(
+				flt(incoming_rates.get(serial_no.upper())) for serial_no in invalid_serial_nos
+			)
 
 		return incoming_values
 
@@ -921,10 +971,11 @@ class update_entries_after(object):
 			self.wh_data.qty_after_transaction + actual_qty
 		)
 
-		if self.valuation_method == "LIFO":
-			stock_queue = LIFOValuation(self.wh_data.stock_queue)
-		else:
-			stock_queue = FIFOValuation(self.wh_data.stock_queue)
+		# keep the queue in memory across consecutive entries of the warehouse
+		ValuationKlass = LIFOValuation if self.valuation_method == "LIFO" else FIFOValuation
+		stock_queue = self.wh_data.stock_queue
+		if not isinstance(stock_queue, ValuationKlass):
+			stock_queue = ValuationKlass(stock_queue)
 
 		_prev_qty, prev_stock_value = stock_queue.get_total_stock_and_value()
 
@@ -949,14 +1000,14 @@ class update_entries_after(object):
 
 		stock_value_difference = stock_value - prev_stock_value
 
-		self.wh_data.stock_queue = stock_queue.state
+		self.wh_data.stock_queue = stock_queue
 		self.wh_data.stock_value = round_off_if_near_zero(
 			self.wh_data.stock_value + stock_value_difference
 		)
 
-		if not self.wh_data.stock_queue:
-			self.wh_data.stock_queue.append(
-				[0, sle.incoming_rate or sle.outgoing_rate or self.wh_data.valuation_rate]
+		if not stock_queue:
+			stock_queue.bins.append(
+				0, sle.incoming_rate or sle.outgoing_rate or self.wh_data.valuation_rate
 			)
 
 		if self.wh_data.qty_after_transaction:
@@ -1077,18 +1128,287 @@ class update_entries_after(object):
 			updated_values = {"actual_qty": data.qty_after_transaction, "stock_value": data.stock_value}
 			if data.valuation_rate is not None:
 				updated_values["valuation_rate"] = data.valuation_rate
-			frappe.db.set_value("Bin", bin_name, updated_values, update_modified=True)
+			self.update_bin_values(bin_name, updated_values)
+
+	def update_bin_values(self, bin_name, updated_values):
+		frappe.db.set_value("Bin", bin_name, updated_values, update_modified=True)
+
+
+class bulk_update_entries_after(update_entries_after):
+	"""
+	update_entries_after for reposting many item-warehouses in one go
+
+	Previous and future SLEs are read from and revaluated SLEs and Bins are
+	written to a `BulkRepostBuffer` shared by all the item-warehouses of a repost.
+	Buffered writes are flushed before every lookup that reads back revaluated
+	ledger values, so results are identical to the item-warehouse wise repost.
+	"""
+
+	def __init__(self, args, repost_buffer, **kwargs):
+		self.repost_buffer = repost_buffer
+		super().__init__(args, **kwargs)
+
+	def get_previous_sle_of_current_voucher(self, args):
+		previous_sle = self.repost_buffer.get_previous_sle(args)
+		if previous_sle is None:
+			self.repost_buffer.flush()
+			previous_sle = super().get_previous_sle_of_current_voucher(args)
+
+		return previous_sle
+
+	def get_sle_after_datetime(self, args):
+		future_sles = self.repost_buffer.get_future_sles(args)
+		if future_sles is None:
+			self.repost_buffer.flush()
+			future_sles = super().get_sle_after_datetime(args)
+
+		return future_sles
+
+	def get_dependent_entries_to_fix(self, entries_to_fix, sle):
+		self.repost_buffer.flush()
+		return super().get_dependent_entries_to_fix(entries_to_fix, sle)
+
+	def get_dynamic_incoming_outgoing_rate(self, sle):
+		if sle.recalculate_rate:
+			self.repost_buffer.flush()
+
+		super().get_dynamic_incoming_outgoing_rate(sle)
+
+	def get_incoming_value_for_serial_nos(self, sle, serial_nos):
+		self.repost_buffer.flush()
+		return super().get_incoming_value_for_serial_nos(sle, serial_nos)
+
+	def update_batched_values(self, sle):
+		if flt(sle.actual_qty) <= 0:
+			self.repost_buffer.flush()
+
+		super().update_batched_values(sle)
+
+	def get_fallback_rate(self, sle) -> float:
+		self.repost_buffer.flush()
+		return super().get_fallback_rate(sle)
+
+	def recalculate_amounts_in_stock_entry(self, voucher_no):
+		self.repost_buffer.flush()
+		super().recalculate_amounts_in_stock_entry(voucher_no)
+
+	def update_rate_on_purchase_receipt(self, sle, outgoing_rate):
+		self.repost_buffer.flush()
+		super().update_rate_on_purchase_receipt(sle, outgoing_rate)
+
+	def update_sle(self, sle):
+		self.repost_buffer.update_sle(sle)
+
+	def update_bin_values(self, bin_name, updated_values):
+		self.repost_buffer.update_bin(bin_name, updated_values)
+
+
+class BulkRepostBuffer:
+	"""Ledger reads and writes shared by the item-warehouses of a bulk repost.
+
+	Previous and future SLEs are loaded for a chunk of item-warehouses with a couple
+	of queries and the revaluated SLEs and Bins are written back in batches on `flush`.
+	"""
+
+	chunk_size = 100
+
+	sle_float_fields = (
+		"actual_qty",
+		"incoming_rate",
+		"outgoing_rate",
+		"qty_after_transaction",
+		"valuation_rate",
+		"stock_value",
+		"stock_value_difference",
+	)
+
+	def __init__(self):
+		self.previous_sles = {}
+		self.future_sles = {}
+		self.sle_updates = {}
+		self.bin_updates = {}
+
+	def prefetch(self, args, index):
+		"""Load previous and future SLEs of the chunk of `args` starting at `index`"""
+
+		if get_item_warehouse_key(args[index]) in self.previous_sles:
+			return
+
+		# the chunk may contain entries revaluated in the current buffer
+		self.flush()
+
+		chunk = {}
+		for row in args[index : index + self.chunk_size]:
+			chunk.setdefault(get_item_warehouse_key(row), frappe._dict(row))
+
+		previous_sles = get_previous_sles_for_item_warehouses(list(chunk.values()))
+		previous_sles = {key: previous_sles.get(key, frappe._dict()) for key in chunk}
+		future_sles = get_future_sles_for_item_warehouses(previous_sles)
+
+		for key, row in chunk.items():
+			self.previous_sles[key] = (get_posting_key(row), previous_sles[key])
+			self.future_sles[key] = (previous_sles[key].get("name"), future_sles.get(key, []))
+
+	def get_previous_sle(self, args):
+		"""Prefetched previous SLE for args, None if it wasn't prefetched"""
+
+		posting_key, previous_sle = self.previous_sles.pop(get_item_warehouse_key(args), (None, None))
+		if posting_key == get_posting_key(args):
+			return previous_sle
+
+	def get_future_sles(self, previous_sle):
+		"""Prefetched SLEs after the previous SLE, None if they weren't prefetched"""
+
+		key = get_item_warehouse_key(previous_sle)
+		if key not in self.future_sles:
+			return
+
+		previous_sle_name, future_sles = self.future_sles.pop(key)
+		if previous_sle_name == previous_sle.get("name"):
+			return future_sles
+
+	def update_sle(self, sle):
+		updated_values = {field: flt(sle.get(field)) for field in self.sle_float_fields}
+		updated_values.update(
+			{"stock_queue": sle.get("stock_queue"), "is_cancelled": cint(sle.get("is_cancelled"))}
+		)
+		self.sle_updates[sle.name] = updated_values
+
+	def update_bin(self, bin_name, updated_values):
+		self.bin_updates.setdefault(bin_name, {}).update(updated_values)
+
+	def flush(self):
+		if self.sle_updates:
+			bulk_update_values("Stock Ledger Entry", self.sle_updates)
+			self.sle_updates = {}
+
+		if self.bin_updates:
+			bulk_update_values("Bin", self.bin_updates, update_modified=True)
+			self.bin_updates = {}
+
+
+def get_item_warehouse_key(args):
+	return (args.get("item_code"), args.get("warehouse"))
+
+
+def get_posting_key(args):
+	return (cstr(args.get("posting_date")), cstr(args.get("posting_time")))
+
+
+def get_previous_sles_for_item_warehouses(args_list):
+	"""Bulk version of `get_previous_sle_of_current_voucher`, returns {(item_code, warehouse): sle}"""
+
+	if not args_list:
+		return {}
+
+	query = """
+		(select *, posting_datetime as "timestamp"
+		from `tabStock Ledger Entry`
+		where item_code = %s
+			and warehouse = %s
+			and is_cancelled = 0
+			and posting_datetime < %s
+		order by posting_datetime desc, creation desc
+		limit 1)"""
+
+	values = []
+	for args in args_list:
+		posting_datetime = get_combine_datetime(
+			args.get("posting_date") or "1900-01-01", args.get("posting_time") or "00:00"
+		)
+		values.extend([args.item_code, args.warehouse, posting_datetime])
+
+	sles = frappe.db.sql(" union all ".join([query] * len(args_list)), values, as_dict=1)
+	return {get_item_warehouse_key(sle): sle for sle in sles}
+
+
+def get_future_sles_for_item_warehouses(previous_sles):
+	"""Bulk version of `update_entries_after.get_sle_after_datetime`.
+
+	:param previous_sles: {(item_code, warehouse): previous sle or empty dict}
+	:returns: {(item_code, warehouse): [future sles in posting order]}
+	"""
+
+	if not previous_sles:
+		return {}
+
+	# lock only the future entries of each item and warehouse, from its own previous entry
+	conditions, values = [], []
+	for (item_code, warehouse), previous_sle in previous_sles.items():
+		conditions.append("(item_code = %s and warehouse = %s and posting_datetime > %s)")
+		values.extend(
+			[item_code, warehouse, get_datetime(previous_sle.get("posting_datetime") or "1900-01-01")]
+		)
+
+	sles = frappe.db.sql(
+		"""
+		select *, posting_datetime as "timestamp"
+		from `tabStock Ledger Entry`
+		where is_cancelled = 0
+			and ({conditions})
+		order by posting_datetime asc, creation asc
+		for update""".format(
+			conditions=" or ".join(conditions)
+		),
+		values,
+		as_dict=1,
+	)
+
+	future_sles = {}
+	for sle in sles:
+		key = get_item_warehouse_key(sle)
+		if key not in previous_sles or sle.name == previous_sles[key].get("name"):
+			continue
+
+		future_sles.setdefault(key, []).append(sle)
+
+	return future_sles
+
+
+def bulk_update_values(doctype, updates, update_modified=False, chunk_size=100):
+	"""Write `{name: {fieldname: value}}` using one update statement per chunk of records"""
+
+	names = list(updates)
+	for start in range(0, len(names), chunk_size):
+		chunk = names[start : start + chunk_size]
+		fieldnames = sorted({fieldname for name in chunk for fieldname in updates[name]})
+
+		set_clauses = []
+		values = []
+		for fieldname in fieldnames:
+			cases = []
+			for name in chunk:
+				if fieldname in updates[name]:
+					cases.append("when %s then %s")
+					values.extend([name, updates[name][fieldname]])
+
+			set_clauses.append(f"`{fieldname}` = case name {' '.join(cases)} else `{fieldname}` end")
+
+		if update_modified:
+			set_clauses.append("modified = %s, modified_by = %s")
+			values.extend([now(), frappe.session.user])
+
+		values.extend(chunk)
+		frappe.db.sql(
+			"""update `tab{doctype}` set {set_clauses} where name in ({names})""".format(
+				doctype=doctype,
+				set_clauses=", ".join(set_clauses),
+				names=", ".join(["%s"] * len(chunk)),
+			),
+			values,
+		)
 
 
 def get_previous_sle_of_current_voucher(args, operator="<", exclude_current_voucher=False):
 	"""get stock ledger entries filtered by specific posting datetime conditions"""
 
-	args["time_format"] = "%H:%i:%s"
 	if not args.get("posting_date"):
 		args["posting_date"] = "1900-01-01"
 	if not args.get("posting_time"):
 		args["posting_time"] = "00:00"
 
+	args["posting_datetime"] = get_combine_datetime(args["posting_date"], args["posting_time"])
+
 	voucher_condition = ""
 	if exclude_current_voucher:
 		voucher_no = args.get("voucher_no")
@@ -1096,20 +1416,14 @@ def get_previous_sle_of_current_voucher(args, operator="<", exclude_current_vouc
 
 	sle = frappe.db.sql(
 		"""
-		select *, timestamp(posting_date, posting_time) as "timestamp"
+		select *, posting_datetime as "timestamp"
 		from `tabStock Ledger Entry`
 		where item_code = %(item_code)s
 			and warehouse = %(warehouse)s
 			and is_cancelled = 0
 			{voucher_condition}
-			and (
-				posting_date < %(posting_date)s or
-				(
-					posting_date = %(posting_date)s and
-					time_format(posting_time, %(time_format)s) {operator} time_format(%(posting_time)s, %(time_format)s)
-				)
-			)
-		order by timestamp(posting_date, posting_time) desc, creation desc
+			and posting_datetime {operator} %(posting_datetime)s
+		order by posting_datetime desc, creation desc
 		limit 1
 		for update""".format(
 			operator=operator, voucher_condition=voucher_condition
@@ -1150,31 +1464,15 @@ def get_stock_ledger_entries(
 	check_serial_no=True,
 ):
 	"""get stock ledger entries filtered by specific posting datetime conditions"""
-	conditions = " and timestamp(posting_date, posting_time) {0} timestamp(%(posting_date)s, %(posting_time)s)".format(
-		operator
-	)
+	conditions = " and posting_datetime {0} %(posting_datetime)s".format(operator)
 	if previous_sle.get("warehouse"):
 		conditions += " and warehouse = %(warehouse)s"
 	elif previous_sle.get("warehouse_condition"):
 		conditions += " and " + previous_sle.get("warehouse_condition")
 
 	if check_serial_no and previous_sle.get("serial_no"):
-		# conditions += " and serial_no like {}".format(frappe.db.escape('%{0}%'.format(previous_sle.get("serial_no"))))
-		serial_no = previous_sle.get("serial_no")
-		conditions += (
-			""" and
-			(
-				serial_no = {0}
-				or serial_no like {1}
-				or serial_no like {2}
-				or serial_no like {3}
-			)
-		"""
-		).format(
-			frappe.db.escape(serial_no),
-			frappe.db.escape("{}\n%".format(serial_no)),
-			frappe.db.escape("%\n{}".format(serial_no)),
-			frappe.db.escape("%\n{}\n%".format(serial_no)),
+		conditions += " and " + get_serial_no_condition(
+			previous_sle.get("serial_no"), previous_sle.get("item_code")
 		)
 
 	if not previous_sle.get("posting_date"):
@@ -1182,17 +1480,21 @@ def get_stock_ledger_entries(
 	if not previous_sle.get("posting_time"):
 		previous_sle["posting_time"] = "00:00"
 
+	previous_sle["posting_datetime"] = get_combine_datetime(
+		previous_sle["posting_date"], previous_sle["posting_time"]
+	)
+
 	if operator in (">", "<=") and previous_sle.get("name"):
 		conditions += " and name!=%(name)s"
 
 	return frappe.db.sql(
 		"""
-		select *, timestamp(posting_date, posting_time) as "timestamp"
+		select *, posting_datetime as "timestamp"
 		from `tabStock Ledger Entry`
 		where item_code = %%(item_code)s
 		and is_cancelled = 0
 		%(conditions)s
-		order by timestamp(posting_date, posting_time) %(order)s, creation %(order)s
+		order by posting_datetime %(order)s, creation %(order)s
 		%(limit)s %(for_update)s"""
 		% {
 			"conditions": conditions,
@@ -1215,7 +1517,7 @@ def get_sle_by_voucher_detail_no(voucher_detail_no, excluded_sle=None):
 			"warehouse",
 			"posting_date",
 			"posting_time",
-			"timestamp(posting_date, posting_time) as timestamp",
+			"posting_datetime as timestamp",
 		],
 		as_dict=1,
 	)
@@ -1227,14 +1529,10 @@ def get_batch_incoming_rate(
 
 	sle = frappe.qb.DocType("Stock Ledger Entry")
 
-	timestamp_condition = CombineDatetime(sle.posting_date, sle.posting_time) < CombineDatetime(
-		posting_date, posting_time
-	)
+	posting_datetime = get_combine_datetime(posting_date, posting_time)
+	timestamp_condition = sle.posting_datetime < posting_datetime
 	if creation:
-		timestamp_condition |= (
-			CombineDatetime(sle.posting_date, sle.posting_time)
-			== CombineDatetime(posting_date, posting_time)
-		) & (sle.creation < creation)
+		timestamp_condition |= (sle.posting_datetime == posting_datetime) & (sle.creation < creation)
 
 	batch_details = (
 		frappe.qb.from_(sle)
@@ -1356,7 +1654,7 @@ def update_qty_in_future_sle(args, allow_negative_stock=False):
 	datetime_limit_condition = ""
 	qty_shift = args.actual_qty
 
-	args["time_format"] = "%H:%i:%s"
+	args["posting_datetime"] = get_combine_datetime(args.posting_date, args.posting_time)
 
 	# find difference/shift in qty caused by stock reconciliation
 	if args.voucher_type == "Stock Reconciliation":
@@ -1381,13 +1679,7 @@ def update_qty_in_future_sle(args, allow_negative_stock=False):
 			and warehouse = %(warehouse)s
 			and voucher_no != %(voucher_no)s
 			and is_cancelled = 0
-			and (
-				posting_date > %(posting_date)s or
-				(
-					posting_date = %(posting_date)s and
-					time_format(posting_time, %(time_format)s) > time_format(%(posting_time)s, %(time_format)s)
-				)
-			)
+			and posting_datetime > %(posting_datetime)s
 		{datetime_limit_condition}
 		""",
 		args,
@@ -1433,6 +1725,7 @@ def get_next_stock_reco(kwargs):
 	"""Returns next nearest stock reconciliaton's details."""
 
 	sle = frappe.qb.DocType("Stock Ledger Entry")
+	posting_datetime = get_combine_datetime(kwargs.get("posting_date"), kwargs.get("posting_time"))
 
 	query = (
 		frappe.qb.from_(sle)
@@ -1440,6 +1733,7 @@ def get_next_stock_reco(kwargs):
 			sle.name,
 			sle.posting_date,
 			sle.posting_time,
+			sle.posting_datetime,
 			sle.creation,
 			sle.voucher_no,
 			sle.item_code,
@@ -1453,20 +1747,11 @@ def get_next_stock_reco(kwargs):
 			& (sle.voucher_no != kwargs.get("voucher_no"))
 			& (sle.is_cancelled == 0)
 			& (
-				(
-					CombineDatetime(sle.posting_date, sle.posting_time)
-					> CombineDatetime(kwargs.get("posting_date"), kwargs.get("posting_time"))
-				)
-				| (
-					(
-						CombineDatetime(sle.posting_date, sle.posting_time)
-						== CombineDatetime(kwargs.get("posting_date"), kwargs.get("posting_time"))
-					)
-					& (sle.creation > kwargs.get("creation"))
-				)
+				(sle.posting_datetime > posting_datetime)
+				| ((sle.posting_datetime == posting_datetime) & (sle.creation > kwargs.get("creation")))
 			)
 		)
-		.orderby(CombineDatetime(sle.posting_date, sle.posting_time))
+		.orderby(sle.posting_datetime)
 		.orderby(sle.creation)
 		.limit(1)
 	)
@@ -1480,9 +1765,9 @@ def get_next_stock_reco(kwargs):
 def get_datetime_limit_condition(detail):
 	return f"""
 		and
-		(timestamp(posting_date, posting_time) < timestamp('{detail.posting_date}', '{detail.posting_time}')
+		(posting_datetime < '{detail.posting_datetime}'
 			or (
-				timestamp(posting_date, posting_time) = timestamp('{detail.posting_date}', '{detail.posting_time}')
+				posting_datetime = '{detail.posting_datetime}'
 				and creation < '{detail.creation}'
 			)
 		)"""
@@ -1545,6 +1830,8 @@ def is_negative_with_precision(neg_sle, is_batch=False):
 
 
 def get_future_sle_with_negative_qty(args):
+	args["posting_datetime"] = get_combine_datetime(args.posting_date, args.posting_time)
+
 	return frappe.db.sql(
 		"""
 		select
@@ -1555,10 +1842,10 @@ def get_future_sle_with_negative_qty(args):
 			item_code = %(item_code)s
 			and warehouse = %(warehouse)s
 			and voucher_no != %(voucher_no)s
-			and timestamp(posting_date, posting_time) >= timestamp(%(posting_date)s, %(posting_time)s)
+			and posting_datetime >= %(posting_datetime)s
 			and is_cancelled = 0
 			and qty_after_transaction < 0
-		order by timestamp(posting_date, posting_time) asc
+		order by posting_datetime asc
 		limit 1
 	""",
 		args,
@@ -1567,24 +1854,26 @@ def get_future_sle_with_negative_qty(args):
 
 
 def get_future_sle_with_negative_batch_qty(args):
+	args["posting_datetime"] = get_combine_datetime(args.posting_date, args.posting_time)
+
 	return frappe.db.sql(
 		"""
 		with batch_ledger as (
 			select
-				posting_date, posting_time, voucher_type, voucher_no,
-				sum(actual_qty) over (order by posting_date, posting_time, creation) as cumulative_total
+				posting_date, posting_time, posting_datetime, voucher_type, voucher_no,
+				sum(actual_qty) over (order by posting_datetime, creation) as cumulative_total
 			from `tabStock Ledger Entry`
 			where
 				item_code = %(item_code)s
 				and warehouse = %(warehouse)s
 				and batch_no=%(batch_no)s
 				and is_cancelled = 0
-			order by posting_date, posting_time, creation
+			order by posting_datetime, creation
 		)
 		select * from batch_ledger
 		where
 			cumulative_total < 0.0
-			and timestamp(posting_date, posting_time) >= timestamp(%(posting_date)s, %(posting_time)s)
+			and posting_datetime >= %(posting_datetime)s
 		limit 1
 	""",
 		args,
@@ -4,7 +4,7 @@ import frappe
 from frappe.test_runner import make_test_records
 from frappe.tests.utils import FrappeTestCase
 
-from erpnext.stock.get_item_details import get_item_details
+from erpnext.stock.get_item_details import get_item_details, get_items_details
 
 test_ignore = ["BOM"]
 test_dependencies = ["Customer", "Supplier", "Item", "Price List", "Item Price"]
@@ -38,3 +38,32 @@ class TestGetItemDetail(FrappeTestCase):
 		)
 		details = get_item_details(args)
 		self.assertEqual(details.get("price_list_rate"), 100)
+
+	def test_get_items_details(self):
+		args = {
+			"company": "_Test Company",
+			"conversion_rate": 1.0,
+			"price_list_currency": "USD",
+			"plc_conversion_rate": 1.0,
+			"doctype": "Purchase Order",
+			"supplier": "_Test Supplier",
+			"transaction_date": "2026-01-10",
+			"price_list": "_Test Buying Price List",
+			"ignore_pricing_rule": 1,
+		}
+		items = [
+			{"item_code": "_Test Item", "qty": 1},
+			{"item_code": "_Test Item", "qty": 5, "warehouse": "_Test Warehouse - _TC"},
+			{"item_code": "_Test Item 2", "qty": 2, "uom": "_Test UOM"},
+			{"item_code": "_Test Item Home Desktop 100", "qty": 3},
+		]
+		doc = {"doctype": "Purchase Order", "transaction_date": "2026-01-10"}
+
+		expected = [get_item_details({**args, **item}, doc=doc) for item in items]
+		details = get_items_details(json.dumps(args), json.dumps(items), doc=json.dumps(doc))
+
+		self.assertEqual(len(details), len(items))
+		for row, expected_row in zip(details, expected):
+			self.assertEqual(row, expected_row)
+		self.assertEqual(details[0].get("price_list_rate"), 100)
+		self.assertFalse(frappe.flags.item_details_batch)
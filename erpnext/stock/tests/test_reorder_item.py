@@ -0,0 +1,59 @@
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+from erpnext.stock.doctype.warehouse.test_warehouse import create_warehouse
+from erpnext.stock.reorder_item import (
+	get_item_reorder_levels,
+	get_item_warehouse_projected_qty,
+	get_warehouse_ancestors,
+)
+
+
+class TestReorderItem(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_projected_qty_of_warehouse_groups(self):
+		item_code = make_item("_Test Reorder Rollup Item", {"is_stock_item": 1}).name
+		warehouses = [create_warehouse(f"_Test Reorder Warehouse {i}") for i in range(2)]
+		for qty, warehouse in zip((3, 7), warehouses):
+			make_stock_entry(item_code=item_code, target=warehouse, qty=qty, basic_rate=100)
+
+		ancestors = get_warehouse_ancestors()
+		self.assertEqual(ancestors[warehouses[0]][-2:], ["_Test Warehouse Group - _TC", warehouses[0]])
+
+		projected_qty = get_item_warehouse_projected_qty([item_code])[item_code]
+		self.assertEqual(projected_qty[warehouses[0]], 3)
+		self.assertEqual(projected_qty[warehouses[1]], 7)
+		for warehouse in ancestors[warehouses[0]][:-1]:
+			self.assertEqual(projected_qty[warehouse], 10)
+
+	def test_variant_reorder_levels_from_template(self):
+		template = make_item(
+			"_Test Reorder Template",
+			{"is_stock_item": 1, "has_variants": 1, "attributes": [{"attribute": "Test Size"}]},
+		)
+		template.append(
+			"reorder_levels",
+			{
+				"warehouse": "_Test Warehouse - _TC",
+				"warehouse_group": "_Test Warehouse Group - _TC",
+				"warehouse_reorder_level": 20,
+				"warehouse_reorder_qty": 5,
+				"material_request_type": "Purchase",
+			},
+		)
+		template.save()
+
+		items = [
+			frappe._dict(name="_Test Reorder Variant", variant_of=template.name),
+			frappe._dict(name=template.name, variant_of=None),
+		]
+		reorder_levels = get_item_reorder_levels(items)
+
+		variant_level = reorder_levels["_Test Reorder Variant"][0]
+		self.assertEqual(variant_level.warehouse_reorder_level, 20)
+		self.assertIsNone(variant_level.warehouse_group)
+		self.assertEqual(reorder_levels[template.name][0].warehouse_group, "_Test Warehouse Group - _TC")
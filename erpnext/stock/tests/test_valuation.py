@@ -126,6 +126,32 @@ class TestFIFOValuation(unittest.TestCase):
 		self.queue.add_stock(5, 17)
 		self.queue.add_stock(8, 11)
 
+	def test_serialization(self):
+		self.queue.add_stock(1, 10)
+		self.queue.add_stock(2, 20)
+		self.queue.remove_stock(1.5)
+
+		serialized = self.queue.serialize()
+		self.assertEqual(json.loads(serialized), [[1.5, 20]])
+		self.assertEqual(FIFOValuation(json.loads(serialized)), self.queue)
+		self.assertEqual(FIFOValuation([]).serialize(), "[]")
+
+	def test_long_queue_consumption(self):
+		expected = []
+		for i in range(1, 201):
+			self.queue.add_stock(1, i)
+			expected.append([1, i])
+
+		# consume from head past the compaction threshold
+		for _ in range(150):
+			self.queue.remove_stock(1)
+			expected.pop(0)
+			self.assertEqual(self.queue, expected)
+
+		self.queue.remove_stock(1, outgoing_rate=190)
+		expected.remove([1, 190])
+		self.assertEqual(self.queue, expected)
+
 	@given(stock_queue_generator)
 	def test_fifo_qty_hypothesis(self, stock_queue):
 		self.queue = FIFOValuation([])
@@ -383,3 +409,47 @@ class TestLIFOValuationSLE(FrappeTestCase):
 
 		out5 = self._make_stock_entry(-5)
 		self.assertStockQueue(out5, [])
+
+
+def run_stock_queue_benchmark(receipts=2000, issues=2000, valuation_method="FIFO"):
+	"""Compare re-parsing the serialized queue for every entry against keeping it in memory.
+
+	Usage: bench --site test_site execute
+	erpnext.stock.tests.test_valuation.run_stock_queue_benchmark
+	"""
+	from random import Random
+	from time import perf_counter
+
+	ValuationKlass = LIFOValuation if valuation_method == "LIFO" else FIFOValuation
+
+	random = Random(42)
+	entries = [(1.0, float(random.randint(1, 100))) for _ in range(receipts)]
+	entries += [(-1.0, 0.0) for _ in range(issues)]
+
+	def process(queue, qty, rate):
+		queue.get_total_stock_and_value()
+		if qty > 0:
+			queue.add_stock(qty, rate)
+		else:
+			queue.remove_stock(abs(qty))
+		queue.get_total_stock_and_value()
+		return queue.serialize()
+
+	start = perf_counter()
+	serialized = "[]"
+	for qty, rate in entries:
+		serialized = process(ValuationKlass(json.loads(serialized)), qty, rate)
+	reparsed_time = perf_counter() - start
+
+	start = perf_counter()
+	queue = ValuationKlass([])
+	for qty, rate in entries:
+		in_memory_serialized = process(queue, qty, rate)
+	in_memory_time = perf_counter() - start
+
+	return {
+		"entries": len(entries),
+		"reparsed_seconds": reparsed_time,
+		"in_memory_seconds": in_memory_time,
+		"identical": serialized == in_memory_serialized,
+	}
@@ -2,13 +2,14 @@
 # License: GNU General Public License v3. See license.txt
 
 
+import datetime
 import json
 from typing import Dict, Optional
 
 import frappe
 from frappe import _
 from frappe.query_builder.functions import CombineDatetime, IfNull, Sum
-from frappe.utils import cstr, flt, get_link_to_form, nowdate, nowtime
+from frappe.utils import cstr, flt, get_link_to_form, get_time, getdate, nowdate, nowtime
 
 import erpnext
 from erpnext.stock.doctype.warehouse.warehouse import get_child_warehouses
@@ -302,6 +303,16 @@ def get_incoming_rate(args, raise_error_if_no_rate=True):
 	return flt(in_rate)
 
 
+def get_combine_datetime(posting_date, posting_time):
+	"""Posting datetime stored in `posting_datetime` of ledger entries, without microseconds"""
+	if isinstance(posting_time, datetime.timedelta):
+		posting_time = (datetime.datetime.min + posting_time).time()
+	else:
+		posting_time = get_time(posting_time or "00:00:00")
+
+	return datetime.datetime.combine(getdate(posting_date), posting_time).replace(microsecond=0)
+
+
 def get_avg_purchase_rate(serial_nos):
 	"""get average value of serial numbers"""
 
@@ -1,4 +1,6 @@
-from abc import ABC, abstractmethod, abstractproperty
+import json
+from abc import ABC, abstractmethod
+from array import array
 from typing import Callable, List, NewType, Optional, Tuple
 
 from frappe.utils import flt
@@ -10,7 +12,139 @@ QTY = 0
 RATE = 1
 
 
+class StockBins:
+	"""Columnar storage for bins of [qty, rate].
+
+	Qty and rate are kept in two parallel `array('d')` buffers. Bins consumed from the head are
+	only skipped over and the buffers are compacted once the dead head outgrows the live bins, so
+	FIFO consumption is amortized O(1) instead of shifting the whole list on every pop.
+
+	The JSON of every bin is cached alongside, serializing the queue after each entry only joins
+	strings for the unchanged bins instead of encoding every float again.
+	"""
+
+	__slots__ = ["qtys", "rates", "encoded", "head", "_totals", "_encode_pending"]
+
+	def __init__(self, bins: Optional[List[StockBin]] = None):
+		bins = bins or []
+		self.qtys = array("d", [flt(qty) for qty, _rate in bins])
+		self.rates = array("d", [flt(rate) for _qty, rate in bins])
+		# bins loaded from a saved queue are only encoded if the queue gets serialized again
+		self.encoded = [None] * len(bins)
+		self._encode_pending = bool(bins)
+		self.head = 0
+		self._totals = None
+
+	def __len__(self):
+		return len(self.qtys) - self.head
+
+	def __iter__(self):
+		return iter(self.to_list())
+
+	def to_list(self) -> List[StockBin]:
+		return [[qty, rate] for qty, rate in zip(self.qtys[self.head :], self.rates[self.head :])]
+
+	def serialize(self) -> str:
+		"""Compact JSON representation, readable wherever `stock_queue` is parsed."""
+		if self._encode_pending:
+			for position, encoded in enumerate(self.encoded):
+				if encoded is None:
+					self.encoded[position] = encode_bin(self.qtys[position], self.rates[position])
+			self._encode_pending = False
+
+		return "[" + ",".join(self.encoded[self.head :]) + "]"
+
+	def get_qty(self, index: int) -> float:
+		return self.qtys[self._position(index)]
+
+	def get_rate(self, index: int) -> float:
+		return self.rates[self._position(index)]
+
+	def set_qty(self, index: int, qty: float) -> None:
+		position = self._position(index)
+		self.qtys[position] = qty
+		self.encoded[position] = encode_bin(self.qtys[position], self.rates[position])
+		self._totals = None
+
+	def set_bin(self, index: int, qty: float, rate: float) -> None:
+		position = self._position(index)
+		self.qtys[position] = qty
+		self.rates[position] = rate
+		self.encoded[position] = encode_bin(self.qtys[position], self.rates[position])
+		self._totals = None
+
+	def append(self, qty: float, rate: float) -> None:
+		self.qtys.append(qty)
+		self.rates.append(flt(rate))
+		self.encoded.append(encode_bin(self.qtys[-1], self.rates[-1]))
+		self._totals = None
+
+	def pop(self, index: int) -> StockBin:
+		"""Remove and return bin at `index`, popping from either end is O(1)."""
+		position = self._position(index)
+		popped = [self.qtys[position], self.rates[position]]
+		self._totals = None
+
+		if position == self.head:
+			self.head += 1
+			if self.head == len(self.qtys):
+				self.clear()
+			elif self.head > 32 and self.head * 2 > len(self.qtys):
+				self._compact()
+		elif position == len(self.qtys) - 1:
+			self.qtys.pop()
+			self.rates.pop()
+			self.encoded.pop()
+		else:
+			del self.qtys[position]
+			del self.rates[position]
+			del self.encoded[position]
+
+		return popped
+
+	def index_of_rate(self, rate: float) -> Optional[int]:
+		try:
+			return self.rates.index(rate, self.head) - self.head
+		except ValueError:
+			return None
+
+	def get_totals(self) -> Tuple[float, float]:
+		"""Total qty and value, cached until the bins change."""
+		if self._totals is None:
+			total_qty = 0.0
+			total_value = 0.0
+
+			for qty, rate in zip(self.qtys[self.head :], self.rates[self.head :]):
+				total_qty += qty
+				total_value += qty * rate
+
+			self._totals = (total_qty, total_value)
+
+		return self._totals
+
+	def clear(self) -> None:
+		del self.qtys[:]
+		del self.rates[:]
+		del self.encoded[:]
+		self.head = 0
+		self._totals = None
+
+	def _compact(self) -> None:
+		del self.qtys[: self.head]
+		del self.rates[: self.head]
+		del self.encoded[: self.head]
+		self.head = 0
+
+	def _position(self, index: int) -> int:
+		return index + self.head if index >= 0 else len(self.qtys) + index
+
+
 class BinWiseValuation(ABC):
+	__slots__ = ["bins"]
+
+	def __init__(self, state: Optional[List[StockBin]]):
+		self.bins = StockBins(state)
+
 	@abstractmethod
 	def add_stock(self, qty: float, rate: float) -> None:
 		pass
@@ -21,19 +155,40 @@ class BinWiseValuation(ABC):
 	) -> List[StockBin]:
 		pass
 
-	@abstractproperty
+	@property
 	def state(self) -> List[StockBin]:
-		pass
+		"""Get current state of bins as a list of [qty, rate]."""
+		return self.bins.to_list()
+
+	def serialize(self) -> str:
+		return self.bins.serialize()
 
 	def get_total_stock_and_value(self) -> Tuple[float, float]:
-		total_qty = 0.0
-		total_value = 0.0
+		total_qty, total_value = self.bins.get_totals()
+		return round_off_if_near_zero(total_qty), round_off_if_near_zero(total_value)
 
-		for qty, rate in self.state:
-			total_qty += flt(qty)
-			total_value += flt(qty) * flt(rate)
+	def _add_stock(self, qty: float, rate: float) -> None:
+		"""Add stock at the end of the bins, shared by FIFO and LIFO valuation."""
+		bins = self.bins
+		if not len(bins):
+			bins.append(0, 0)
 
-		return round_off_if_near_zero(total_qty), round_off_if_near_zero(total_value)
+		# last row has the same rate, merge new bin.
+		if bins.get_rate(-1) == rate:
+			bins.set_qty(-1, bins.get_qty(-1) + qty)
+		else:
+			# Item has a positive balance qty, add new entry
+			if bins.get_qty(-1) > 0:
+				bins.append(qty, rate)
+			else:  # negative balance qty
+				qty = bins.get_qty(-1) + qty
+				if qty > 0:  # new balance qty is positive
+					bins.set_bin(-1, qty, rate)
+				else:  # new balance qty is still negative, maintain same rate
+					bins.set_qty(-1, qty)
+
+	def __len__(self):
+		return len(self.bins)
 
 	def __repr__(self):
 		return str(self.state)
@@ -60,15 +215,11 @@ class FIFOValuation(BinWiseValuation):
 
 	# specifying the attributes to save resources
 	# ref: https://docs.python.org/3/reference/datamodel.html#slots
-	__slots__ = ["queue"]
-
-	def __init__(self, state: Optional[List[StockBin]]):
-		self.queue: List[StockBin] = state if state is not None else []
+	__slots__ = []
 
 	@property
-	def state(self) -> List[StockBin]:
-		"""Get current state of queue."""
-		return self.queue
+	def queue(self) -> StockBins:
+		return self.bins
 
 	def add_stock(self, qty: float, rate: float) -> None:
 		"""Update fifo queue with new stock.
@@ -77,22 +228,7 @@ class FIFOValuation(BinWiseValuation):
 		        qty: new quantity to add
 		        rate: incoming rate of new quantity"""
 
-		if not len(self.queue):
-			self.queue.append([0, 0])
-
-		# last row has the same rate, merge new bin.
-		if self.queue[-1][RATE] == rate:
-			self.queue[-1][QTY] += qty
-		else:
-			# Item has a positive balance qty, add new entry
-			if self.queue[-1][QTY] > 0:
-				self.queue.append([qty, rate])
-			else:  # negative balance qty
-				qty = self.queue[-1][QTY] + qty
-				if qty > 0:  # new balance qty is positive
-					self.queue[-1] = [qty, rate]
-				else:  # new balance qty is still negative, maintain same rate
-					self.queue[-1][QTY] = qty
+		self._add_stock(qty, rate)
 
 	def remove_stock(
 		self, qty: float, outgoing_rate: float = 0.0, rate_generator: Callable[[], float] = None
@@ -107,19 +243,17 @@ class FIFOValuation(BinWiseValuation):
 		if not rate_generator:
 			rate_generator = lambda: 0.0  # noqa
 
+		queue = self.bins
 		consumed_bins = []
 		while qty:
-			if not len(self.queue):
+			if not len(queue):
 				# rely on rate generator.
-				self.queue.append([0, rate_generator()])
+				queue.append(0, rate_generator())
 
 			index = None
 			if outgoing_rate > 0:
 				# Find the entry where rate matched with outgoing rate
-				for idx, fifo_bin in enumerate(self.queue):
-					if fifo_bin[RATE] == outgoing_rate:
-						index = idx
-						break
+				index = queue.index_of_rate(outgoing_rate)
 
 				# If no entry found with outgoing rate, consume as per FIFO
 				if index is None:  # nosemgrep
@@ -128,23 +262,22 @@ class FIFOValuation(BinWiseValuation):
 				index = 0
 
 			# select first bin or the bin with same rate
-			fifo_bin = self.queue[index]
-			if qty >= fifo_bin[QTY]:
+			bin_qty, bin_rate = queue.get_qty(index), queue.get_rate(index)
+			if qty >= bin_qty:
 				# consume current bin
-				qty = round_off_if_near_zero(qty - fifo_bin[QTY])
-				to_consume = self.queue.pop(index)
-				consumed_bins.append(list(to_consume))
+				qty = round_off_if_near_zero(qty - bin_qty)
+				consumed_bins.append(queue.pop(index))
 
-				if not self.queue and qty:
+				if not len(queue) and qty:
 					# stock finished, qty still remains to be withdrawn
 					# negative stock, keep in as a negative bin
-					self.queue.append([-qty, outgoing_rate or fifo_bin[RATE]])
-					consumed_bins.append([qty, outgoing_rate or fifo_bin[RATE]])
+					queue.append(-qty, outgoing_rate or bin_rate)
+					consumed_bins.append([qty, outgoing_rate or bin_rate])
 					break
 			else:
 				# qty found in current bin consume it and exit
-				fifo_bin[QTY] = round_off_if_near_zero(fifo_bin[QTY] - qty)
-				consumed_bins.append([qty, fifo_bin[RATE]])
+				queue.set_qty(index, round_off_if_near_zero(bin_qty - qty))
+				consumed_bins.append([qty, bin_rate])
 				qty = 0
 
 		return consumed_bins
@@ -164,15 +297,11 @@ class LIFOValuation(BinWiseValuation):
 
 	# specifying the attributes to save resources
 	# ref: https://docs.python.org/3/reference/datamodel.html#slots
-	__slots__ = ["stack"]
-
-	def __init__(self, state: Optional[List[StockBin]]):
-		self.stack: List[StockBin] = state if state is not None else []
+	__slots__ = []
 
 	@property
-	def state(self) -> List[StockBin]:
-		"""Get current state of stack."""
-		return self.stack
+	def stack(self) -> StockBins:
+		return self.bins
 
 	def add_stock(self, qty: float, rate: float) -> None:
 		"""Update lifo stack with new stock.
@@ -183,22 +312,7 @@ class LIFOValuation(BinWiseValuation):
 
 		Behaviour of this is same as FIFO valuation.
 		"""
-		if not len(self.stack):
-			self.stack.append([0, 0])
-
-		# last row has the same rate, merge new bin.
-		if self.stack[-1][RATE] == rate:
-			self.stack[-1][QTY] += qty
-		else:
-			# Item has a positive balance qty, add new entry
-			if self.stack[-1][QTY] > 0:
-				self.stack.append([qty, rate])
-			else:  # negative balance qty
-				qty = self.stack[-1][QTY] + qty
-				if qty > 0:  # new balance qty is positive
-					self.stack[-1] = [qty, rate]
-				else:  # new balance qty is still negative, maintain same rate
-					self.stack[-1][QTY] = qty
+		self._add_stock(qty, rate)
 
 	def remove_stock(
 		self, qty: float, outgoing_rate: float = 0.0, rate_generator: Callable[[], float] = None
@@ -213,37 +327,49 @@ class LIFOValuation(BinWiseValuation):
 		if not rate_generator:
 			rate_generator = lambda: 0.0  # noqa
 
+		stack = self.bins
 		consumed_bins = []
 		while qty:
-			if not len(self.stack):
+			if not len(stack):
 				# rely on rate generator.
-				self.stack.append([0, rate_generator()])
+				stack.append(0, rate_generator())
 
 			# start at the end.
 			index = -1
 
-			stock_bin = self.stack[index]
-			if qty >= stock_bin[QTY]:
+			bin_qty, bin_rate = stack.get_qty(index), stack.get_rate(index)
+			if qty >= bin_qty:
 				# consume current bin
-				qty = round_off_if_near_zero(qty - stock_bin[QTY])
-				to_consume = self.stack.pop(index)
-				consumed_bins.append(list(to_consume))
+				qty = round_off_if_near_zero(qty - bin_qty)
+				consumed_bins.append(stack.pop(index))
 
-				if not self.stack and qty:
+				if not len(stack) and qty:
 					# stock finished, qty still remains to be withdrawn
 					# negative stock, keep in as a negative bin
-					self.stack.append([-qty, outgoing_rate or stock_bin[RATE]])
-					consumed_bins.append([qty, outgoing_rate or stock_bin[RATE]])
+					stack.append(-qty, outgoing_rate or bin_rate)
+					consumed_bins.append([qty, outgoing_rate or bin_rate])
 					break
 			else:
 				# qty found in current bin consume it and exit
-				stock_bin[QTY] = round_off_if_near_zero(stock_bin[QTY] - qty)
-				consumed_bins.append([qty, stock_bin[RATE]])
+				stack.set_qty(index, round_off_if_near_zero(bin_qty - qty))
+				consumed_bins.append([qty, bin_rate])
 				qty = 0
 
 		return consumed_bins
 
 
+def encode_bin(qty: float, rate: float) -> str:
+	return json.dumps([qty, rate], separators=(",", ":"))
+
+
+def serialize_stock_queue(stock_queue) -> str:
+	"""Serialize a valuation queue or a plain list of bins for `stock_queue`."""
+	if isinstance(stock_queue, BinWiseValuation):
+		return stock_queue.serialize()
+
+	return json.dumps(stock_queue, separators=(",", ":"))
+
+
 def round_off_if_near_zero(number: float, precision: int = 7) -> float:
 	"""Rounds off the number to zero only if number is close to zero for decimal
 	specified in precision. Precision defaults to 7.
@@ -7,6 +7,7 @@ import frappe
 from frappe.utils import cint, cstr
 from redisearch import AutoCompleter, Client, Query
 
+from erpnext.e_commerce.local_search import is_local_search_enabled, search_website_items
 from erpnext.e_commerce.redisearch_utils import (
 	WEBSITE_ITEM_CATEGORY_AUTOCOMPLETE,
 	WEBSITE_ITEM_INDEX,
@@ -81,7 +82,10 @@ def product_search(query, limit=10, fuzzy_search=True):
 	if not is_redisearch_enabled():
 		# Redisearch module not enabled
 		search_results["from_redisearch"] = False
-		search_results["results"] = get_product_data(query, 0, limit)
+		if is_local_search_enabled():
+			search_results["results"] = search_website_items(query, limit)
+		else:
+			search_results["results"] = get_product_data(query, 0, limit)
 		return search_results
 
 	if not query:
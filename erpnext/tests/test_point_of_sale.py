@@ -1,12 +1,15 @@
 # Copyright (c) 2022, Frappe Technologies Pvt. Ltd. and Contributors
 # MIT License. See license.txt
 
+import json
+import time
 import unittest
 
 import frappe
+from frappe.utils import now
 
 from erpnext.accounts.doctype.pos_profile.test_pos_profile import make_pos_profile
-from erpnext.selling.page.point_of_sale.point_of_sale import get_items
+from erpnext.selling.page.point_of_sale.point_of_sale import get_catalogue, get_items
 from erpnext.stock.doctype.item.test_item import make_item
 from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
 
@@ -61,3 +64,124 @@ class TestPointOfSale(unittest.TestCase):
 
 		self.assertEqual(len(filtered_items), 1)
 		self.assertEqual(filtered_items[0]["item_code"], item2.item_code)
+
+	def test_catalogue_sync(self):
+		pos_profile = make_pos_profile(name="Test POS Profile for Catalogue")
+		item = make_item("Test Catalogue Stock Item", {"is_stock_item": 1})
+		make_stock_entry(
+			item_code=item.name,
+			qty=10,
+			to_warehouse="_Test Warehouse - _TC",
+			rate=500,
+		)
+		frappe.get_doc(
+			{
+				"doctype": "Item Price",
+				"item_code": item.name,
+				"price_list": pos_profile.selling_price_list,
+				"price_list_rate": 750,
+			}
+		).insert()
+
+		def get_row(catalogue):
+			return next((d for d in catalogue["items"] if d.item_code == item.name), None)
+
+		catalogue = get_catalogue(pos_profile.name)
+		row = get_row(catalogue)
+		self.assertEqual(row.actual_qty, 10)
+		self.assertEqual([d[1] for d in row.prices], [750])
+		self.assertFalse(catalogue["removed"])
+
+		make_stock_entry(item_code=item.name, qty=4, from_warehouse="_Test Warehouse - _TC")
+		delta = get_catalogue(pos_profile.name, since=catalogue["version"])
+		self.assertEqual(get_row(delta).actual_qty, 6)
+
+		item.disabled = 1
+		item.save()
+		delta = get_catalogue(pos_profile.name, since=delta["version"])
+		self.assertFalse(get_row(delta))
+		self.assertIn(item.name, delta["removed"])
+
+
+def run_catalogue_benchmark(items=100_000, changes=1_000):
+	"""
+	Time the POS catalogue snapshot and a delta after `changes` price updates, with their size.
+
+	Usage: bench --site test_site execute erpnext.tests.test_point_of_sale.run_catalogue_benchmark
+	"""
+	pos_profile = make_pos_profile(name="Test POS Profile for Catalogue Benchmark")
+	item_group = frappe.db.get_value("Item Group", {"is_group": 0}, "name")
+	timestamp = now()
+	audit = (timestamp, timestamp, "Administrator", "Administrator")
+	item_codes = [f"_Test POS Catalogue Item {idx:06d}" for idx in range(items)]
+
+	frappe.db.bulk_insert(
+		"Item",
+		[
+			"name",
+			"item_code",
+			"item_name",
+			"item_group",
+			"stock_uom",
+			"is_stock_item",
+			"is_sales_item",
+			"creation",
+			"modified",
+			"owner",
+			"modified_by",
+		],
+		[(item_code, item_code, item_code, item_group, "Nos", 1, 1) + audit for item_code in item_codes],
+	)
+	frappe.db.bulk_insert(
+		"Item Price",
+		["name", "item_code", "price_list", "uom", "price_list_rate", "currency"]
+		+ ["creation", "modified", "owner", "modified_by"],
+		[
+			(frappe.generate_hash(length=10), item_code, pos_profile.selling_price_list, "Nos", 100, "INR")
+			+ audit
+			for item_code in item_codes
+		],
+	)
+	frappe.db.bulk_insert(
+		"Bin",
+		["name", "item_code", "warehouse", "actual_qty", "creation", "modified", "owner", "modified_by"],
+		[
+			(frappe.generate_hash(length=10), item_code, pos_profile.warehouse, 10) + audit
+			for item_code in item_codes
+		],
+	)
+
+	try:
+		start = time.perf_counter()
+		catalogue = get_catalogue(pos_profile.name)
+		snapshot_time = time.perf_counter() - start
+		snapshot_size = len(json.dumps(catalogue, default=str))
+
+		# versions older than the sync overlap, as on a terminal which synced a while ago
+		frappe.db.sql(
+			"""update `tabItem Price` set modified = modified - interval 1 day
+			where item_code like '_Test POS Catalogue Item %%'"""
+		)
+		frappe.db.sql(
+			"""update `tabBin` set modified = modified - interval 1 day
+			where item_code like '_Test POS Catalogue Item %%'"""
+		)
+		frappe.db.sql(
+			"""update `tabItem` set modified = modified - interval 1 day
+			where name like '_Test POS Catalogue Item %%'"""
+		)
+		frappe.db.sql(
+			"""update `tabItem Price` set price_list_rate = 110, modified = %s
+			where item_code in %s""",
+			(now(), tuple(item_codes[:changes])),
+		)
+
+		start = time.perf_counter()
+		delta = get_catalogue(pos_profile.name, since=catalogue["version"])
+		delta_time = time.perf_counter() - start
+		delta_size = len(json.dumps(delta, default=str))
+	finally:
+		frappe.db.rollback()
+
+	print(f"snapshot: {snapshot_time:.2f}s, {snapshot_size / 1024:.0f} KiB for {items} items")
+	print(f"delta: {delta_time:.2f}s, {delta_size / 1024:.0f} KiB for {changes} changed prices")
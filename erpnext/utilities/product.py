@@ -78,104 +78,133 @@ def qty_from_all_warehouses(batch_info):
 
 
 def get_price(item_code, price_list, customer_group, company, qty=1):
+	return get_prices([item_code], price_list, customer_group, company, qty=qty).get(item_code)
+
+
+def get_prices(item_codes, price_list, customer_group, company, qty=1):
+	"""
+	Website prices of multiple items as {item_code: price}, with pricing rules applied.
+	Items without an Item Price (of their own or of their template) are left out.
+	"""
 	from erpnext.e_commerce.shopping_cart.cart import get_party
 
-	template_item_code = frappe.db.get_value("Item", item_code, "variant_of")
+	if not (price_list and item_codes):
+		return {}
 
-	if price_list:
-		price = frappe.get_all(
-			"Item Price",
-			fields=["price_list_rate", "currency"],
-			filters={"price_list": price_list, "item_code": item_code},
+	item_codes = list(set(item_codes))
+	templates = dict(
+		frappe.get_all(
+			"Item",
+			filters={"name": ("in", item_codes), "variant_of": ("is", "set")},
+			fields=["name", "variant_of"],
+			as_list=True,
 		)
+	)
 
-		if template_item_code and not price:
-			price = frappe.get_all(
-				"Item Price",
-				fields=["price_list_rate", "currency"],
-				filters={"price_list": price_list, "item_code": template_item_code},
-			)
-
+	item_prices = {}
+	for row in frappe.get_all(
+		"Item Price",
+		fields=["item_code", "price_list_rate", "currency"],
+		filters={"price_list": price_list, "item_code": ("in", item_codes + list(templates.values()))},
+	):
+		item_prices.setdefault(row.pop("item_code"), row)
+
+	prices = {}
+	for item_code in item_codes:
+		price = item_prices.get(item_code) or item_prices.get(templates.get(item_code))
 		if price:
-			party = get_party()
-			pricing_rule_dict = frappe._dict(
-				{
-					"item_code": item_code,
-					"qty": qty,
-					"stock_qty": qty,
-					"transaction_type": "selling",
-					"price_list": price_list,
-					"customer_group": customer_group,
-					"company": company,
-					"conversion_rate": 1,
-					"for_shopping_cart": True,
-					"currency": frappe.db.get_value("Price List", price_list, "currency"),
-					"doctype": "Quotation",
-				}
-			)
+			# template prices are shared by variants
+			prices[item_code] = frappe._dict(price)
+
+	if not prices:
+		return {}
+
+	party = get_party()
+	price_list_currency = frappe.db.get_value("Price List", price_list, "currency")
+	hide_currency_symbol = cint(frappe.db.get_default("hide_currency_symbol"))
+	uom_conversion_factors = get_sales_uom_conversion_factors(list(prices))
+
+	for item_code, price_obj in prices.items():
+		pricing_rule_dict = frappe._dict(
+			{
+				"item_code": item_code,
+				"qty": qty,
+				"stock_qty": qty,
+				"transaction_type": "selling",
+				"price_list": price_list,
+				"customer_group": customer_group,
+				"company": company,
+				"conversion_rate": 1,
+				"for_shopping_cart": True,
+				"currency": price_list_currency,
+				"doctype": "Quotation",
+			}
+		)
 
-			if party and party.doctype == "Customer":
-				pricing_rule_dict.update({"customer": party.name})
+		if party and party.doctype == "Customer":
+			pricing_rule_dict.update({"customer": party.name})
 
-			pricing_rule = get_pricing_rule_for_item(pricing_rule_dict)
-			price_obj = price[0]
+		pricing_rule = get_pricing_rule_for_item(pricing_rule_dict)
 
-			if pricing_rule:
-				# price without any rules applied
-				mrp = price_obj.price_list_rate or 0
+		# price without any rules applied
+		mrp = price_obj.price_list_rate or 0
 
-				if pricing_rule.pricing_rule_for == "Discount Percentage":
-					price_obj.discount_percent = pricing_rule.discount_percentage
-					price_obj.formatted_discount_percent = str(flt(pricing_rule.discount_percentage, 0)) + "%"
-					price_obj.price_list_rate = flt(
-						price_obj.price_list_rate * (1.0 - (flt(pricing_rule.discount_percentage) / 100.0))
-					)
+		if pricing_rule:
+			if pricing_rule.pricing_rule_for == "Discount Percentage":
+				price_obj.discount_percent = pricing_rule.discount_percentage
+				price_obj.formatted_discount_percent = str(flt(pricing_rule.discount_percentage, 0)) + "%"
+				price_obj.price_list_rate = flt(
+					price_obj.price_list_rate * (1.0 - (flt(pricing_rule.discount_percentage) / 100.0))
+				)
 
-				if pricing_rule.pricing_rule_for == "Rate":
-					rate_discount = flt(mrp) - flt(pricing_rule.price_list_rate)
-					if rate_discount > 0:
-						price_obj.formatted_discount_rate = fmt_money(rate_discount, currency=price_obj["currency"])
-					price_obj.price_list_rate = pricing_rule.price_list_rate or 0
+			if pricing_rule.pricing_rule_for == "Rate":
+				rate_discount = flt(mrp) - flt(pricing_rule.price_list_rate)
+				if rate_discount > 0:
+					price_obj.formatted_discount_rate = fmt_money(rate_discount, currency=price_obj["currency"])
+				price_obj.price_list_rate = pricing_rule.price_list_rate or 0
 
-			if price_obj:
-				price_obj["formatted_price"] = fmt_money(
-					price_obj["price_list_rate"], currency=price_obj["currency"]
-				)
-				if mrp != price_obj["price_list_rate"]:
-					price_obj["formatted_mrp"] = fmt_money(mrp, currency=price_obj["currency"])
-
-				price_obj["currency_symbol"] = (
-					not cint(frappe.db.get_default("hide_currency_symbol"))
-					and (
-						frappe.db.get_value("Currency", price_obj.currency, "symbol", cache=True)
-						or price_obj.currency
-					)
-					or ""
-				)
+		price_obj["formatted_price"] = fmt_money(
+			price_obj["price_list_rate"], currency=price_obj["currency"]
+		)
+		if mrp != price_obj["price_list_rate"]:
+			price_obj["formatted_mrp"] = fmt_money(mrp, currency=price_obj["currency"])
+
+		price_obj["currency_symbol"] = (
+			not hide_currency_symbol
+			and (
+				frappe.db.get_value("Currency", price_obj.currency, "symbol", cache=True)
+				or price_obj.currency
+			)
+			or ""
+		)
 
-				uom_conversion_factor = frappe.db.sql(
-					"""select	C.conversion_factor
-					from `tabUOM Conversion Detail` C
-					inner join `tabItem` I on C.parent = I.name and C.uom = I.sales_uom
-					where I.name = %s""",
-					item_code,
-				)
+		price_obj["formatted_price_sales_uom"] = fmt_money(
+			price_obj["price_list_rate"] * (uom_conversion_factors.get(item_code) or 1),
+			currency=price_obj["currency"],
+		)
 
-				uom_conversion_factor = uom_conversion_factor[0][0] if uom_conversion_factor else 1
-				price_obj["formatted_price_sales_uom"] = fmt_money(
-					price_obj["price_list_rate"] * uom_conversion_factor, currency=price_obj["currency"]
-				)
+		if not price_obj["price_list_rate"]:
+			price_obj["price_list_rate"] = 0
+
+		if not price_obj["currency"]:
+			price_obj["currency"] = ""
 
-				if not price_obj["price_list_rate"]:
-					price_obj["price_list_rate"] = 0
+		if not price_obj["formatted_price"]:
+			price_obj["formatted_price"], price_obj["formatted_mrp"] = "", ""
 
-				if not price_obj["currency"]:
-					price_obj["currency"] = ""
+	return prices
 
-				if not price_obj["formatted_price"]:
-					price_obj["formatted_price"], price_obj["formatted_mrp"] = "", ""
 
-			return price_obj
+def get_sales_uom_conversion_factors(item_codes):
+	return dict(
+		frappe.db.sql(
+			"""select I.name, C.conversion_factor
+			from `tabUOM Conversion Detail` C
+			inner join `tabItem` I on C.parent = I.name and C.uom = I.sales_uom
+			where I.name in %s""",
+			[tuple(item_codes)],
+		)
+	)
 
 
 def get_non_stock_item_status(item_code, item_warehouse_field):